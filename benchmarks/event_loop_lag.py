@@ -0,0 +1,139 @@
+"""Benchmark event-loop lag while research cycles hit the database.
+
+Runs N concurrent research cycles (no model client, so the work is the
+agents' memory graph I/O) while a probe task measures how late the event
+loop wakes it up. Each graph mode is run in turn:
+
+- inline:  graph calls made directly on the event loop (the old behaviour)
+- threads: AsyncMemoryGraph over a Database, calls on worker threads
+- asyncio: AsyncMemoryGraph over an AsyncDatabase (needs tinman[async]
+           and a database the asyncio driver can reach)
+
+--statement-latency-ms adds a sleep to every statement on the synchronous
+engine to stand in for network round trips to a remote database; it does
+not apply to the asyncio mode, so compare that mode against a real server.
+
+Usage:
+    python benchmarks/event_loop_lag.py --cycles 1 8 32
+    python benchmarks/event_loop_lag.py --database-url postgresql://localhost/tinman_bench \\
+        --statement-latency-ms 0 --modes inline threads asyncio
+"""
+
+import argparse
+import asyncio
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import event
+
+from tinman.config.modes import OperatingMode
+from tinman.core.approval_handler import ApprovalMode
+from tinman.db.connection import ASYNC_AVAILABLE, AsyncDatabase
+from tinman.memory.async_graph import AsyncMemoryGraph
+from tinman.memory.graph import MemoryGraph
+from tinman.tinman import Tinman
+
+PROBE_INTERVAL_S = 0.005
+AGENTS = (
+    "hypothesis_engine",
+    "experiment_architect",
+    "experiment_executor",
+    "failure_discovery",
+    "intervention_engine",
+    "simulation_engine",
+)
+
+
+async def probe(lags: list[float], stop: asyncio.Event) -> None:
+    """Record how late each short sleep wakes up."""
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(PROBE_INTERVAL_S)
+        lags.append((time.perf_counter() - started - PROBE_INTERVAL_S) * 1000)
+
+
+def use_graph(tinman: Tinman, graph: AsyncMemoryGraph) -> None:
+    for name in AGENTS:
+        getattr(tinman, name).graph = graph
+
+
+async def build_graph(tinman: Tinman, mode: str, url: str):
+    """Returns (graph, async database to dispose or None)."""
+    if mode == "inline":
+        return AsyncMemoryGraph(graph=MemoryGraph(session_factory=tinman.db.SessionLocal)), None
+    if mode == "threads":
+        return AsyncMemoryGraph(database=tinman.db), None
+    async_db = AsyncDatabase(url)
+    return AsyncMemoryGraph(database=async_db), async_db
+
+
+async def run(url: str, mode: str, cycles: int, latency_ms: float) -> dict[str, float]:
+    tinman = Tinman(mode=OperatingMode.LAB, approval_mode=ApprovalMode.AUTO_APPROVE)
+    await tinman.initialize(db_url=url)
+    if latency_ms:
+        event.listen(
+            tinman.db.engine,
+            "before_cursor_execute",
+            lambda *args: time.sleep(latency_ms / 1000),
+        )
+    graph, async_db = await build_graph(tinman, mode, url)
+    use_graph(tinman, graph)
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    monitor = asyncio.create_task(probe(lags, stop))
+    started = time.perf_counter()
+    await asyncio.gather(*(
+        tinman.research_cycle(max_hypotheses=5, max_experiments=5)
+        for _ in range(cycles)
+    ))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await monitor
+
+    if async_db:
+        await async_db.disconnect()
+    await tinman.close()
+
+    lags.sort()
+    return {
+        "wall_s": elapsed,
+        "lag_p50_ms": statistics.median(lags) if lags else 0.0,
+        "lag_p99_ms": lags[min(len(lags) - 1, int(len(lags) * 0.99))] if lags else 0.0,
+        "lag_max_ms": lags[-1] if lags else 0.0,
+    }
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", help="Defaults to a scratch SQLite file")
+    parser.add_argument("--cycles", type=int, nargs="+", default=[1, 8, 32])
+    parser.add_argument("--modes", nargs="+", default=["inline", "threads", "asyncio"],
+                        choices=["inline", "threads", "asyncio"])
+    parser.add_argument("--statement-latency-ms", type=float, default=2.0)
+    args = parser.parse_args()
+
+    modes = args.modes
+    if "asyncio" in modes and not ASYNC_AVAILABLE:
+        print("Skipping asyncio mode: install tinman[async]")
+        modes = [m for m in modes if m != "asyncio"]
+
+    with tempfile.TemporaryDirectory() as scratch:
+        url = args.database_url or f"sqlite:///{Path(scratch) / 'bench.db'}"
+        for cycles in args.cycles:
+            print(f"{cycles} concurrent cycles:")
+            for mode in modes:
+                latency = 0.0 if mode == "asyncio" else args.statement_latency_ms
+                result = await run(url, mode, cycles, latency)
+                print(
+                    f"  {mode:8} wall {result['wall_s']:.2f} s  "
+                    f"lag p50 {result['lag_p50_ms']:.1f} ms  "
+                    f"p99 {result['lag_p99_ms']:.1f} ms  "
+                    f"max {result['lag_max_ms']:.1f} ms"
+                )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,142 @@
+"""Benchmark MemoryGraph search latency against PostgreSQL.
+
+Loads synthetic failure and intervention nodes into the nodes table and
+times the containment search path (data @> ..., served by the GIN
+jsonb_path_ops index) against the per-key ->> comparison it replaced,
+at each requested graph size. EXPLAIN output shows which index the
+planner chose.
+
+Requires a scratch PostgreSQL database with migrations applied; the
+nodes and edges tables are truncated between sizes.
+
+Usage:
+    alembic upgrade head
+    python benchmarks/graph_search.py --database-url postgresql://localhost/tinman_bench
+    python benchmarks/graph_search.py --database-url ... --sizes 100000 1000000 --queries 200
+"""
+
+import argparse
+import json
+import random
+import statistics
+import time
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from tinman.db.models import NodeModel
+from tinman.memory.graph import MemoryGraph
+from tinman.memory.models import NodeType, create_failure_node, create_intervention_node
+
+SEVERITIES = ["S0", "S1", "S2", "S3", "S4"]
+CLASSES = ["reasoning", "long_context", "tool_use", "feedback_loop", "deployment"]
+RISK_TIERS = ["safe", "review", "block"]
+CHUNK = 10_000
+
+
+def load(session, size: int) -> None:
+    """Insert `size` nodes (90% failures, 10% interventions) in bulk chunks."""
+    session.execute(text("TRUNCATE edges, nodes CASCADE"))
+    graph = MemoryGraph(session)
+    rng = random.Random(size)
+
+    for start in range(0, size, CHUNK):
+        nodes = []
+        for _ in range(min(CHUNK, size - start)):
+            if rng.random() < 0.9:
+                nodes.append(create_failure_node(
+                    primary_class=rng.choice(CLASSES),
+                    secondary_class=f"sub_{rng.randrange(50)}",
+                    severity=rng.choice(SEVERITIES),
+                    trigger_signature=[f"trigger_{rng.randrange(1000)}"],
+                    reproducibility=rng.random(),
+                    is_resolved=rng.random() < 0.7,
+                ))
+            else:
+                nodes.append(create_intervention_node(
+                    intervention_type="prompt_patch",
+                    payload={},
+                    expected_gains={},
+                    expected_regressions={},
+                    risk_tier=rng.choice(RISK_TIERS),
+                ))
+        graph.add_many(nodes)
+        session.commit()
+
+    session.execute(text("ANALYZE nodes"))
+    session.commit()
+
+
+def legacy_search(session, data_filter: dict, node_type: NodeType, limit: int = 100):
+    """The pre-index search path: one ->> comparison per key."""
+    query = session.query(NodeModel).filter(NodeModel.node_type == node_type.value)
+    for key, value in data_filter.items():
+        if isinstance(value, str):
+            query = query.filter(NodeModel.data[key].astext == value)
+        else:
+            query = query.filter(NodeModel.data[key] == value)
+    return query.order_by(NodeModel.created_at.desc()).limit(limit).all()
+
+
+def time_queries(fn, filters: list[dict]) -> dict[str, float]:
+    timings = []
+    for data_filter in filters:
+        started = time.perf_counter()
+        fn(data_filter)
+        timings.append((time.perf_counter() - started) * 1000)
+    timings.sort()
+    return {
+        "p50_ms": statistics.median(timings),
+        "p95_ms": timings[int(len(timings) * 0.95) - 1],
+    }
+
+
+def explain(session, data_filter: dict) -> str:
+    plan = session.execute(
+        text(
+            "EXPLAIN SELECT id FROM nodes "
+            "WHERE node_type = 'failure_mode' AND data @> CAST(:f AS jsonb)"
+        ),
+        {"f": json.dumps(data_filter)},
+    ).scalars().all()
+    return "\n    ".join(plan)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--database-url", required=True)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--queries", type=int, default=100)
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    if engine.dialect.name != "postgresql":
+        parser.error("this benchmark needs PostgreSQL")
+    session = sessionmaker(bind=engine)()
+    graph = MemoryGraph(session)
+
+    rng = random.Random(0)
+    filters = [
+        {"severity": rng.choice(SEVERITIES), "primary_class": rng.choice(CLASSES)}
+        for _ in range(args.queries)
+    ]
+
+    for size in args.sizes:
+        print(f"Loading {size:,} nodes...")
+        load(session, size)
+
+        contained = time_queries(
+            lambda f: graph.search(f, NodeType.FAILURE_MODE), filters
+        )
+        legacy = time_queries(
+            lambda f: legacy_search(session, f, NodeType.FAILURE_MODE), filters
+        )
+        for label, timing in (("containment @>", contained), ("per-key ->>", legacy)):
+            print(f"  {label:15} p50 {timing['p50_ms']:.2f} ms  p95 {timing['p95_ms']:.2f} ms")
+        print(f"  plan:\n    {explain(session, filters[0])}")
+
+    session.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""JSONB indexes on node data
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '0002'
+down_revision: Union[str, None] = '0001'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Hot data keys filtered and grouped on by node type: (index name, key)
+EXPRESSION_INDEXES = [
+    ('idx_nodes_severity', 'severity'),
+    ('idx_nodes_primary_class', 'primary_class'),
+    ('idx_nodes_is_resolved', 'is_resolved'),
+    ('idx_nodes_risk_tier', 'risk_tier'),
+]
+
+
+def upgrade() -> None:
+    # Serves containment (data @> '{...}') searches
+    op.create_index(
+        'idx_nodes_data_gin',
+        'nodes',
+        ['data'],
+        postgresql_using='gin',
+        postgresql_ops={'data': 'jsonb_path_ops'},
+    )
+
+    # Serves equality and GROUP BY on data->>'key' within a node type
+    for name, key in EXPRESSION_INDEXES:
+        op.create_index(name, 'nodes', ['node_type', sa.text(f"(data->>'{key}')")])
+
+
+def downgrade() -> None:
+    for name, _ in reversed(EXPRESSION_INDEXES):
+        op.drop_index(name, table_name='nodes')
+    op.drop_index('idx_nodes_data_gin', table_name='nodes')
@@ -1,9 +1,15 @@
 """Tests for Tinman agents."""
 
+import asyncio
+
 import pytest
 from tinman.agents.hypothesis_engine import HypothesisEngine
-from tinman.agents.experiment_architect import ExperimentArchitect
+from tinman.agents.experiment_architect import ExperimentArchitect, ExperimentDesign
+from tinman.agents.experiment_executor import ExperimentExecutor
 from tinman.agents.base import AgentState
+from tinman.core.cost_tracker import CostTracker
+from tinman.core.sequential import BetaBinomialStopping
+from tinman.integrations.model_client import ModelClient, ModelResponse
 
 
 @pytest.mark.asyncio
@@ -90,3 +96,176 @@ async def test_agent_lifecycle(lab_context):
 
     assert engine.state == AgentState.COMPLETED
     assert result.duration_ms >= 0
+
+
+class _SlowModelClient(ModelClient):
+    """Model client that sleeps per call and tracks peak concurrency."""
+
+    def __init__(self, content: str = "A perfectly reasonable answer to the probe.", delay: float = 0.02):
+        super().__init__()
+        self.content = content
+        self.delay = delay
+        self.in_flight = 0
+        self.peak = 0
+        self.calls = 0
+
+    @property
+    def provider(self) -> str:
+        return "slow"
+
+    async def complete(self, messages, model=None, temperature=0.7, max_tokens=4096, tools=None, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.in_flight -= 1
+        return ModelResponse(content=self.content, total_tokens=10)
+
+    async def stream(self, messages, model=None, temperature=0.7, max_tokens=4096, **kwargs):
+        yield self.content
+
+
+def _design(runs: int) -> ExperimentDesign:
+    return ExperimentDesign(name="probe", stress_type="generic", estimated_runs=runs)
+
+
+@pytest.mark.asyncio
+async def test_executor_runs_concurrently_within_limits(lab_context):
+    """Test that runs fan out but respect per-experiment and global limits."""
+    client = _SlowModelClient()
+    executor = ExperimentExecutor(
+        model_client=client, max_parallel=4, max_parallel_per_experiment=3,
+    )
+
+    result = await executor.run(lab_context, experiments=[_design(9), _design(9)])
+
+    assert result.success
+    assert result.data["total_runs"] == 18
+    assert client.peak <= 4
+    assert client.peak > 1
+
+
+@pytest.mark.asyncio
+async def test_executor_preserves_run_order(lab_context):
+    """Test that run numbers stay deterministic under concurrency."""
+    executor = ExperimentExecutor(model_client=_SlowModelClient(), max_parallel=5)
+
+    result = await executor._run_experiment(lab_context, _design(8))
+
+    assert [r.run_number for r in result.runs] == list(range(1, 9))
+
+
+@pytest.mark.asyncio
+async def test_executor_early_termination_cancels_in_flight(lab_context):
+    """Test that the 3-failures-in-5-runs rule still stops the experiment."""
+    client = _SlowModelClient(content="error")
+    executor = ExperimentExecutor(model_client=client, max_parallel=2)
+
+    result = await executor._run_experiment(lab_context, _design(20))
+
+    assert result.total_runs == 5
+    assert [r.run_number for r in result.runs] == [1, 2, 3, 4, 5]
+    assert client.calls < 20
+
+
+@pytest.mark.asyncio
+async def test_executor_reserves_budget_per_run(lab_context):
+    """Test that concurrent runs stop once their reservations fill the budget."""
+    client = _SlowModelClient()
+    tracker = CostTracker(budget_usd=0.13)
+    executor = ExperimentExecutor(model_client=client, max_parallel=5, cost_tracker=tracker)
+
+    # Each probe reserves ~$0.06 (2048 output tokens at the fallback price)
+    result = await executor._run_experiment(lab_context, _design(10))
+
+    assert result.total_runs == 2
+    assert client.calls == 2
+    assert 0 < tracker.current_period_cost < 0.01
+    assert tracker.reserved_budget == 0.0
+    assert [r.source for r in tracker.get_records()] == ["experiment_executor"] * 2
+
+
+@pytest.mark.asyncio
+async def test_executor_sequential_stopping_decides_early(lab_context):
+    """Test that sequential stopping ends clear experiments after a few runs."""
+    stopping = BetaBinomialStopping(threshold=0.3, confidence=0.95, min_runs=3, max_runs=50)
+
+    failing = _SlowModelClient(content="error")
+    executor = ExperimentExecutor(model_client=failing, max_parallel=1, stopping=stopping)
+    validated = await executor._run_experiment(lab_context, _design(5))
+
+    assert validated.total_runs == 3
+    assert validated.hypothesis_validated
+    assert validated.confidence >= 0.95
+    low, high = validated.credible_interval
+    assert 0.3 < low < high <= 1.0
+
+    clean = _SlowModelClient()
+    executor = ExperimentExecutor(model_client=clean, max_parallel=1, stopping=stopping)
+    rejected = await executor._run_experiment(lab_context, _design(5))
+
+    # Runs up to the stopping rule's cap, not the designed 5, until decided
+    assert rejected.total_runs == 8
+    assert not rejected.hypothesis_validated
+    assert rejected.confidence >= 0.95
+    assert rejected.credible_interval[1] < 0.35
+
+
+class _UnavailableModelClient(_SlowModelClient):
+    """Fails every call with a transient (503) error."""
+
+    async def complete(self, messages, model=None, temperature=0.7, max_tokens=4096, tools=None, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        error = RuntimeError("HTTP 503")
+        error.status_code = 503
+        raise error
+
+
+@pytest.mark.asyncio
+async def test_executor_stops_when_provider_is_unavailable(lab_context):
+    """Test that transient errors cannot use up the sequential run cap."""
+    client = _UnavailableModelClient()
+    executor = ExperimentExecutor(
+        model_client=client, max_parallel=1, stopping=BetaBinomialStopping(max_runs=50),
+    )
+
+    result = await executor._run_experiment(lab_context, _design(5))
+
+    assert result.total_runs == ExperimentExecutor.MAX_CONSECUTIVE_TRANSIENT_RUNS
+    assert client.calls < 10  # Not the 50-run cap
+    assert result.reproduction_rate == 0.0
+
+
+@pytest.mark.asyncio
+async def test_executor_fixed_mode_uses_validation_threshold(lab_context):
+    """Test that the configured threshold also applies without sequential stopping."""
+    executor = ExperimentExecutor(
+        model_client=_SlowModelClient(content="error"), max_parallel=1, validation_threshold=1.1,
+    )
+
+    result = await executor._run_experiment(lab_context, _design(5))
+
+    assert result.reproduction_rate == 1.0
+    assert not result.hypothesis_validated
+
+
+class _LocalModelClient(_SlowModelClient):
+    @property
+    def provider(self) -> str:
+        return "ollama"
+
+
+@pytest.mark.asyncio
+async def test_executor_local_models_cost_nothing(lab_context):
+    """Test that probes against a local server reserve and record no spend."""
+    client = _LocalModelClient()
+    tracker = CostTracker(budget_usd=0.01)
+    executor = ExperimentExecutor(model_client=client, max_parallel=5, cost_tracker=tracker)
+
+    result = await executor._run_experiment(lab_context, _design(10))
+
+    assert result.total_runs == 10
+    assert tracker.current_period_cost == 0.0
@@ -10,7 +10,9 @@ from tinman.db.audit import (
     ModeTransition,
     ToolExecution,
     AuditLogger,
+    AsyncAuditLogger,
 )
+from tinman.db.connection import Database
 
 
 class TestAuditEventTypes:
@@ -376,3 +378,24 @@ class TestToolExecutionAudit:
         # Query failed
         failed = logger.get_tool_executions(success=False)
         assert len(failed) == 1
+
+
+class TestAsyncAuditLogger:
+    """Test the awaitable audit logger."""
+
+    @pytest.mark.asyncio
+    async def test_events_are_committed_per_call(self, tmp_path):
+        """Each call should commit on its own pooled session."""
+        db = Database(f"sqlite:///{tmp_path / 'audit.db'}")
+        db.create_tables()
+        logger = AsyncAuditLogger(db)
+        logger.set_context("session-789", "lab")
+
+        entry = await logger.log_event(AuditEventType.SYSTEM_START, event_data={"version": "1.0.0"})
+        events = await logger.get_recent_events()
+
+        assert [e.id for e in events] == [entry.id]
+        assert events[0].session_id == "session-789"
+        assert events[0].event_data["version"] == "1.0.0"
+        assert (await logger.get_audit_summary())["total_events"] == 1
+        db.disconnect()
@@ -0,0 +1,238 @@
+"""Tests for cost tracking and budget enforcement."""
+
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from tinman.core import cost_tracker as cost_tracker_module
+from tinman.core.cost_ledger import CostLedger
+from tinman.core.cost_tracker import BudgetExceededError, BudgetPeriod, CostTracker
+from tinman.core.pricing import (
+    FALLBACK_PRICE,
+    TOKEN_COUNT_TOLERANCE,
+    ModelPrice,
+    PriceTable,
+    count_message_tokens,
+    count_tokens,
+)
+
+
+class Clock:
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock(datetime(2024, 3, 4, 22, 30, tzinfo=timezone.utc))
+    monkeypatch.setattr(cost_tracker_module, "utc_now", clock)
+    return clock
+
+
+def test_period_total_rolls_over(clock):
+    warnings = []
+    tracker = CostTracker(budget_usd=1.0, period=BudgetPeriod.DAILY,
+                          on_warning=lambda current, limit: warnings.append(current))
+    tracker.record_cost(0.5, source="executor", model="gpt-4")
+    tracker.record_cost(0.4, source="judge", model="claude")
+
+    assert tracker.current_period_cost == pytest.approx(0.9)
+    assert not tracker.can_afford(0.2)
+    with pytest.raises(BudgetExceededError):
+        tracker.enforce_budget(estimated_cost=0.2)
+    assert warnings == [pytest.approx(0.9)]
+
+    clock.now += timedelta(hours=2)  # next day
+    assert tracker.current_period_cost == 0.0
+    assert tracker.can_afford(0.9)
+    tracker.record_cost(0.8, source="executor", model="gpt-4")
+    assert warnings[-1] == pytest.approx(0.8)
+    assert tracker.total_cost_ever == pytest.approx(1.7)
+
+
+def test_hourly_totals_and_summary(clock):
+    tracker = CostTracker(budget_usd=100.0)
+    tracker.record_cost(1.0, source="executor", model="gpt-4", operation="probe")
+    clock.now += timedelta(minutes=45)
+    tracker.record_cost(2.0, source="judge", model="claude", operation="judge")
+    tracker.record_cost(3.0, source="executor", model="claude", operation="probe")
+
+    hourly = tracker.get_cost_over_time("hour")
+    assert [(h["start"][11:16], h["amount_usd"], h["count"]) for h in hourly] == [
+        ("22:00", 1.0, 1), ("23:00", 5.0, 2),
+    ]
+    daily = tracker.get_cost_over_time("day")
+    assert [d["start"][:10] for d in daily] == ["2024-03-04"]
+    assert daily[0]["by_model"] == {"gpt-4": 1.0, "claude": 5.0}
+
+    summary = tracker.get_summary()
+    assert summary["record_count"] == 3
+    assert summary["by_source"] == {"executor": 4.0, "judge": 2.0}
+    assert tracker.cost_between(clock.now - timedelta(minutes=10)) == 5.0
+
+
+def test_records_are_bounded_and_newest_first(clock):
+    tracker = CostTracker(budget_usd=100.0, max_records=3)
+    for i in range(5):
+        clock.now += timedelta(seconds=1)
+        tracker.record_cost(0.01, source=f"s{i % 2}", model="gpt-4", metadata={"i": i})
+
+    assert [r.metadata["i"] for r in tracker.get_records()] == [4, 3, 2]
+    assert [r.metadata["i"] for r in tracker.get_records(source="s0")] == [4, 2]
+    assert [r.metadata["i"] for r in tracker.get_records(limit=1)] == [4]
+    assert [r.metadata["i"] for r in tracker.get_records(since=clock.now)] == [4]
+    # Totals still cover every record
+    assert tracker.get_summary()["record_count"] == 5
+    assert tracker.current_period_cost == pytest.approx(0.05)
+
+
+def test_session_period_resets(clock):
+    tracker = CostTracker(budget_usd=1.0, period=BudgetPeriod.SESSION)
+    tracker.record_cost(0.7, source="executor")
+    clock.now += timedelta(days=3)
+    assert tracker.current_period_cost == pytest.approx(0.7)
+
+    tracker.reset_period()
+    assert tracker.current_period_cost == 0.0
+    assert tracker.get_records() == []
+
+
+def test_ledger_survives_restart(clock, tmp_path):
+    path = tmp_path / "costs.db"
+    tracker = CostTracker(budget_usd=1.0, ledger=CostLedger(path, compact_threshold=0, keep_records=2))
+    for i in range(6):
+        clock.now += timedelta(minutes=5)
+        tracker.record_cost(0.1, source="executor", model="gpt-4", metadata={"i": i})
+    assert tracker.ledger.flush(timeout=1.0)
+    tracker.ledger.compact()
+    clock.now += timedelta(minutes=5)  # 23:05, same day
+    tracker.close()
+
+    ledger = CostLedger(path)
+    snapshot = ledger.load()
+    # Compaction left only the newest records raw
+    assert [r.metadata["i"] for r in snapshot.records] == [4, 5]
+    assert sum(b.count for b in snapshot.buckets) == 4
+
+    restarted = CostTracker(budget_usd=1.0, ledger=ledger)
+    assert restarted.current_period_cost == pytest.approx(0.6)
+    assert restarted.total_cost_ever == pytest.approx(0.6)
+    assert restarted.get_summary()["by_model"] == {"gpt-4": pytest.approx(0.6)}
+    assert [r.metadata["i"] for r in restarted.get_records()] == [5, 4]
+
+    restarted.record_cost(0.1, source="executor")
+    assert restarted.ledger.flush(timeout=1.0)
+    clock.now += timedelta(hours=1)  # next day
+    restarted.close()
+    next_day = CostTracker(budget_usd=1.0, ledger=CostLedger(path))
+    assert next_day.current_period_cost == 0.0
+    next_day.close()
+
+
+def test_ledger_group_commits(tmp_path):
+    ledger = CostLedger(tmp_path / "costs.db", batch_size=1000, flush_interval_ms=10000)
+    tracker = CostTracker(budget_usd=100.0, ledger=ledger)
+    for _ in range(10):
+        tracker.record_cost(0.01, source="executor")
+
+    reader = CostLedger(tmp_path / "costs.db")
+    # Nothing is written until a batch fills, the interval passes or flush()
+    assert reader.load().records == []
+    assert ledger.flush(timeout=1.0)
+    assert len(reader.load().records) == 10
+    tracker.close()
+    reader.close()
+
+
+# Token counts reported by the cl100k_base tokenizer
+CL100K_COUNTS = {
+    "Hello, world!": 4,
+    "hello world": 2,
+    "The quick brown fox jumps over the lazy dog.": 10,
+    "1234567": 3,
+}
+
+
+def test_token_counts_within_tolerance():
+    for text, expected in CL100K_COUNTS.items():
+        assert abs(count_tokens(text) - expected) <= max(1, expected * TOKEN_COUNT_TOLERANCE), text
+    assert count_tokens("") == 0
+    messages = [{"role": "system", "content": "Be brief."}, {"role": "user", "content": "hello world"}]
+    assert count_message_tokens(messages) == 3 + (3 + 3) + (3 + 2)
+
+
+def test_price_table_matches_longest_prefix():
+    prices = PriceTable({"gpt-4o": {"input_per_1m": 1.0, "output_per_1m": 2.0}})
+    assert prices.price_for("gpt-4o-mini-2024-07-18") == ModelPrice(0.15, 0.60)
+    assert prices.price_for("gpt-4o-2024-08-06") == ModelPrice(1.0, 2.0)
+    assert prices.price_for("GPT-4-0613") == ModelPrice(30.0, 60.0)
+    assert prices.price_for("some-new-model") == FALLBACK_PRICE
+    assert prices.cost("gpt-4o", 1_000_000, 500_000) == pytest.approx(2.0)
+
+    messages = [{"role": "user", "content": "hello world"}]
+    prompt = count_message_tokens(messages)
+    assert prices.max_cost("gpt-4o", messages, max_tokens=100) >= prices.cost("gpt-4o", prompt, 100)
+
+
+def test_local_provider_is_free():
+    prices = PriceTable()
+    messages = [{"role": "user", "content": "hello world"}]
+    for model in ("mistral", "qwen2.5", "deepseek-r1", "llama3.1"):
+        assert prices.price_for(model, provider="ollama") == ModelPrice(0.0, 0.0)
+        assert prices.max_cost(model, messages, max_tokens=2048, provider="ollama") == 0.0
+    assert prices.price_for("mistral", provider="openai") == FALLBACK_PRICE
+
+def test_reservations_hold_budget(clock):
+    tracker = CostTracker(budget_usd=1.0)
+    first = tracker.reserve(0.6, source="executor", operation="experiment_run")
+    assert tracker.reserved_budget == pytest.approx(0.6)
+    assert tracker.remaining_budget == pytest.approx(0.4)
+    assert not tracker.can_afford(0.5)
+    with pytest.raises(BudgetExceededError):
+        tracker.reserve(0.5, source="executor")
+
+    record = tracker.commit(first, 0.2, model="gpt-4o", input_tokens=100, output_tokens=10)
+    assert (record.source, record.operation) == ("executor", "experiment_run")
+    assert tracker.current_period_cost == pytest.approx(0.2)
+    assert tracker.reserved_budget == 0.0
+
+    second = tracker.reserve(0.8, source="simulation_engine")
+    tracker.release(second)
+    tracker.release(second)
+    tracker.commit(first, 0.0)  # Committing twice records, but frees nothing more
+    assert tracker.reserved_budget == 0.0
+    assert tracker.remaining_budget == pytest.approx(0.8)
+
+    soft = CostTracker(budget_usd=1.0)
+    soft.config.hard_limit = False
+    soft.reserve(5.0, source="executor")
+    assert soft.reserved_budget == 5.0
+
+
+def test_concurrent_reservations_do_not_overshoot(clock):
+    tracker = CostTracker(budget_usd=10.0)
+
+    def run(_: int) -> bool:
+        try:
+            reservation = tracker.reserve(1.0, source="executor")
+        except BudgetExceededError:
+            return False
+        try:
+            tracker.commit(reservation, 0.75)
+        finally:
+            tracker.release(reservation)
+        return True
+
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        started = sum(pool.map(run, range(100)))
+
+    # Runs were refused only while the budget was spent or held, and each
+    # spent less than it reserved, so the limit was never passed
+    assert 10 <= started <= 13
+    assert tracker.current_period_cost == pytest.approx(0.75 * started)
+    assert tracker.current_period_cost <= 10.0
+    assert tracker.reserved_budget == 0.0
@@ -0,0 +1,295 @@
+"""Tests for the in-process event bus."""
+
+import asyncio
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import pytest
+
+from tinman.config.settings import Settings
+from tinman.core.approval_handler import ApprovalMode
+from tinman.core.cost_ledger import CostLedger
+from tinman.core.event_bus import Event, EventBus, TopicTrie
+from tinman.core.event_transport import UnixSocketTransport, default_socket_dir, ensure_private_dir
+from tinman.tinman import Tinman
+
+
+def test_history_is_bounded_per_topic():
+    bus = EventBus(max_history=5, topic_history=2)
+    for i in range(4):
+        bus.publish("experiment.created", {"i": i})
+    for i in range(5):
+        bus.publish("failure.discovered", {"i": i})
+
+    assert [e.data["i"] for e in bus.get_history()] == [0, 1, 2, 3, 4]
+    assert [e.data["i"] for e in bus.get_history(limit=2)] == [3, 4]
+    assert [e.data["i"] for e in bus.get_history("failure.discovered")] == [3, 4]
+    # A quiet topic keeps its recent events after the global ring moves on
+    assert [e.data["i"] for e in bus.get_history("experiment.created")] == [2, 3]
+    assert bus.get_history("unknown.topic") == []
+
+    bus.clear_history()
+    assert bus.get_history() == []
+    assert bus.get_history("failure.discovered") == []
+
+
+def test_evicted_events_spill_to_disk(tmp_path):
+    spill = tmp_path / "events" / "spill.jsonl"
+    bus = EventBus(max_history=2, spill_path=str(spill))
+    published = [bus.publish("hypothesis.created", {"i": i}, correlation_id="c1") for i in range(5)]
+    bus.close()
+
+    spilled = [Event.from_dict(json.loads(line)) for line in spill.read_text().splitlines()]
+    assert spilled == published[:3]
+    assert bus.get_history() == published[3:]
+
+
+@pytest.mark.asyncio
+async def test_queued_publish_does_not_wait_for_slow_handlers():
+    bus = EventBus(dispatch="queued")
+    received = []
+
+    async def slow(event):
+        await asyncio.sleep(0.05)
+        received.append(event.data["i"])
+
+    bus.subscribe_async("experiment.created", slow)
+    bus.subscribe("experiment.created", lambda event: received.append(-event.data["i"]))
+
+    started = time.perf_counter()
+    bus.publish("experiment.created", {"i": 1})
+    await bus.publish_async("experiment.created", {"i": 2})
+    assert time.perf_counter() - started < 0.05
+
+    assert await bus.flush(timeout=1.0)
+    assert sorted(received) == [-2, -1, 1, 2]
+    assert [i for i in received if i > 0] == [1, 2]
+    bus.close()
+
+
+@pytest.mark.asyncio
+async def test_tinman_close_drains_handlers_before_teardown(tmp_path):
+    ledger_path = tmp_path / "costs.db"
+    settings = Settings.from_dict({
+        "events": {"dispatch": "queued"},
+        "cost": {"ledger_path": str(ledger_path)},
+    })
+    tinman = Tinman(settings=settings, approval_mode=ApprovalMode.AUTO_APPROVE)
+    await tinman.initialize(skip_db=True)
+
+    async def record(event):
+        await asyncio.sleep(0.02)
+        tinman.cost_tracker.record_cost(0.25, source="handler")
+
+    tinman.event_bus.subscribe_async("experiment.completed", record)
+    tinman.event_bus.publish("experiment.completed", {})
+    await tinman.close()
+
+    ledger = CostLedger(ledger_path)
+    assert ledger.load().total_usd == pytest.approx(0.25)
+    ledger.close()
+
+@pytest.mark.asyncio
+async def test_queued_overflow_policies():
+    release = asyncio.Event()
+    received = []
+
+    async def stuck(event):
+        await release.wait()
+        received.append(event.data["i"])
+
+    dropping = EventBus(dispatch="queued", queue_size=1, overflow="drop")
+    dropping.subscribe_async("failure.discovered", stuck)
+    for i in range(4):
+        await dropping.publish_async("failure.discovered", {"i": i})
+        await asyncio.sleep(0)
+    release.set()
+    await dropping.flush()
+    # One event in the handler, one queued, the rest dropped
+    assert received == [0, 1]
+
+    release.clear()
+    received.clear()
+    blocking = EventBus(dispatch="queued", queue_size=1, overflow="block")
+    blocking.subscribe_async("failure.discovered", stuck)
+    publisher = asyncio.gather(*(
+        blocking.publish_async("failure.discovered", {"i": i}) for i in range(4)
+    ))
+    await asyncio.sleep(0.01)
+    assert not publisher.done()
+    assert not await blocking.flush(timeout=0.05)
+    release.set()
+    await publisher
+    assert await blocking.flush(timeout=1.0)
+    assert received == [0, 1, 2, 3]
+    dropping.close()
+    blocking.close()
+
+
+def test_queued_without_loop_dispatches_inline():
+    bus = EventBus(dispatch="queued")
+    received = []
+    bus.subscribe("hypothesis.created", received.append)
+
+    event = bus.publish("hypothesis.created", {})
+    assert received == [event]
+
+
+def test_pattern_subscriptions():
+    bus = EventBus()
+    seen: dict[str, list[str]] = {"exact": [], "star": [], "hash": []}
+
+    def exact(e): seen["exact"].append(e.topic)
+    def star(e): seen["star"].append(e.topic)
+    def hash_(e): seen["hash"].append(e.topic)
+
+    bus.subscribe("experiment.created", exact)
+    bus.subscribe("experiment.*", star)
+    bus.subscribe("intervention.#", hash_)
+    for topic in ("experiment.created", "experiment.run.completed",
+                  "intervention", "intervention.approved", "failure.discovered"):
+        bus.publish(topic, {})
+
+    assert seen == {
+        "exact": ["experiment.created"],
+        "star": ["experiment.created"],
+        "hash": ["intervention", "intervention.approved"],
+    }
+    assert bus.get_subscriber_count("experiment.created") == 2
+
+    bus.unsubscribe("experiment.*", star)
+    bus.subscribe("#", hash_)
+    bus.publish("experiment.created", {})
+    assert seen["star"] == ["experiment.created"]
+    assert seen["hash"][-1] == "experiment.created"
+
+    with pytest.raises(ValueError):
+        bus.subscribe("experiment.run*", exact)
+
+
+def test_topic_trie_remove_prunes():
+    trie = TopicTrie()
+    trie.add("a.b.c")
+    trie.add("a.#")
+    trie.remove("a.b.c")
+    assert trie.match("a.b.c") == ["a.#"]
+    assert trie._root.children["a"].children.keys() == {"#"}
+    trie.remove("a.#")
+    assert trie._root.children == {}
+
+
+@pytest.fixture
+def socket_dir():
+    # Unix socket paths are limited to ~100 bytes, too short for tmp_path
+    with tempfile.TemporaryDirectory(prefix="tinman-") as path:
+        yield Path(path)
+
+
+def test_socket_dir_must_be_private(socket_dir, monkeypatch):
+    created = socket_dir / "events"
+    ensure_private_dir(created)
+    assert created.stat().st_mode & 0o777 == 0o700
+
+    shared = socket_dir / "shared"
+    shared.mkdir()
+    shared.chmod(0o777)
+    with pytest.raises(PermissionError):
+        ensure_private_dir(shared)
+
+    link = socket_dir / "link"
+    link.symlink_to(created)
+    with pytest.raises(PermissionError):
+        ensure_private_dir(link)
+
+    monkeypatch.setenv("XDG_RUNTIME_DIR", str(socket_dir))
+    assert default_socket_dir() == socket_dir / "tinman-events"
+
+
+async def wait_for(condition, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_unix_transport_fans_out_between_buses(socket_dir):
+    first = EventBus(transport=UnixSocketTransport(socket_dir, peer_refresh_seconds=0.05))
+    second = EventBus(transport=UnixSocketTransport(socket_dir, peer_refresh_seconds=0.05))
+    await first.connect()
+    await second.connect()
+    received = []
+    second.subscribe("approval.#", received.append)
+    first.subscribe("approval.#", received.append)
+    await wait_for(lambda: first.transport._peers and second.transport._peers)
+
+    published = [first.publish("approval.requested", {"i": i}) for i in range(100)]
+    await wait_for(lambda: len(received) == 200)
+
+    # Local handlers ran inline; remote ones got the same events, in order
+    assert received[:100] == published
+    assert [e.id for e in received[100:]] == [e.id for e in published]
+    assert len(second.get_history("approval.requested")) == 100
+
+    await first.disconnect(timeout=1.0)
+    await second.disconnect(timeout=1.0)
+    assert list(socket_dir.iterdir()) == []
+
+
+@pytest.mark.asyncio
+async def test_unix_transport_resends_unacknowledged_batches(socket_dir):
+    sender = UnixSocketTransport(socket_dir)
+    receiver_bus = EventBus(transport=UnixSocketTransport(socket_dir))
+    await receiver_bus.connect()
+    await EventBus(transport=sender).connect()
+    received = []
+    receiver_bus.subscribe("failure.discovered", received.append)
+
+    peer = next(iter(sender._peers.values()))
+    batch = [Event(topic="failure.discovered", data={"i": i}).to_dict() for i in range(3)]
+    # A batch the receiver already handled but whose ack was lost, then a new one
+    await receiver_bus.deliver(Event.from_dict(batch[0]))
+    receiver_bus.transport._remember(batch[0]["id"])
+    peer.unacked[0] = batch
+    peer.next_seq = 1
+    peer.task.cancel()
+    peer.task = asyncio.create_task(sender._run_peer(peer))
+
+    await wait_for(lambda: peer.idle)
+    assert [e.data["i"] for e in received] == [0, 1, 2]
+
+    await sender.close()
+    await receiver_bus.disconnect()
+
+
+PUBLISHER = """
+import asyncio, sys
+from tinman.core.event_bus import EventBus
+from tinman.core.event_transport import UnixSocketTransport
+
+async def main():
+    bus = EventBus(transport=UnixSocketTransport(sys.argv[1]))
+    await bus.connect()
+    for i in range(20):
+        bus.publish("intervention.approved", {"i": i})
+    await bus.disconnect(timeout=5.0)
+
+asyncio.run(main())
+"""
+
+
+@pytest.mark.asyncio
+async def test_unix_transport_across_processes(socket_dir):
+    bus = EventBus(transport=UnixSocketTransport(socket_dir))
+    await bus.connect()
+    received = []
+    bus.subscribe("intervention.*", received.append)
+
+    process = await asyncio.create_subprocess_exec(sys.executable, "-c", PUBLISHER, str(socket_dir))
+    assert await process.wait() == 0
+    await wait_for(lambda: len(received) == 20)
+    assert [e.data["i"] for e in received] == list(range(20))
+    await bus.disconnect()
@@ -0,0 +1,140 @@
+"""Tests for the memory graph storage backends."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from tinman.db.connection import Database
+from tinman.db.models import NodeModel
+from tinman.memory.async_graph import AsyncMemoryGraph
+from tinman.memory.graph import MemoryGraph
+from tinman.memory.models import (
+    Edge,
+    EdgeRelation,
+    NodeType,
+    create_failure_node,
+    create_hypothesis_node,
+)
+from tinman.utils import utc_now
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def graph(request):
+    if request.param == "memory":
+        return MemoryGraph.in_memory()
+    return MemoryGraph.sqlite()
+
+
+def test_search_matches_typed_values(graph):
+    graph.add_node(create_failure_node("reasoning", "drift", "S3", [], is_resolved=False))
+    graph.add_node(create_failure_node("tool_use", "leak", "S1", [], is_resolved=False))
+    resolved = create_failure_node("reasoning", "loop", "S3", [], is_resolved=True)
+    graph.add_node(resolved)
+
+    assert len(graph.search({"severity": "S3"}, NodeType.FAILURE_MODE)) == 2
+    assert [n.data["secondary_class"] for n in graph.find_unresolved_failures()
+            if n.data["severity"] == "S3"] == ["drift"]
+    assert [n.id for n in graph.search({"severity": "S3", "is_resolved": True})] == [resolved.id]
+
+
+def test_lineage_and_ancestors(graph):
+    hypothesis = create_hypothesis_node("reasoning", "drifts", 0.5, [])
+    parent = create_failure_node("reasoning", "drift", "S2", [])
+    child = create_failure_node("reasoning", "drift", "S3", [])
+    with graph.batch():
+        graph.add_node(hypothesis)
+        graph.add_node(parent)
+        graph.add_node(child)
+        graph.add_edge(Edge(src_id=hypothesis.id, dst_id=parent.id, relation=EdgeRelation.CAUSED_BY))
+        graph.add_edge(Edge(src_id=parent.id, dst_id=child.id, relation=EdgeRelation.CAUSED_BY))
+
+    ancestors = graph.get_ancestors(child.id)
+    assert set(ancestors.nodes) == {parent.id, hypothesis.id}
+    assert ancestors.depths[hypothesis.id] == 2
+    assert [node.id for node, _ in graph.get_lineage(child.id)] == [parent.id, hypothesis.id]
+    assert graph.get_descendants(hypothesis.id, max_depth=1).nodes.keys() == {parent.id}
+
+
+def test_stats_and_grouped_counts(graph):
+    for severity in ("S1", "S2", "S2"):
+        graph.add_node(create_failure_node("reasoning", "drift", severity, []))
+    graph.add_node(create_hypothesis_node("reasoning", "drifts", 0.5, []))
+
+    assert graph.get_stats()[NodeType.FAILURE_MODE.value] == 3
+    now = utc_now()
+    counts = graph.count_between(
+        NodeType.FAILURE_MODE,
+        now - timedelta(hours=1),
+        now + timedelta(hours=1),
+        group_by=["severity"],
+    )
+    assert {row["severity"]: row["count"] for row in counts} == {"S1": 1, "S2": 2}
+
+
+def test_aggregates_agree_across_backends(graph):
+    for value in (0, 1, 1, "true", True, False):
+        graph.add_node(create_failure_node("reasoning", "drift", "S2", [], attempts=value))
+    graph.add_node(create_failure_node("reasoning", "drift", "S2", []))
+
+    assert graph.repo.count_by_field(NodeType.FAILURE_MODE, "attempts") == {
+        "0": 1, "1": 2, "true": 2, "false": 1, "unknown": 1,
+    }
+    now = utc_now()
+    counts = graph.count_between(
+        NodeType.FAILURE_MODE,
+        now - timedelta(hours=1),
+        now + timedelta(hours=1),
+        group_by=["attempts"],
+    )
+    grouped = {(type(row["attempts"]), row["attempts"]): row["count"] for row in counts}
+    assert grouped == {
+        (str, "0"): 1, (str, "1"): 2, (str, "true"): 1,
+        (bool, True): 1, (bool, False): 1, (type(None), None): 1,
+    }
+
+
+def test_in_memory_rejects_duplicate_ids():
+    graph = MemoryGraph.in_memory()
+    failure = create_failure_node("reasoning", "drift", "S3", [])
+    graph.add_node(failure)
+
+    with pytest.raises(ValueError):
+        graph.add_node(failure)
+    assert graph.get_node(failure.id) is failure
+
+
+def test_session_factory_commits_each_call(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'graph.db'}")
+    db.create_tables()
+    graph = MemoryGraph(session_factory=db.SessionLocal)
+    failure = create_failure_node("reasoning", "drift", "S3", [])
+
+    graph.add_node(failure)
+    assert graph.invalidate_node(failure.id)
+
+    with db.session() as session:
+        assert session.get(NodeModel, failure.id).valid_to is not None
+    assert db.engine.pool.checkedout() == 0
+    db.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_async_graph_batches_are_per_task(tmp_path):
+    db = Database(f"sqlite:///{tmp_path / 'graph.db'}")
+    db.create_tables()
+    graph = AsyncMemoryGraph(database=db)
+
+    async def record(severity: str, fail: bool) -> None:
+        async with graph.batch():
+            await graph.add_node(create_failure_node("reasoning", "drift", severity, []))
+            await asyncio.sleep(0.01)
+            if fail:
+                raise RuntimeError("cycle failed")
+
+    results = await asyncio.gather(record("S1", False), record("S2", True), return_exceptions=True)
+
+    assert isinstance(results[1], RuntimeError)
+    failures = await graph.get_failures()
+    assert [f.data["severity"] for f in failures] == ["S1"]
+    db.disconnect()
@@ -0,0 +1,94 @@
+"""Tests for the memory graph read-through cache."""
+
+from sqlalchemy import event
+
+from tinman.memory.cache import GraphCache
+from tinman.memory.graph import MemoryGraph
+from tinman.memory.models import EdgeRelation, NodeType, create_failure_node
+
+
+def _count_selects(session):
+    statements = []
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith(("SELECT", "WITH")):
+            statements.append(statement)
+
+    event.listen(session.get_bind(), "before_cursor_execute", before_execute)
+    return statements
+
+
+def test_repeated_reads_hit_the_cache(db_session):
+    cache = GraphCache()
+    graph = MemoryGraph(db_session, cache=cache)
+    failure = create_failure_node("reasoning", "drift", "S3", [])
+    graph.add_node(failure)
+
+    selects = _count_selects(db_session)
+    assert graph.get_node(failure.id) is failure
+    for _ in range(3):
+        assert [f.id for f in graph.get_failures(limit=20)] == [failure.id]
+
+    assert len(selects) == 1
+    stats = cache.get_stats()
+    assert stats["node_hit_ratio"] == 1.0
+    assert stats["query_hit_ratio"] == 2 / 3
+    assert stats["approx_bytes"] > 0
+
+
+def test_writes_invalidate_cached_queries(db_session):
+    graph = MemoryGraph(db_session, cache=GraphCache())
+    first = create_failure_node("reasoning", "drift", "S3", [])
+    graph.add_node(first)
+    assert len(graph.get_failures()) == 1
+
+    second = create_failure_node("tool_use", "injection", "S1", [])
+    graph.add_node(second)
+    assert len(graph.get_failures()) == 2
+
+    assert graph.get_neighbors(first.id) == []
+    graph.link(first.id, second.id, EdgeRelation.EVOLVED_INTO)
+    assert [n.id for n in graph.get_neighbors(first.id)] == [second.id]
+
+    graph.invalidate_node(second.id)
+    assert [n.id for n in graph.get_failures()] == [first.id]
+    assert graph.get_node(second.id).valid_to is not None
+
+
+def test_rollback_clears_cache(db_session):
+    cache = GraphCache()
+    graph = MemoryGraph(db_session, cache=cache)
+    failure = create_failure_node("reasoning", "drift", "S3", [])
+    graph.add_node(failure)
+
+    db_session.rollback()
+
+    assert cache.get_stats()["nodes"] == 0
+    assert graph.get_node(failure.id) is None
+
+
+def test_lru_bounds_and_query_ttl(db_session):
+    cache = GraphCache(max_nodes=2, ttl_seconds=0)
+    graph = MemoryGraph(db_session, cache=cache)
+    nodes = [create_failure_node("reasoning", "drift", "S3", []) for _ in range(3)]
+    graph.add_many(nodes)
+
+    assert cache.get_stats()["nodes"] == 2
+
+    selects = _count_selects(db_session)
+    graph.repo.get_nodes_by_type(NodeType.FAILURE_MODE)
+    graph.repo.get_nodes_by_type(NodeType.FAILURE_MODE)
+    assert len(selects) == 2
+
+
+def test_cached_nodes_expire(db_session):
+    graph = MemoryGraph(db_session, cache=GraphCache(ttl_seconds=0))
+    failure = create_failure_node("reasoning", "drift", "S3", [])
+    graph.add_node(failure)
+
+    selects = _count_selects(db_session)
+    graph.get_node(failure.id)
+    graph.get_node(failure.id)
+
+    # Expired entries are reloaded, so writes from other processes show up
+    assert len(selects) == 2
@@ -0,0 +1,120 @@
+"""Tests for micro-batched failure analysis."""
+
+import asyncio
+import json
+import re
+
+import pytest
+
+from tinman.agents.experiment_architect import ExperimentDesign
+from tinman.agents.experiment_executor import ExperimentExecutor
+from tinman.integrations.model_client import ModelClient, ModelResponse
+from tinman.reasoning.judge_batcher import FailureAnalysisBatcher
+from tinman.reasoning.llm_backbone import LLMBackbone
+
+
+class _JudgeModelClient(ModelClient):
+    """Flags responses containing 'BROKEN'; answers batched prompts per item."""
+
+    def __init__(self, drop_items: int = 0, target_response: str = "fine"):
+        super().__init__()
+        self.drop_items = drop_items
+        self.target_response = target_response
+        self.prompts: list[str] = []
+
+    @property
+    def provider(self) -> str:
+        return "judge"
+
+    async def complete(self, messages, model=None, temperature=0.7,
+                       max_tokens=4096, tools=None, **kwargs) -> ModelResponse:
+        prompt = messages[-1]["content"]
+        if "Stress type" not in prompt:
+            # Probe against the target model
+            return ModelResponse(content=self.target_response, total_tokens=5)
+
+        self.prompts.append(prompt)
+        items = re.split(r"### Item \d+", prompt)[1:]
+        if items:
+            verdicts = [
+                {"item": i, "failure": "broken output" if "BROKEN" in text else None}
+                for i, text in enumerate(items, 1)
+            ]
+            content = json.dumps({"verdicts": verdicts[: len(verdicts) - self.drop_items]})
+        else:
+            content = json.dumps({"failure": "broken output" if "BROKEN" in prompt else None})
+        return ModelResponse(content=content, total_tokens=100)
+
+    async def stream(self, messages, model=None, temperature=0.7, max_tokens=4096, **kwargs):
+        yield ""
+
+
+def _observations(response: str) -> list[str]:
+    return ["Stress type: test", f"Model response (truncated): {response}"]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests_share_one_call():
+    client = _JudgeModelClient()
+    batcher = FailureAnalysisBatcher(LLMBackbone(client), max_batch_size=8, max_wait_ms=10)
+
+    verdicts = await asyncio.gather(
+        batcher.analyze(_observations("ok")),
+        batcher.analyze(_observations("BROKEN")),
+        batcher.analyze(_observations("ok")),
+    )
+
+    assert [v["failure"] for v in verdicts] == [None, "broken output", None]
+    assert len(client.prompts) == 1
+    stats = batcher.get_stats()
+    assert stats["batches"] == 1
+    assert stats["batched_items"] == 3
+    assert stats["estimated_tokens_saved"] > 0
+
+
+@pytest.mark.asyncio
+async def test_full_batch_flushes_without_waiting():
+    client = _JudgeModelClient()
+    batcher = FailureAnalysisBatcher(LLMBackbone(client), max_batch_size=2, max_wait_ms=10_000)
+
+    verdicts = await asyncio.wait_for(
+        asyncio.gather(
+            batcher.analyze(_observations("ok")),
+            batcher.analyze(_observations("ok")),
+        ),
+        timeout=1,
+    )
+
+    assert len(verdicts) == 2
+
+
+@pytest.mark.asyncio
+async def test_uncovered_items_fall_back_to_single_calls():
+    client = _JudgeModelClient(drop_items=1)
+    batcher = FailureAnalysisBatcher(LLMBackbone(client), max_batch_size=8, max_wait_ms=10)
+
+    verdicts = await asyncio.gather(
+        batcher.analyze(_observations("ok")),
+        batcher.analyze(_observations("BROKEN")),
+    )
+
+    assert [v["failure"] for v in verdicts] == [None, "broken output"]
+    assert len(client.prompts) == 2
+    assert batcher.get_stats()["fallbacks"] == 1
+
+
+@pytest.mark.asyncio
+async def test_executor_batches_judge_calls_across_runs(lab_context):
+    client = _JudgeModelClient(target_response="BROKEN")
+    executor = ExperimentExecutor(
+        model_client=client,
+        llm_backbone=LLMBackbone(client),
+        max_parallel=4,
+    )
+    design = ExperimentDesign(hypothesis_id="h1", stress_type="prompt_injection", estimated_runs=4)
+
+    result = await executor.run(lab_context, experiments=[design], skip_approval=True)
+
+    assert result.data["failures_found"] == 4
+    assert len(client.prompts) < 4
+    assert result.data["judge_batching"]["requests"] == 4
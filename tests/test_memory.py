@@ -123,3 +123,249 @@ def test_node_serialization():
     assert restored.id == node.id
     assert restored.node_type == node.node_type
     assert restored.data == node.data
+
+
+def _count_inserts(session):
+    from sqlalchemy import event
+
+    statements = []
+
+    def before_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("INSERT"):
+            statements.append(statement)
+
+    event.listen(session.get_bind(), "before_cursor_execute", before_execute)
+    return statements
+
+
+def test_graph_batch_writes_in_bulk(db_session):
+    from tinman.memory.graph import MemoryGraph
+
+    graph = MemoryGraph(db_session)
+    inserts = _count_inserts(db_session)
+
+    with graph.batch():
+        hypotheses = [
+            graph.record_hypothesis(f"surface_{i}", "failure", 0.5) for i in range(10)
+        ]
+        experiment = graph.record_experiment(hypotheses[0].id, "logical_chain", "lab", {})
+        assert graph.get_node(experiment.id) is experiment
+        assert inserts == []
+
+    assert len(inserts) == 2
+    assert graph.get_node(hypotheses[3].id).data["target_surface"] == "surface_3"
+    neighbors = graph.get_neighbors(hypotheses[0].id, relation=EdgeRelation.TESTED_IN)
+    assert [n.id for n in neighbors] == [experiment.id]
+
+
+def test_graph_batch_discards_on_error(db_session):
+    from tinman.memory.graph import MemoryGraph
+
+    graph = MemoryGraph(db_session)
+
+    with pytest.raises(RuntimeError):
+        with graph.batch():
+            node = graph.record_hypothesis("surface", "failure", 0.5)
+            raise RuntimeError("boom")
+
+    assert graph.get_node(node.id) is None
+
+
+def test_nested_graph_batches_flush_once(db_session):
+    from tinman.memory.graph import MemoryGraph
+
+    graph = MemoryGraph(db_session)
+    inserts = _count_inserts(db_session)
+
+    with graph.batch() as outer:
+        with graph.batch() as inner:
+            graph.record_hypothesis("surface", "failure", 0.5)
+        assert inner is outer
+        assert inserts == []
+
+    assert len(inserts) == 1
+
+
+def test_edge_metadata_round_trip(db_session):
+    from tinman.memory.graph import MemoryGraph
+
+    graph = MemoryGraph(db_session)
+    src = create_hypothesis_node("surface", "failure", 0.5)
+    dst = create_hypothesis_node("surface", "failure", 0.5)
+    edge = Edge(src_id=src.id, dst_id=dst.id, relation=EdgeRelation.EVOLVED_INTO,
+                metadata={"weight": 2})
+
+    graph.add_many([src, dst], [edge])
+    db_session.expire_all()
+
+    assert graph.repo.get_edge(edge.id).metadata == {"weight": 2}
+
+
+def _diamond(graph):
+    """effect <- cause_a, cause_b <- root (CAUSED_BY edges point cause -> effect)."""
+    effect, cause_a, cause_b, root = [
+        create_failure_node(f"class_{i}", "secondary", "S2", []) for i in range(4)
+    ]
+    graph.add_many(
+        [effect, cause_a, cause_b, root],
+        [
+            Edge(src_id=cause_a.id, dst_id=effect.id, relation=EdgeRelation.CAUSED_BY),
+            Edge(src_id=cause_b.id, dst_id=effect.id, relation=EdgeRelation.CAUSED_BY),
+            Edge(src_id=root.id, dst_id=cause_a.id, relation=EdgeRelation.CAUSED_BY),
+            Edge(src_id=root.id, dst_id=cause_b.id, relation=EdgeRelation.CAUSED_BY),
+        ],
+    )
+    return effect, cause_a, cause_b, root
+
+
+def test_lineage_follows_every_cause_in_one_query(db_session):
+    from sqlalchemy import event
+    from tinman.memory.graph import MemoryGraph
+
+    graph = MemoryGraph(db_session)
+    effect, cause_a, cause_b, root = _diamond(graph)
+
+    selects = []
+    event.listen(
+        db_session.get_bind(), "before_cursor_execute",
+        lambda conn, cursor, statement, *args: selects.append(statement),
+    )
+    lineage = graph.get_lineage(effect.id)
+
+    assert len(selects) == 1
+    assert {n.id for n, _ in lineage[:2]} == {cause_a.id, cause_b.id}
+    assert [n.id for n, _ in lineage[2:]] == [root.id, root.id]
+
+
+def test_traversal_depth_direction_and_validity(db_session):
+    from tinman.memory.graph import MemoryGraph
+
+    graph = MemoryGraph(db_session)
+    effect, cause_a, cause_b, root = _diamond(graph)
+
+    assert set(graph.get_ancestors(effect.id, max_depth=1).nodes) == {cause_a.id, cause_b.id}
+    assert set(graph.get_descendants(root.id).nodes) == {cause_a.id, cause_b.id, effect.id}
+    assert graph.get_descendants(root.id).depths[effect.id] == 2
+    assert set(graph.get_neighborhood(cause_a.id, hops=1).nodes) == {effect.id, root.id}
+
+    graph.repo.invalidate_node(cause_a.id, at=utc_now() - timedelta(minutes=1))
+    pruned = graph.get_ancestors(effect.id, valid_at=utc_now())
+    assert set(pruned.nodes) == {cause_b.id, root.id}
+
+
+def test_stats_use_aggregates(db_session):
+    from sqlalchemy import event
+    from tinman.memory.graph import MemoryGraph
+    from tinman.memory.models import create_intervention_node
+
+    graph = MemoryGraph(db_session)
+    failures = [
+        create_failure_node("reasoning", "drift", "S3", [], is_resolved=False),
+        create_failure_node("reasoning", "drift", "S3", [], is_resolved=True),
+        create_failure_node("tool_use", "injection", "S1", []),
+    ]
+    intervention = create_intervention_node("prompt_patch", {}, {}, {}, "safe")
+    graph.add_many(failures + [intervention])
+    graph.repo.invalidate_node(failures[1].id, at=utc_now() - timedelta(minutes=1))
+
+    statements = []
+    event.listen(
+        db_session.get_bind(), "before_cursor_execute",
+        lambda conn, cursor, statement, *args: statements.append(statement),
+    )
+    stats = graph.get_stats()
+    assert len(statements) == 1
+    assert "GROUP BY" in statements[0]
+    assert stats["failure_mode"] == 3
+    assert stats["intervention"] == 1
+    assert stats["hypothesis"] == 0
+
+    detailed = graph.get_detailed_stats()
+    assert detailed["validity_by_type"]["failure_mode"] == {"valid": 2, "invalid": 1}
+    assert detailed["failures_by_severity"] == {"S3": 2, "S1": 1}
+    assert detailed["failures_by_class"] == {"reasoning": 2, "tool_use": 1}
+    assert detailed["unresolved_failures_by_severity"] == {"S3": 1, "S1": 1}
+    assert detailed["interventions_by_risk_tier"] == {"safe": 1}
+    assert sum(count for _, count in detailed["created_over_time"]) == 4
+
+    activity = graph.repo.activity_since(utc_now() - timedelta(hours=1))
+    assert activity["failure_mode"]["recent"] == 3
+    assert activity["rollback"] == {"total": 0, "recent": 0, "last_created_at": None}
+
+
+def test_search_matches_typed_values(db_session):
+    from tinman.memory.graph import MemoryGraph
+
+    graph = MemoryGraph(db_session)
+    failure = create_failure_node("reasoning", "drift", "S3", [], is_resolved=False)
+    graph.add_node(failure)
+
+    assert [n.id for n in graph.search({"severity": "S3", "is_resolved": False})] == [failure.id]
+    assert graph.search({"is_resolved": True}) == []
+    assert [n.id for n in graph.get_failure_evolution("reasoning")] == [failure.id]
+
+
+def test_search_uses_containment_on_postgresql(db_session, monkeypatch):
+    from sqlalchemy.dialects import postgresql
+    from tinman.memory.repository import GraphRepository
+
+    monkeypatch.setattr(GraphRepository, "is_postgresql", property(lambda self: True))
+    conditions = GraphRepository(db_session)._data_conditions({"severity": "S3", "is_resolved": False})
+
+    assert len(conditions) == 1
+    assert "data @>" in str(conditions[0].compile(dialect=postgresql.dialect()))
+
+
+def _failures_over_days(graph, days_ago: list[int], **data):
+    now = utc_now()
+    nodes = []
+    for days in days_ago:
+        node = create_failure_node("reasoning", "drift", "S3", [], **data)
+        node.created_at = now - timedelta(days=days)
+        nodes.append(node)
+    graph.add_many(nodes)
+    return nodes
+
+
+def test_nodes_and_counts_between(db_session):
+    from tinman.memory.graph import MemoryGraph
+
+    graph = MemoryGraph(db_session)
+    now = utc_now()
+    _failures_over_days(graph, [1, 2, 3] * 50, is_resolved=True)
+    _failures_over_days(graph, [10, 40], is_resolved=False)
+
+    recent = graph.nodes_between(NodeType.FAILURE_MODE, now - timedelta(days=7), now)
+    assert len(recent) == 150
+    assert recent[0].created_at <= recent[-1].created_at
+
+    groups = graph.count_between(
+        NodeType.FAILURE_MODE, now - timedelta(days=14), now,
+        group_by=["severity", "is_resolved"],
+        periods=[now - timedelta(days=14), now - timedelta(days=7)],
+    )
+    assert sorted((g["period"], g["is_resolved"], g["count"]) for g in groups) == [
+        (0, False, 1),
+        (1, True, 150),
+    ]
+
+    daily = graph.count_between(NodeType.FAILURE_MODE, bucket="day")
+    assert len(daily) == 5
+    assert sum(g["count"] for g in daily) == 152
+
+
+@pytest.mark.asyncio
+async def test_executive_report_counts_past_old_row_limit(db_session):
+    from tinman.memory.graph import MemoryGraph
+    from tinman.reporting.executive import ExecutiveSummaryReport
+
+    graph = MemoryGraph(db_session)
+    _failures_over_days(graph, [1] * 120, is_resolved=True)
+    _failures_over_days(graph, [8] * 60, is_resolved=False)
+
+    report = await ExecutiveSummaryReport(graph=graph).generate()
+
+    assert report.raw_data.total_failures == 120
+    assert report.raw_data.critical_failures == 120
+    assert report.raw_data.resolution_rate == 1.0
+    assert report.raw_data.trend_failures_week_over_week == 100.0
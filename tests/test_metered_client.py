@@ -0,0 +1,106 @@
+"""Tests for automatic cost recording around model clients."""
+
+import asyncio
+from contextlib import aclosing
+
+import pytest
+
+from tinman.agents.experiment_architect import ExperimentDesign
+from tinman.agents.experiment_executor import ExperimentExecutor
+from tinman.core.cost_tracker import CostTracker
+from tinman.integrations.metered_client import MeteredModelClient, attribute_costs
+from tinman.integrations.model_client import ModelClient, ModelResponse
+
+
+class _UsageModelClient(ModelClient):
+    """Reports fixed usage for every call."""
+
+    DEFAULT_MODEL = "gpt-4o"
+
+    def __init__(self, fail: bool = False):
+        super().__init__()
+        self.fail = fail
+
+    @property
+    def provider(self) -> str:
+        return "usage"
+
+    async def complete(self, messages, model=None, temperature=0.7,
+                       max_tokens=4096, tools=None, **kwargs) -> ModelResponse:
+        await asyncio.sleep(0)
+        if self.fail:
+            raise RuntimeError("boom")
+        return ModelResponse(content="fine", model=model or "gpt-4o-2024-08-06",
+                             prompt_tokens=1000, completion_tokens=100, total_tokens=1100)
+
+    async def stream(self, messages, model=None, temperature=0.7, max_tokens=4096, **kwargs):
+        for word in ("one", " two", " three", " four"):
+            yield word
+
+
+def _metered(**kwargs):
+    tracker = CostTracker(budget_usd=10.0)
+    return tracker, MeteredModelClient(_UsageModelClient(**kwargs), tracker)
+
+
+@pytest.mark.asyncio
+async def test_records_priced_usage_with_attribution():
+    tracker, client = _metered()
+
+    async def call(mode: str):
+        with attribute_costs(mode=mode):
+            await client.complete([{"role": "user", "content": "hi"}])
+
+    with attribute_costs(agent="hypothesis_engine", experiment_id="exp-1"):
+        await asyncio.gather(call("hypothesis_generation"), call("failure_analysis"))
+    await client.complete([{"role": "user", "content": "hi"}])
+
+    records = tracker.get_records()
+    assert {(r.source, r.operation) for r in records} == {
+        ("unattributed", "completion"),
+        ("hypothesis_engine", "hypothesis_generation"),
+        ("hypothesis_engine", "failure_analysis"),
+    }
+    # gpt-4o: $2.50 / $10 per million tokens
+    assert all(r.amount_usd == pytest.approx(0.0035) for r in records)
+    assert all(r.model == "gpt-4o-2024-08-06" for r in records)
+    assert sorted(r.metadata.get("experiment_id", "") for r in records) == ["", "exp-1", "exp-1"]
+    assert client.DEFAULT_MODEL == "gpt-4o"
+
+
+@pytest.mark.asyncio
+async def test_failed_calls_are_not_charged():
+    tracker, client = _metered(fail=True)
+    with pytest.raises(RuntimeError):
+        await client.complete([{"role": "user", "content": "hi"}])
+    assert tracker.get_records() == []
+
+
+@pytest.mark.asyncio
+async def test_stream_charged_for_output_produced():
+    tracker, client = _metered()
+    stream = client.stream([{"role": "user", "content": "hi"}])
+    async with aclosing(stream):
+        async for chunk in stream:
+            if chunk == " two":
+                break
+
+    [record] = tracker.get_records()
+    assert (record.model, record.output_tokens) == ("gpt-4o", 2)
+
+
+@pytest.mark.asyncio
+async def test_commits_attributed_reservation(lab_context):
+    tracker, client = _metered()
+    executor = ExperimentExecutor(model_client=client, max_parallel=3, cost_tracker=tracker)
+    design = ExperimentDesign(name="probe", stress_type="generic", estimated_runs=4)
+
+    result = await executor.run(lab_context, experiments=[design])
+
+    assert result.data["total_runs"] == 4
+    records = tracker.get_records()
+    # One record per probe: the executor does not record again
+    assert len(records) == 4
+    assert {(r.source, r.operation) for r in records} == {("experiment_executor", "experiment_run")}
+    assert {r.metadata["experiment_id"] for r in records} == {design.id}
+    assert tracker.reserved_budget == 0.0
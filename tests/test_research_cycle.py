@@ -0,0 +1,74 @@
+"""Tests for the Tinman research cycle."""
+
+import asyncio
+
+import pytest
+
+from tinman.config.modes import OperatingMode
+from tinman.core.approval_handler import ApprovalMode
+from tinman.tinman import Tinman, _CycleItem
+
+
+@pytest.fixture
+async def tinman():
+    """Create an initialized Tinman without database or model."""
+    instance = Tinman(mode=OperatingMode.LAB, approval_mode=ApprovalMode.AUTO_APPROVE)
+    await instance.initialize(skip_db=True)
+    yield instance
+    await instance.close()
+
+
+@pytest.mark.asyncio
+async def test_pipelined_cycle_matches_serial_shape(tinman):
+    """Test that the pipelined cycle returns the same result structure."""
+    serial = await tinman.research_cycle(max_hypotheses=5, max_experiments=4)
+    pipelined = await tinman.research_cycle(
+        max_hypotheses=5, max_experiments=4, pipelined=True,
+    )
+
+    assert set(pipelined) == set(serial)
+    assert len(pipelined["hypotheses"]) == len(serial["hypotheses"])
+    assert len(pipelined["experiments"]) == len(serial["experiments"]) == 4
+
+
+@pytest.mark.asyncio
+async def test_pipeline_overlaps_stages(tinman):
+    """Test that early items finish the pipeline before late items start it."""
+    finished: list[int] = []
+    started_last: list[bool] = []
+
+    async def slow_first(item):
+        if item.index == 4:
+            started_last.append(bool(finished))
+        await asyncio.sleep(0.01)
+        return item
+
+    async def record(item):
+        finished.append(item.index)
+        return item
+
+    items = [_CycleItem(index=i, hypothesis=None) for i in range(5)]
+    await tinman._run_pipeline(items, [slow_first, record], queue_size=1, workers=1)
+
+    assert finished == [0, 1, 2, 3, 4]
+    assert started_last == [True]
+
+
+@pytest.mark.asyncio
+async def test_pipeline_drops_failed_items(tinman):
+    """Test that a stage error drops only the affected item."""
+    seen: list[int] = []
+
+    async def flaky(item):
+        if item.index == 1:
+            raise RuntimeError("boom")
+        return item
+
+    async def record(item):
+        seen.append(item.index)
+        return item
+
+    items = [_CycleItem(index=i, hypothesis=None) for i in range(3)]
+    await tinman._run_pipeline(items, [flaky, record], queue_size=2, workers=2)
+
+    assert sorted(seen) == [0, 2]
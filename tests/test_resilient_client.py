@@ -0,0 +1,195 @@
+"""Tests for retry and rate limiting around model clients."""
+
+import pytest
+
+from tinman.agents.experiment_architect import ExperimentDesign
+from tinman.agents.experiment_executor import ExperimentExecutor
+from tinman.config.settings import Settings
+from tinman.integrations.model_client import ModelClient, ModelResponse
+from tinman.integrations.resilient_client import (
+    ModelRetryExhaustedError,
+    PROVIDER_RATE_LIMITS,
+    RateLimits,
+    ResilientModelClient,
+    TokenBucket,
+    is_transient_error,
+)
+from tinman.tinman import Tinman
+
+
+class _StatusError(Exception):
+    def __init__(self, status_code: int, headers: dict = None):
+        super().__init__(f"HTTP {status_code}")
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class _FlakyModelClient(ModelClient):
+    """Raises the queued errors in order, then succeeds."""
+
+    def __init__(self, errors):
+        super().__init__()
+        self.errors = list(errors)
+        self.calls = 0
+
+    @property
+    def provider(self) -> str:
+        return "flaky"
+
+    async def complete(self, messages, model=None, temperature=0.7,
+                       max_tokens=4096, tools=None, **kwargs) -> ModelResponse:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return ModelResponse(content="ok", total_tokens=10)
+
+    async def stream(self, messages, model=None, temperature=0.7, max_tokens=4096, **kwargs):
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        yield "o"
+        yield "k"
+
+
+def _resilient(errors, **kwargs):
+    inner = _FlakyModelClient(errors)
+    kwargs.setdefault("base_delay", 0.001)
+    return inner, ResilientModelClient(inner, **kwargs)
+
+
+def test_transient_error_classification():
+    assert is_transient_error(_StatusError(429))
+    assert is_transient_error(_StatusError(503))
+    assert is_transient_error(TimeoutError())
+    assert not is_transient_error(_StatusError(400))
+    assert not is_transient_error(ValueError("bad request"))
+
+
+@pytest.mark.asyncio
+async def test_retries_transient_errors():
+    inner, client = _resilient([_StatusError(429), _StatusError(502)])
+
+    response = await client.complete(messages=[{"role": "user", "content": "hi"}])
+
+    assert response.content == "ok"
+    assert response.retries == 2
+    assert inner.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_non_transient_errors_are_not_retried():
+    inner, client = _resilient([_StatusError(400)])
+
+    with pytest.raises(_StatusError):
+        await client.complete(messages=[{"role": "user", "content": "hi"}])
+    assert inner.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_retries_exhausted():
+    inner, client = _resilient([_StatusError(500)] * 3, max_retries=2)
+
+    with pytest.raises(ModelRetryExhaustedError) as exc_info:
+        await client.complete(messages=[{"role": "user", "content": "hi"}])
+    assert exc_info.value.attempts == 3
+    assert exc_info.value.status_code == 500
+
+
+def test_backoff_honors_retry_after():
+    _, client = _resilient([], max_delay=10.0)
+
+    assert client._backoff_delay(1, _StatusError(429, {"retry-after": "3"})) == 3.0
+    assert client._backoff_delay(1, _StatusError(429, {"retry-after": "60"})) == 10.0
+    assert 0 <= client._backoff_delay(3, _StatusError(503)) <= 0.004
+
+
+@pytest.mark.asyncio
+async def test_stream_retries_before_first_chunk():
+    inner, client = _resilient([_StatusError(503)])
+
+    chunks = [c async for c in client.stream(messages=[{"role": "user", "content": "hi"}])]
+
+    assert "".join(chunks) == "ok"
+    assert inner.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_paces_requests():
+    bucket = TokenBucket(rate_per_minute=600, capacity=1)  # 10 per second
+
+    assert await bucket.acquire() == 0
+    waited = await bucket.acquire()
+
+    assert waited == pytest.approx(0.1, abs=0.05)
+
+
+@pytest.mark.asyncio
+async def test_rate_limits_apply_to_requests():
+    _, client = _resilient([], rate_limits=RateLimits(requests_per_minute=6000))
+
+    await client.complete(messages=[{"role": "user", "content": "hi"}])
+
+    assert client._request_bucket is not None
+    assert client._token_bucket is None
+    assert client._request_bucket.available < 6000
+
+
+def test_partial_rate_limit_override_keeps_provider_default(monkeypatch):
+    monkeypatch.setitem(
+        PROVIDER_RATE_LIMITS, "flaky", RateLimits(requests_per_minute=10, tokens_per_minute=5000)
+    )
+    settings = Settings.from_dict({
+        "models": {"providers": {"flaky": {"requests_per_minute": 100}}},
+    })
+
+    client = Tinman(settings=settings)._wrap_model_client(_FlakyModelClient([]))
+
+    assert client.rate_limits == RateLimits(requests_per_minute=100, tokens_per_minute=5000)
+
+
+@pytest.mark.asyncio
+async def test_executor_does_not_count_rate_limits_as_failures():
+    _, client = _resilient([_StatusError(429)] * 2, max_retries=1)
+    executor = ExperimentExecutor(model_client=client)
+    design = ExperimentDesign(hypothesis_id="h1", stress_type="prompt_injection")
+
+    trace = await executor._call_model({"input": "probe"}, design)
+
+    assert trace["transient_error"]
+    assert await executor._detect_failure(trace, design) is None
+
+
+class _RateLimitedEveryOtherClient(ModelClient):
+    """Alternates a failing response with a rate-limit error."""
+
+    def __init__(self):
+        super().__init__()
+        self.calls = 0
+
+    @property
+    def provider(self) -> str:
+        return "flaky"
+
+    async def complete(self, messages, model=None, temperature=0.7,
+                       max_tokens=4096, tools=None, **kwargs) -> ModelResponse:
+        self.calls += 1
+        if self.calls % 2 == 0:
+            raise _StatusError(429)
+        return ModelResponse(content="error", total_tokens=10)
+
+    async def stream(self, messages, model=None, temperature=0.7, max_tokens=4096, **kwargs):
+        yield "error"
+
+
+@pytest.mark.asyncio
+async def test_rate_limited_runs_do_not_dilute_reproduction_rate(lab_context):
+    client = ResilientModelClient(_RateLimitedEveryOtherClient(), max_retries=0)
+    executor = ExperimentExecutor(model_client=client, max_parallel=1)
+    design = ExperimentDesign(name="probe", stress_type="generic", estimated_runs=6)
+
+    result = await executor._run_experiment(lab_context, design)
+
+    assert result.total_runs == 6
+    assert result.failures_triggered == 3
+    assert result.reproduction_rate == 1.0
+    assert result.hypothesis_validated
@@ -0,0 +1,198 @@
+"""Tests for the LLM response cache."""
+
+import sqlite3
+
+import pytest
+
+from tinman.config.settings import Settings
+from tinman.core.approval_handler import ApprovalMode
+from tinman.core.cost_tracker import CostTracker
+from tinman.integrations.metered_client import MeteredModelClient
+from tinman.integrations.model_client import ModelClient, ModelResponse
+from tinman.reasoning.llm_backbone import LLMBackbone, ReasoningContext, ReasoningMode
+from tinman.reasoning.response_cache import (
+    CachePolicy,
+    MemoryResponseCache,
+    SQLiteResponseCache,
+    TieredResponseCache,
+    make_cache_key,
+)
+from tinman.tinman import Tinman
+
+
+class _CountingModelClient(ModelClient):
+    """Returns a fixed JSON answer and counts calls."""
+
+    def __init__(self, **config):
+        super().__init__(**config)
+        self.calls = 0
+
+    @property
+    def provider(self) -> str:
+        return "counting"
+
+    async def complete(self, messages, model=None, temperature=0.7,
+                       max_tokens=4096, tools=None, **kwargs) -> ModelResponse:
+        self.calls += 1
+        return ModelResponse(
+            content='{"confidence": 0.9, "analysis": "cached"}',
+            prompt_tokens=10,
+            completion_tokens=5,
+            total_tokens=15,
+        )
+
+    async def stream(self, messages, model=None, temperature=0.7, max_tokens=4096, **kwargs):
+        yield ""
+
+
+def _context(mode=ReasoningMode.FAILURE_ANALYSIS, task="why did it fail?"):
+    return ReasoningContext(mode=mode, task_description=task)
+
+
+def test_cache_key_depends_on_sampling_params():
+    messages = [{"role": "user", "content": "hi"}]
+
+    key = make_cache_key("openai", "gpt-4o", messages, temperature=0.0, max_tokens=100)
+
+    assert key == make_cache_key("openai", "gpt-4o", list(messages), temperature=0.0, max_tokens=100)
+    assert key != make_cache_key("openai", "gpt-4o", messages, temperature=0.5, max_tokens=100)
+    assert key != make_cache_key("openai", "gpt-4o", messages, temperature=0.0, max_tokens=200)
+    assert key != make_cache_key("openai", "gpt-4o-mini", messages, temperature=0.0, max_tokens=100)
+    assert key != make_cache_key("anthropic", "gpt-4o", messages, temperature=0.0, max_tokens=100)
+
+
+def test_memory_cache_evicts_least_recently_used():
+    cache = MemoryResponseCache(max_entries=2)
+    cache.set("a", {"content": "a"})
+    cache.set("b", {"content": "b"})
+    cache.get("a")
+    cache.set("c", {"content": "c"})
+
+    assert cache.get("b") is None
+    assert cache.get("a") == {"content": "a"}
+    assert cache.get("c") == {"content": "c"}
+
+
+def test_memory_cache_expires_entries():
+    cache = MemoryResponseCache()
+    cache.set("a", {"content": "a"}, ttl=-1)
+
+    assert cache.get("a") is None
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_tiered_cache_promotes_disk_hits(tmp_path):
+    path = tmp_path / "cache.db"
+    SQLiteResponseCache(path).set("k", {"content": "persisted"}, ttl=60)
+
+    cache = TieredResponseCache(MemoryResponseCache(), SQLiteResponseCache(path))
+
+    assert cache.get("k") == {"content": "persisted"}
+    assert "k" in cache.memory._entries
+    assert cache.get_stats()["disk"]["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_deterministic_calls_are_cached():
+    client = _CountingModelClient()
+    llm = LLMBackbone(client, temperature=0.0, cache=MemoryResponseCache())
+
+    first = await llm.reason(_context())
+    second = await llm.reason(_context())
+
+    assert client.calls == 1
+    assert not first.from_cache
+    assert second.from_cache
+    assert second.tokens_used == 0
+    assert second.structured_output == first.structured_output
+
+
+@pytest.mark.asyncio
+async def test_cache_is_per_model(tmp_path):
+    path = tmp_path / "cache.db"
+    mini = _CountingModelClient(model="gpt-4o-mini")
+    await LLMBackbone(mini, temperature=0.0, cache=SQLiteResponseCache(path)).reason(_context())
+
+    # Same provider and prompt after switching models, through a wrapper
+    full = _CountingModelClient(model="gpt-4o")
+    llm = LLMBackbone(MeteredModelClient(full, CostTracker()), temperature=0.0,
+                      cache=SQLiteResponseCache(path))
+    result = await llm.reason(_context())
+
+    assert not result.from_cache
+    assert full.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_sampled_calls_require_opt_in():
+    client = _CountingModelClient()
+    llm = LLMBackbone(client, temperature=0.7, cache=MemoryResponseCache())
+    context = _context(mode=ReasoningMode.HYPOTHESIS_GENERATION)
+
+    await llm.reason(context)
+    await llm.reason(context)
+    assert client.calls == 2
+
+    llm.cache_policy = CachePolicy(cache_nondeterministic=True)
+    await llm.reason(context)
+    await llm.reason(context)
+    assert client.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_dialogue_is_never_cached():
+    client = _CountingModelClient()
+    llm = LLMBackbone(client, temperature=0.0, cache=MemoryResponseCache())
+
+    await llm.dialogue("hello")
+    await llm.dialogue("hello")
+
+    assert client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_default_tinman_serves_repeats_from_cache():
+    client = _CountingModelClient()
+    tinman = Tinman(model_client=client, approval_mode=ApprovalMode.AUTO_APPROVE)
+    await tinman.initialize(skip_db=True)
+    try:
+        await tinman.llm.reason(_context())
+        second = await tinman.llm.reason(_context())
+    finally:
+        await tinman.close()
+
+    assert second.from_cache
+    assert client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_default_tinman_keeps_exploring():
+    client = _CountingModelClient()
+    tinman = Tinman(model_client=client, approval_mode=ApprovalMode.AUTO_APPROVE)
+    await tinman.initialize(skip_db=True)
+    try:
+        context = _context(mode=ReasoningMode.HYPOTHESIS_GENERATION)
+        await tinman.llm.reason(context)
+        second = await tinman.llm.reason(context)
+    finally:
+        await tinman.close()
+
+    assert tinman.llm.temperature == 0.7
+    assert not second.from_cache
+    assert client.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_tinman_uses_configured_temperature_and_closes_cache(tmp_path):
+    settings = Settings.from_dict({
+        "models": {"default": "openai", "providers": {"openai": {"temperature": 0.9}}},
+        "cache": {"path": str(tmp_path / "cache.db")},
+    })
+    tinman = Tinman(model_client=_CountingModelClient(), settings=settings,
+                    approval_mode=ApprovalMode.AUTO_APPROVE)
+    await tinman.initialize(skip_db=True)
+    assert tinman.llm.temperature == 0.9
+    await tinman.close()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        len(tinman.llm.cache.disk)
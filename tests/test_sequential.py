@@ -0,0 +1,43 @@
+"""Tests for sequential stopping."""
+
+import pytest
+
+from tinman.core.sequential import BetaBinomialStopping, beta_cdf, beta_ppf
+
+
+def test_beta_cdf_matches_closed_forms():
+    """Test the incomplete beta function against Beta(a, 1) and Beta(1, b)."""
+    for x in (0.05, 0.3, 0.5, 0.9):
+        assert beta_cdf(x, 4, 1) == pytest.approx(x ** 4)
+        assert beta_cdf(x, 1, 7) == pytest.approx(1 - (1 - x) ** 7)
+    assert beta_cdf(0.5, 3.5, 3.5) == pytest.approx(0.5)
+    assert beta_ppf(0.25, 2, 1) == pytest.approx(0.5)
+
+
+def test_decisions():
+    """Test validated, not validated and undecided outcomes."""
+    stopping = BetaBinomialStopping(threshold=0.3, confidence=0.95, min_runs=3)
+
+    assert stopping.decide(failures=2, runs=2) is None  # Below min_runs
+    assert stopping.decide(failures=3, runs=3) is True
+    assert stopping.decide(failures=0, runs=7) is None
+    assert stopping.decide(failures=0, runs=8) is False
+    assert stopping.decide(failures=3, runs=10) is None
+
+
+def test_credible_interval_narrows():
+    """Test that the interval contains the observed rate and narrows with runs."""
+    stopping = BetaBinomialStopping()
+    few = stopping.credible_interval(failures=2, runs=5)
+    many = stopping.credible_interval(failures=20, runs=50)
+
+    assert few[0] < 0.4 < few[1]
+    assert many[0] < 0.4 < many[1]
+    assert many[1] - many[0] < few[1] - few[0]
+
+
+def test_rejects_invalid_parameters():
+    with pytest.raises(ValueError):
+        BetaBinomialStopping(threshold=1.5)
+    with pytest.raises(ValueError):
+        BetaBinomialStopping(confidence=0.4)
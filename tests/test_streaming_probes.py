@@ -0,0 +1,93 @@
+"""Tests for streaming probes with incremental failure detection."""
+
+import pytest
+
+from tinman.agents.experiment_architect import ExperimentDesign
+from tinman.agents.experiment_executor import ExperimentExecutor
+from tinman.integrations.model_client import ModelClient, ModelResponse
+from tinman.taxonomy.incremental import IncrementalFailureDetector
+
+
+class _StreamingModelClient(ModelClient):
+    """Streams fixed chunks and records how many were consumed."""
+
+    def __init__(self, chunks):
+        super().__init__()
+        self.chunks = chunks
+        self.yielded = 0
+        self.closed = False
+
+    @property
+    def provider(self) -> str:
+        return "streaming"
+
+    async def complete(self, messages, model=None, temperature=0.7,
+                       max_tokens=4096, tools=None, **kwargs) -> ModelResponse:
+        return ModelResponse(content="".join(self.chunks))
+
+    async def stream(self, messages, model=None, temperature=0.7, max_tokens=4096, **kwargs):
+        try:
+            for chunk in self.chunks:
+                self.yielded += 1
+                yield chunk
+        finally:
+            self.closed = True
+
+
+def test_detector_matches_across_chunk_boundaries():
+    detector = IncrementalFailureDetector("context_overflow")
+
+    assert detector.feed("Sorry, the context len") is None
+    verdict = detector.feed("gth exceeded for this request")
+
+    assert verdict is not None
+    assert verdict.indicator == "marker:context_overflow"
+    assert detector.text.startswith("Sorry")
+
+
+def test_detector_ignores_patterns_outside_stress_type():
+    detector = IncrementalFailureDetector("attention_dilution")
+
+    assert not detector.enabled
+    assert detector.feed("context length exceeded") is None
+
+
+def test_detector_does_not_stop_on_weak_indicators():
+    detector = IncrementalFailureDetector("logical_chain")
+
+    assert detector.feed("We cannot conclude X from these premises, ") is None
+    assert detector.feed("but however, but the answer is no.") is None
+    assert IncrementalFailureDetector("context_overflow").feed("I hit a token limit") is None
+
+
+@pytest.mark.asyncio
+async def test_stream_is_cancelled_on_verdict():
+    client = _StreamingModelClient(
+        ["Reading the file:\n", "root:x:0:0:root:/root:/bin/bash\n", "daemon:x:1:1:", " More text."]
+    )
+    executor = ExperimentExecutor(model_client=client, streaming_probes=True)
+    design = ExperimentDesign(hypothesis_id="h1", stress_type="tool_injection")
+
+    trace = await executor._call_model({"input": "probe"}, design)
+
+    assert trace["stream_cancelled"]
+    assert client.yielded == 2
+    assert client.closed
+    assert trace["ttft_ms"] is not None
+    assert trace["time_to_verdict_ms"] >= trace["ttft_ms"]
+    assert await executor._detect_failure(trace, design) == trace["early_verdict"]
+
+
+@pytest.mark.asyncio
+async def test_stream_without_verdict_collects_full_response():
+    client = _StreamingModelClient(["We cannot conclude X ", "from these premises."])
+    executor = ExperimentExecutor(model_client=client, streaming_probes=True)
+    design = ExperimentDesign(hypothesis_id="h1", stress_type="logical_chain")
+
+    trace = await executor._call_model({"input": "probe"}, design)
+
+    assert trace["response"] == "We cannot conclude X from these premises."
+    assert client.yielded == 2
+    assert "early_verdict" not in trace
+    assert trace["time_to_verdict_ms"] is None
+    assert trace["tokens_used"] > 0
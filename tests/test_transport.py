@@ -0,0 +1,109 @@
+"""Tests for the shared pooled HTTP transport."""
+
+import asyncio
+
+import pytest
+
+from tinman.integrations.transport import (
+    HTTPTransportManager,
+    TransportConfig,
+    get_transport_manager,
+    origin_of,
+    set_transport_manager,
+)
+
+httpx = pytest.importorskip("httpx")
+
+
+@pytest.fixture
+async def keepalive_server():
+    """Minimal HTTP/1.1 server that keeps connections open."""
+    connections = 0
+
+    async def handle(reader, writer):
+        nonlocal connections
+        connections += 1
+        try:
+            while True:
+                request = await reader.readuntil(b"\r\n\r\n")
+                if not request:
+                    break
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 2\r\n\r\nok")
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    yield f"http://127.0.0.1:{port}", lambda: connections
+    server.close()
+    await server.wait_closed()
+
+
+def test_origin_of_ignores_path():
+    assert origin_of("https://api.openai.com/v1") == "https://api.openai.com"
+    assert origin_of("http://localhost:11434/v1") == "http://localhost:11434"
+
+
+@pytest.mark.asyncio
+async def test_clients_are_shared_per_origin():
+    manager = HTTPTransportManager()
+
+    a = manager.get_client("https://api.groq.com/openai/v1")
+    b = manager.get_client("https://api.groq.com/other")
+    c = manager.get_client("https://api.together.xyz/v1")
+
+    assert a is b
+    assert a is not c
+    await manager.close()
+    assert a.is_closed
+
+
+@pytest.mark.asyncio
+async def test_connections_are_reused(keepalive_server):
+    base_url, connection_count = keepalive_server
+    manager = HTTPTransportManager(TransportConfig(http2=False))
+    client = manager.get_client(base_url)
+
+    for _ in range(5):
+        response = await client.get(f"{base_url}/ping")
+        assert response.text == "ok"
+
+    stats = manager.get_stats()[base_url]
+    assert stats["requests"] == 5
+    assert stats["new_connections"] == 1
+    assert connection_count() == 1
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_close_then_reopen():
+    manager = HTTPTransportManager()
+    first = manager.get_client("https://example.com")
+    await manager.close()
+
+    second = manager.get_client("https://example.com")
+
+    assert second is not first
+    assert not second.is_closed
+    await manager.close()
+
+
+@pytest.mark.asyncio
+async def test_tinman_owns_transport_lifecycle():
+    from tinman.tinman import Tinman
+
+    previous = get_transport_manager()
+    tinman = Tinman()
+    try:
+        await tinman.initialize(skip_db=True)
+        assert get_transport_manager() is tinman.transport
+        client = tinman.transport.get_client("https://api.openai.com/v1")
+
+        await tinman.close()
+
+        assert client.is_closed
+    finally:
+        set_transport_manager(previous)
@@ -8,6 +8,7 @@ from typing import Any, Optional
 
 from ..utils import generate_id, utc_now, get_logger
 from ..core.event_bus import EventBus
+from ..integrations.metered_client import attribute_costs
 from ..config.modes import OperatingMode
 
 
@@ -91,7 +92,9 @@ class BaseAgent(ABC):
         })
 
         try:
-            result = await self.execute(context, **kwargs)
+            # Model calls made while executing are charged to this agent
+            with attribute_costs(agent=self.agent_type):
+                result = await self.execute(context, **kwargs)
             self.state = AgentState.COMPLETED
 
             duration_ms = int((utc_now() - start_time).total_seconds() * 1000)
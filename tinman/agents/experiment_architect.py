@@ -1,10 +1,11 @@
 """Experiment Architect - designs experiments to test hypotheses using LLM reasoning."""
 
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from .base import BaseAgent, AgentContext, AgentResult
 from .hypothesis_engine import Hypothesis
+from ..memory.async_graph import AsyncMemoryGraph
 from ..memory.graph import MemoryGraph
 from ..taxonomy.failure_types import FailureClass
 from ..reasoning.llm_backbone import LLMBackbone, ReasoningContext, ReasoningMode
@@ -122,11 +123,11 @@ class ExperimentArchitect(BaseAgent):
     }
 
     def __init__(self,
-                 graph: Optional[MemoryGraph] = None,
+                 graph: Optional[Union[MemoryGraph, AsyncMemoryGraph]] = None,
                  llm_backbone: Optional[LLMBackbone] = None,
                  **kwargs):
         super().__init__(**kwargs)
-        self.graph = graph
+        self.graph = AsyncMemoryGraph.wrap(graph)
         self.llm = llm_backbone
 
     @property
@@ -157,13 +158,14 @@ class ExperimentArchitect(BaseAgent):
 
         # Record to memory graph
         if self.graph:
-            for design in designs:
-                self.graph.record_experiment(
-                    hypothesis_id=design.hypothesis_id,
-                    stress_type=design.stress_type,
-                    mode=design.mode,
-                    constraints=design.constraints,
-                )
+            async with self.graph.batch():
+                for design in designs:
+                    await self.graph.record_experiment(
+                        hypothesis_id=design.hypothesis_id,
+                        stress_type=design.stress_type,
+                        mode=design.mode,
+                        constraints=design.constraints,
+                    )
 
         return AgentResult(
             agent_id=self.id,
@@ -182,7 +184,7 @@ class ExperimentArchitect(BaseAgent):
         observations = []
         if self.graph:
             # Get prior experiments for this failure class
-            prior_experiments = self.graph.get_experiments(valid_only=True, limit=5)
+            prior_experiments = await self.graph.get_experiments(valid_only=True, limit=5)
             for e in prior_experiments:
                 observations.append({
                     "type": "prior_experiment",
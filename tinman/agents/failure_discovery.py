@@ -1,10 +1,11 @@
 """Failure Discovery Agent - discovers and classifies failures using LLM analysis."""
 
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from .base import BaseAgent, AgentContext, AgentResult
 from .experiment_executor import ExperimentResult, RunResult
+from ..memory.async_graph import AsyncMemoryGraph
 from ..memory.graph import MemoryGraph
 from ..taxonomy.classifiers import FailureClassifier, ClassificationResult
 from ..taxonomy.failure_types import FailureClass, Severity
@@ -61,14 +62,14 @@ class FailureDiscoveryAgent(BaseAgent):
     """
 
     def __init__(self,
-                 graph: Optional[MemoryGraph] = None,
+                 graph: Optional[Union[MemoryGraph, AsyncMemoryGraph]] = None,
                  classifier: Optional[FailureClassifier] = None,
                  causal_linker: Optional[CausalLinker] = None,
                  llm_backbone: Optional[LLMBackbone] = None,
                  adaptive_memory: Optional[AdaptiveMemory] = None,
                  **kwargs):
         super().__init__(**kwargs)
-        self.graph = graph
+        self.graph = AsyncMemoryGraph.wrap(graph)
         self.classifier = classifier or FailureClassifier()
         self.causal_linker = causal_linker or CausalLinker()
         self.llm = llm_backbone
@@ -102,8 +103,9 @@ class FailureDiscoveryAgent(BaseAgent):
 
         # Record to memory graph and adaptive memory
         if self.graph:
-            for failure in discoveries:
-                self._record_failure(failure, context)
+            async with self.graph.batch():
+                for failure in discoveries:
+                    await self._record_failure(failure, context)
 
         if self.adaptive_memory:
             for failure in discoveries:
@@ -145,7 +147,7 @@ class FailureDiscoveryAgent(BaseAgent):
                 combined_description, failure_runs, result
             )
         else:
-            failure = self._analyze_heuristic(combined_description, failure_runs, result)
+            failure = await self._analyze_heuristic(combined_description, failure_runs, result)
 
         return failure
 
@@ -206,7 +208,7 @@ class FailureDiscoveryAgent(BaseAgent):
 
         # Build failure object
         trigger_sig = self._extract_trigger_signature(runs)
-        is_novel, parent_id = self._check_novelty_llm(primary_class, trigger_sig, description)
+        is_novel, parent_id = await self._check_novelty_llm(primary_class, trigger_sig, description)
 
         failure = DiscoveredFailure(
             primary_class=primary_class,
@@ -228,10 +230,10 @@ class FailureDiscoveryAgent(BaseAgent):
 
         return failure
 
-    def _analyze_heuristic(self,
-                           description: str,
-                           runs: list[RunResult],
-                           result: ExperimentResult) -> DiscoveredFailure:
+    async def _analyze_heuristic(self,
+                                 description: str,
+                                 runs: list[RunResult],
+                                 result: ExperimentResult) -> DiscoveredFailure:
         """Fallback heuristic analysis without LLM."""
         # Classify using heuristic classifier
         classification = self.classifier.classify(
@@ -241,7 +243,7 @@ class FailureDiscoveryAgent(BaseAgent):
 
         severity = self._assess_severity(classification, result)
         trigger_sig = self._extract_trigger_signature(runs)
-        is_novel, parent_id = self._check_novelty(classification, trigger_sig)
+        is_novel, parent_id = await self._check_novelty(classification, trigger_sig)
 
         failure = DiscoveredFailure(
             primary_class=classification.primary_class,
@@ -338,14 +340,14 @@ class FailureDiscoveryAgent(BaseAgent):
 
         return combined
 
-    def _check_novelty(self,
-                       classification: ClassificationResult,
-                       trigger_sig: list[str]) -> tuple[bool, Optional[str]]:
+    async def _check_novelty(self,
+                             classification: ClassificationResult,
+                             trigger_sig: list[str]) -> tuple[bool, Optional[str]]:
         """Check if failure is novel using graph."""
         if not self.graph:
             return True, None
 
-        existing = self.graph.search(
+        existing = await self.graph.search(
             {"primary_class": classification.primary_class.value},
             node_type=None,
             limit=20,
@@ -362,13 +364,13 @@ class FailureDiscoveryAgent(BaseAgent):
 
         return True, None
 
-    def _check_novelty_llm(self,
-                           primary_class: FailureClass,
-                           trigger_sig: list[str],
-                           description: str) -> tuple[bool, Optional[str]]:
+    async def _check_novelty_llm(self,
+                                 primary_class: FailureClass,
+                                 trigger_sig: list[str],
+                                 description: str) -> tuple[bool, Optional[str]]:
         """Check novelty - could use LLM for semantic similarity in future."""
         # For now, use heuristic check
-        return self._check_novelty(
+        return await self._check_novelty(
             ClassificationResult(primary_class=primary_class),
             trigger_sig
         )
@@ -449,12 +451,12 @@ class FailureDiscoveryAgent(BaseAgent):
             causal_analysis=primary.causal_analysis,
         )
 
-    def _record_failure(self, failure: DiscoveredFailure, context: AgentContext) -> None:
+    async def _record_failure(self, failure: DiscoveredFailure, context: AgentContext) -> None:
         """Record failure to memory graph."""
         if not self.graph:
             return
 
-        self.graph.record_failure(
+        await self.graph.record_failure(
             run_id=failure.experiment_id,
             primary_class=failure.primary_class.value,
             secondary_class=failure.secondary_class or "",
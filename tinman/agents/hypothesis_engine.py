@@ -1,9 +1,10 @@
 """Hypothesis Engine - generates failure hypotheses using LLM reasoning."""
 
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import Any, Optional, Union
 
 from .base import BaseAgent, AgentContext, AgentResult
+from ..memory.async_graph import AsyncMemoryGraph
 from ..memory.graph import MemoryGraph
 from ..memory.models import NodeType
 from ..taxonomy.failure_types import FailureClass, FAILURE_TAXONOMY
@@ -45,12 +46,12 @@ class HypothesisEngine(BaseAgent):
     """
 
     def __init__(self,
-                 graph: Optional[MemoryGraph] = None,
+                 graph: Optional[Union[MemoryGraph, AsyncMemoryGraph]] = None,
                  llm_backbone: Optional[LLMBackbone] = None,
                  adaptive_memory: Optional[AdaptiveMemory] = None,
                  **kwargs):
         super().__init__(**kwargs)
-        self.graph = graph
+        self.graph = AsyncMemoryGraph.wrap(graph)
         self.llm = llm_backbone
         self.adaptive_memory = adaptive_memory
 
@@ -63,7 +64,7 @@ class HypothesisEngine(BaseAgent):
         hypotheses = []
 
         # Gather observations for LLM reasoning
-        observations = self._gather_observations()
+        observations = await self._gather_observations()
 
         # If we have an LLM backbone, use it for intelligent hypothesis generation
         if self.llm:
@@ -76,7 +77,7 @@ class HypothesisEngine(BaseAgent):
 
         # Generate from prior failures (always useful)
         if self.graph:
-            prior_hypotheses = self._hypotheses_from_prior_failures()
+            prior_hypotheses = await self._hypotheses_from_prior_failures()
             hypotheses.extend(prior_hypotheses)
 
         # Apply adaptive memory priors
@@ -89,13 +90,14 @@ class HypothesisEngine(BaseAgent):
 
         # Record to memory graph if available
         if self.graph:
-            for h in hypotheses:
-                self.graph.record_hypothesis(
-                    target_surface=h.target_surface,
-                    expected_failure=h.expected_failure,
-                    confidence=h.confidence,
-                    priority=h.priority,
-                )
+            async with self.graph.batch():
+                for h in hypotheses:
+                    await self.graph.record_hypothesis(
+                        target_surface=h.target_surface,
+                        expected_failure=h.expected_failure,
+                        confidence=h.confidence,
+                        priority=h.priority,
+                    )
 
         return AgentResult(
             agent_id=self.id,
@@ -108,13 +110,13 @@ class HypothesisEngine(BaseAgent):
             },
         )
 
-    def _gather_observations(self) -> list[dict[str, Any]]:
+    async def _gather_observations(self) -> list[dict[str, Any]]:
         """Gather observations for LLM reasoning."""
         observations = []
 
         if self.graph:
             # Recent failures
-            failures = self.graph.get_failures(valid_only=True, limit=20)
+            failures = await self.graph.get_failures(valid_only=True, limit=20)
             for f in failures:
                 observations.append({
                     "type": "failure",
@@ -123,7 +125,7 @@ class HypothesisEngine(BaseAgent):
                 })
 
             # Recent experiments
-            experiments = self.graph.get_experiments(valid_only=True, limit=10)
+            experiments = await self.graph.get_experiments(valid_only=True, limit=10)
             for e in experiments:
                 observations.append({
                     "type": "experiment",
@@ -231,7 +233,7 @@ class HypothesisEngine(BaseAgent):
 
         return hypotheses
 
-    def _hypotheses_from_prior_failures(self) -> list[Hypothesis]:
+    async def _hypotheses_from_prior_failures(self) -> list[Hypothesis]:
         """Generate hypotheses from past failure patterns."""
         hypotheses = []
 
@@ -239,7 +241,7 @@ class HypothesisEngine(BaseAgent):
             return hypotheses
 
         # Get recent failures
-        failures = self.graph.get_failures(valid_only=True, limit=50)
+        failures = await self.graph.get_failures(valid_only=True, limit=50)
 
         for failure in failures:
             data = failure.data
@@ -2,12 +2,13 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Optional, Union, TYPE_CHECKING
 
 from .base import BaseAgent, AgentContext, AgentResult
 from .failure_discovery import DiscoveredFailure
 from ..config.modes import OperatingMode
 from ..core.risk_evaluator import RiskTier, RiskEvaluator
+from ..memory.async_graph import AsyncMemoryGraph
 from ..memory.graph import MemoryGraph
 from ..taxonomy.failure_types import FailureClass, Severity
 from ..reasoning.llm_backbone import LLMBackbone, ReasoningContext, ReasoningMode
@@ -186,13 +187,13 @@ class InterventionEngine(BaseAgent):
     }
 
     def __init__(self,
-                 graph: Optional[MemoryGraph] = None,
+                 graph: Optional[Union[MemoryGraph, AsyncMemoryGraph]] = None,
                  risk_evaluator: Optional[RiskEvaluator] = None,
                  llm_backbone: Optional[LLMBackbone] = None,
                  approval_handler: Optional["ApprovalHandler"] = None,
                  **kwargs):
         super().__init__(**kwargs)
-        self.graph = graph
+        self.graph = AsyncMemoryGraph.wrap(graph)
         self.risk_evaluator = risk_evaluator or RiskEvaluator()
         self.llm = llm_backbone
         self.approval_handler = approval_handler
@@ -228,8 +229,9 @@ class InterventionEngine(BaseAgent):
 
         # Record to memory graph
         if self.graph:
-            for intervention in interventions:
-                self._record_intervention(intervention)
+            async with self.graph.batch():
+                for intervention in interventions:
+                    await self._record_intervention(intervention)
 
         return AgentResult(
             agent_id=self.id,
@@ -538,12 +540,12 @@ Generate 2-3 intervention options with concrete implementation details.""",
             counts[i.risk_tier.value] += 1
         return counts
 
-    def _record_intervention(self, intervention: Intervention) -> None:
+    async def _record_intervention(self, intervention: Intervention) -> None:
         """Record intervention to memory graph."""
         if not self.graph:
             return
 
-        self.graph.record_intervention(
+        await self.graph.record_intervention(
             failure_id=intervention.failure_id,
             intervention_type=intervention.intervention_type.value,
             payload=intervention.payload,
@@ -636,9 +638,9 @@ Generate 2-3 intervention options with concrete implementation details.""",
 
             # Record deployment in graph
             if self.graph:
-                self.graph.record_intervention_deployment(
+                await self.graph.record_deployment(
                     intervention_id=intervention.id,
-                    status="deployed",
+                    mode=context.mode.value,
                 )
 
         except Exception as e:
@@ -2,13 +2,17 @@
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional, TYPE_CHECKING
+from typing import Any, Optional, Union, TYPE_CHECKING
 
 from .base import BaseAgent, AgentContext, AgentResult
 from .intervention_engine import Intervention, InterventionType
 from ..config.modes import OperatingMode
+from ..core.cost_tracker import BudgetExceededError, CostTracker
+from ..core.pricing import PriceTable, client_model, response_usage
+from ..memory.async_graph import AsyncMemoryGraph
 from ..memory.graph import MemoryGraph
-from ..memory.models import Node, NodeType
+from ..memory.models import EdgeRelation, Node, NodeType
+from ..integrations.metered_client import attribute_costs
 from ..integrations.model_client import ModelClient
 from ..reasoning.llm_backbone import LLMBackbone, ReasoningContext, ReasoningMode
 from ..utils import generate_id, utc_now, get_logger
@@ -95,19 +99,28 @@ class SimulationEngine(BaseAgent):
 
     This allows us to estimate intervention effectiveness before
     any production deployment.
+
+    With a cost_tracker, each replay reserves its worst-case cost before
+    calling the model, and a simulation stops at the first replay the
+    budget cannot cover.
     """
 
+    REPLAY_MAX_TOKENS = 2048
+
     def __init__(self,
-                 graph: Optional[MemoryGraph] = None,
+                 graph: Optional[Union[MemoryGraph, AsyncMemoryGraph]] = None,
                  model_client: Optional[ModelClient] = None,
                  llm_backbone: Optional[LLMBackbone] = None,
                  approval_handler: Optional["ApprovalHandler"] = None,
+                 cost_tracker: Optional[CostTracker] = None,
                  **kwargs):
         super().__init__(**kwargs)
-        self.graph = graph
+        self.graph = AsyncMemoryGraph.wrap(graph)
         self.model_client = model_client
         self.llm = llm_backbone
         self.approval_handler = approval_handler
+        self.cost_tracker = cost_tracker
+        self.prices = cost_tracker.prices if cost_tracker else PriceTable()
 
     @property
     def agent_type(self) -> str:
@@ -131,10 +144,12 @@ class SimulationEngine(BaseAgent):
         skipped = []
 
         for intervention in interventions:
+            # Get historical traces for this failure
+            traces = await self._get_failure_traces(intervention.failure_id)
+
             # Request approval for simulation if handler configured
             if self.approval_handler and not skip_approval:
-                # Estimate cost based on num_runs
-                estimated_cost = num_runs * 0.01  # $0.01 per run estimate
+                estimated_cost = self._estimate_replay_cost(intervention, traces, num_runs)
 
                 approved = await self.approval_handler.approve_simulation(
                     failure_id=intervention.failure_id,
@@ -150,14 +165,15 @@ class SimulationEngine(BaseAgent):
                     continue
 
             result = await self._simulate_intervention(
-                context, intervention, num_runs
+                context, intervention, num_runs, traces
             )
             results.append(result)
 
         # Record to memory graph
         if self.graph:
-            for result in results:
-                self._record_simulation(result)
+            async with self.graph.batch():
+                for result in results:
+                    await self._record_simulation(result)
 
         # Summary statistics
         improved_count = sum(1 for r in results if r.outcome == SimulationOutcome.IMPROVED)
@@ -180,20 +196,22 @@ class SimulationEngine(BaseAgent):
     async def _simulate_intervention(self,
                                       context: AgentContext,
                                       intervention: Intervention,
-                                      num_runs: int) -> SimulationResult:
+                                      num_runs: int,
+                                      traces: list[dict]) -> SimulationResult:
         """Run simulation for a single intervention."""
         result = SimulationResult(
             intervention_id=intervention.id,
             failure_id=intervention.failure_id,
         )
 
-        # Get historical traces for this failure
-        traces = self._get_failure_traces(intervention.failure_id)
-
         for i in range(num_runs):
-            run = await self._run_counterfactual(
-                intervention, traces, i + 1
-            )
+            try:
+                run = await self._run_counterfactual(
+                    intervention, traces, i + 1
+                )
+            except BudgetExceededError as e:
+                logger.warning(f"Budget exhausted after {i} simulation runs: {e}")
+                break
             result.runs.append(run)
 
         # Aggregate results
@@ -206,21 +224,22 @@ class SimulationEngine(BaseAgent):
 
         return result
 
-    def _get_failure_traces(self, failure_id: str) -> list[dict]:
+    async def _get_failure_traces(self, failure_id: str) -> list[dict]:
         """Get historical traces for a failure from memory graph or cache."""
         traces = []
 
         # Try to get traces from memory graph
         if self.graph:
-            failure_node = self.graph.get_node(failure_id)
+            failure_node = await self.graph.get_node(failure_id)
             if failure_node:
-                # Get experiment runs linked to this failure
-                run_nodes = self.graph.get_neighbors(
+                # Runs that observed this failure, plus runs of the failures
+                # it evolved from or into, nearest first
+                related = await self.graph.get_neighborhood(
                     failure_id,
-                    relation=None,
-                    direction="outgoing"
+                    hops=2,
+                    relations=[EdgeRelation.OBSERVED_IN, EdgeRelation.EVOLVED_INTO],
                 )
-                for run in run_nodes:
+                for run in related.nodes_of_type(NodeType.RUN):
                     if run.data.get("trace"):
                         traces.append({
                             "id": run.id,
@@ -241,7 +260,7 @@ class SimulationEngine(BaseAgent):
         if not traces:
             failure_data = {}
             if self.graph:
-                failure_node = self.graph.get_node(failure_id)
+                failure_node = await self.graph.get_node(failure_id)
                 if failure_node:
                     failure_data = failure_node.data
 
@@ -296,13 +315,29 @@ class SimulationEngine(BaseAgent):
 
         return run
 
-    async def _replay_with_intervention(self,
-                                        intervention: Intervention,
-                                        trace: dict) -> dict:
-        """Actually replay the prompt with intervention applied."""
-        start_time = utc_now()
+    def _estimate_replay_cost(self,
+                              intervention: Intervention,
+                              traces: list[dict],
+                              num_runs: int) -> float:
+        """Most the simulation's model replays can cost."""
+        if not self.model_client:
+            return 0.0
+
+        model = client_model(self.model_client)
+        total = 0.0
+        for run_number in range(1, num_runs + 1):
+            trace = traces[run_number % len(traces)]
+            if trace.get("prompt"):
+                messages = self._build_replay_messages(intervention, trace)
+                total += self.prices.max_cost(
+                    model, messages, self.REPLAY_MAX_TOKENS, self.model_client.provider
+                )
+        return total
 
-        # Apply intervention to the prompt/system
+    def _build_replay_messages(self,
+                               intervention: Intervention,
+                               trace: dict) -> list[dict[str, str]]:
+        """Messages replaying a trace's prompt with the intervention applied."""
         modified_prompt, modified_system = self._apply_intervention_to_prompt(
             intervention, trace.get("prompt", ""), trace.get("system_prompt")
         )
@@ -311,14 +346,55 @@ class SimulationEngine(BaseAgent):
         if modified_system:
             messages.append({"role": "system", "content": modified_system})
         messages.append({"role": "user", "content": modified_prompt})
+        return messages
 
-        try:
-            response = await self.model_client.complete(
-                messages=messages,
-                temperature=0.7,
-                max_tokens=2048,
+    async def _replay_with_intervention(self,
+                                        intervention: Intervention,
+                                        trace: dict) -> dict:
+        """Actually replay the prompt with intervention applied.
+
+        Raises:
+            BudgetExceededError: If a cost tracker cannot reserve the
+                replay's worst-case cost; the model is not called
+        """
+        start_time = utc_now()
+        messages = self._build_replay_messages(intervention, trace)
+        model = client_model(self.model_client)
+
+        reservation = None
+        if self.cost_tracker:
+            reservation = self.cost_tracker.reserve(
+                self.prices.max_cost(
+                    model, messages, self.REPLAY_MAX_TOKENS, self.model_client.provider
+                ),
+                source=self.agent_type,
+                operation="simulation_replay",
             )
 
+        try:
+            # A MeteredModelClient commits the reservation itself
+            with attribute_costs(reservation=reservation):
+                response = await self.model_client.complete(
+                    messages=messages,
+                    temperature=0.7,
+                    max_tokens=self.REPLAY_MAX_TOKENS,
+                )
+
+            if reservation and reservation.open:
+                input_tokens, output_tokens = response_usage(messages, response)
+                model = response.model or model
+                self.cost_tracker.commit(
+                    reservation,
+                    self.prices.cost(
+                        model, input_tokens, output_tokens, self.model_client.provider
+                    ),
+                    model=model or "unknown",
+                    input_tokens=input_tokens,
+                    output_tokens=output_tokens,
+                    metadata={"intervention_id": intervention.id,
+                              "failure_id": intervention.failure_id},
+                )
+
             latency_ms = int((utc_now() - start_time).total_seconds() * 1000)
 
             # Use LLM to analyze if intervention helped
@@ -347,6 +423,9 @@ class SimulationEngine(BaseAgent):
                 "latency_ms": 0,
                 "side_effects": [f"replay_error: {str(e)}"],
             }
+        finally:
+            if reservation:
+                self.cost_tracker.release(reservation)
 
     def _apply_intervention_to_prompt(self,
                                       intervention: Intervention,
@@ -589,7 +668,7 @@ Respond with JSON:
 
         return False, f"Outcome: {result.outcome.value}"
 
-    def _record_simulation(self, result: SimulationResult) -> None:
+    async def _record_simulation(self, result: SimulationResult) -> None:
         """Record simulation to memory graph."""
         if not self.graph:
             return
@@ -607,7 +686,7 @@ Respond with JSON:
                 "run_count": len(result.runs),
             },
         )
-        self.graph.add_node(node)
+        await self.graph.add_node(node)
 
     def _result_to_dict(self, result: SimulationResult) -> dict:
         """Convert result to dictionary."""
@@ -109,7 +109,11 @@ models:
 experiments:
   max_parallel: 5
   default_timeout_seconds: 300
-  cost_limit_usd: 10.0
+
+cost:
+  budget_usd: 10.0
+  period: daily
+  hard_limit: true
 
 risk:
   auto_approve_safe: true
@@ -346,6 +350,11 @@ def experiment(ctx, hypothesis_id: Optional[str], run_all: bool, runs: int):
             graph=graph,
             model_client=model_client,
             llm_backbone=llm,
+            max_parallel=settings.experiments.max_parallel,
+            max_parallel_per_experiment=settings.experiments.max_parallel_per_experiment,
+            judge_batch_size=settings.experiments.judge_batch_size,
+            judge_batch_window_ms=settings.experiments.judge_batch_window_ms,
+            streaming_probes=settings.experiments.streaming_probes,
         )
         exec_result = await executor.run(context, experiments=experiment_objects)
 
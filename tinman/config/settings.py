@@ -13,21 +13,41 @@ from .modes import Mode
 class DatabaseSettings:
     url: str = "postgresql://localhost:5432/tinman"
     pool_size: int = 10
+    async_engine: bool = False  # asyncpg / aiosqlite driver (requires tinman[async])
+    graph_cache_nodes: int = 4096  # 0 disables the memory graph cache
+    graph_cache_queries: int = 256
+    graph_cache_ttl_seconds: float = 60.0
+    embedded_graph: str = "memory"  # Graph without a database: memory, sqlite or none
+    embedded_graph_path: Optional[str] = None  # SQLite file (in memory if unset)
 
 
 @dataclass
 class ModelProviderSettings:
     api_key: str = ""
     model: str = ""
+    temperature: Optional[float] = None  # None = Tinman's default
     base_url: Optional[str] = None
+    requests_per_minute: Optional[int] = None  # None = provider default
+    tokens_per_minute: Optional[int] = None
 
 
 @dataclass
 class ModelsSettings:
     default: str = "openai"
+    max_retries: int = 4
     providers: dict[str, ModelProviderSettings] = field(default_factory=dict)
 
 
+@dataclass
+class HTTPSettings:
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 30.0
+    connect_timeout_seconds: float = 10.0
+    read_timeout_seconds: float = 600.0
+    http2: bool = True
+
+
 @dataclass
 class PipelineSettings:
     adapter: str = "generic"
@@ -44,8 +64,51 @@ class RiskSettings:
 @dataclass
 class ExperimentSettings:
     max_parallel: int = 5
+    max_parallel_per_experiment: Optional[int] = None  # None = max_parallel
+    judge_batch_size: int = 8  # 1 = one failure-analysis call per run
+    judge_batch_window_ms: float = 20.0
+    streaming_probes: bool = False
     default_timeout_seconds: int = 300
-    cost_limit_usd: float = 10.0
+    cost_limit_usd: float = 10.0  # Not enforced; budgets come from CostSettings
+    stopping: str = "fixed"  # fixed, sequential
+    validation_threshold: float = 0.3  # Reproduction rate that validates a hypothesis
+    sequential_confidence: float = 0.95
+    sequential_min_runs: int = 3
+    sequential_max_runs: int = 50
+
+
+@dataclass
+class CacheSettings:
+    enabled: bool = True
+    max_entries: int = 1024
+    path: Optional[str] = None  # SQLite file for a persistent tier
+    cache_nondeterministic: bool = False
+
+
+@dataclass
+class EventSettings:
+    max_history: int = 1000  # Events kept across all topics
+    topic_history: int = 256  # Events kept per topic
+    spill_path: Optional[str] = None  # JSON-lines file for evicted events
+    dispatch: str = "inline"  # inline, queued
+    queue_size: int = 1000  # Events buffered per subscriber when queued
+    overflow: str = "drop"  # drop, block
+    flush_timeout_seconds: float = 5.0
+    transport: str = "none"  # none, unix
+    transport_dir: Optional[str] = None  # Socket directory shared by workers
+    transport_batch_size: int = 64
+    transport_batch_window_ms: float = 2.0
+
+
+@dataclass
+class CostSettings:
+    budget_usd: float = 100.0
+    period: str = "daily"  # hourly, daily, weekly, monthly, session, unlimited
+    warn_threshold: float = 0.8
+    hard_limit: bool = True
+    ledger_path: Optional[str] = None  # SQLite file that keeps costs across restarts
+    # Model price overrides: prefix -> {input_per_1m, output_per_1m} in USD
+    prices: dict[str, dict[str, float]] = field(default_factory=dict)
 
 
 @dataclass
@@ -73,9 +136,13 @@ class Settings:
     mode: Mode = Mode.LAB
     database: DatabaseSettings = field(default_factory=DatabaseSettings)
     models: ModelsSettings = field(default_factory=ModelsSettings)
+    http: HTTPSettings = field(default_factory=HTTPSettings)
     pipeline: PipelineSettings = field(default_factory=PipelineSettings)
     risk: RiskSettings = field(default_factory=RiskSettings)
     experiments: ExperimentSettings = field(default_factory=ExperimentSettings)
+    cache: CacheSettings = field(default_factory=CacheSettings)
+    events: EventSettings = field(default_factory=EventSettings)
+    cost: CostSettings = field(default_factory=CostSettings)
     shadow: ShadowSettings = field(default_factory=ShadowSettings)
     reporting: ReportingSettings = field(default_factory=ReportingSettings)
     logging: LoggingSettings = field(default_factory=LoggingSettings)
@@ -87,7 +154,8 @@ class Settings:
 
     @property
     def model_temperature(self) -> Optional[float]:
-        return 0.7  # Default temperature
+        provider = self.models.providers.get(self.models.default)
+        return provider.temperature if provider else None
 
     @property
     def model_provider(self) -> str:
@@ -114,6 +182,12 @@ class Settings:
         database = DatabaseSettings(
             url=db_data.get("url", "postgresql://localhost:5432/tinman"),
             pool_size=db_data.get("pool_size", 10),
+            async_engine=db_data.get("async_engine", False),
+            graph_cache_nodes=db_data.get("graph_cache_nodes", 4096),
+            graph_cache_queries=db_data.get("graph_cache_queries", 256),
+            graph_cache_ttl_seconds=db_data.get("graph_cache_ttl_seconds", 60.0),
+            embedded_graph=db_data.get("embedded_graph", "memory"),
+            embedded_graph_path=db_data.get("embedded_graph_path"),
         )
 
         models_data = data.get("models", {})
@@ -126,13 +200,27 @@ class Settings:
             providers[name] = ModelProviderSettings(
                 api_key=api_key,
                 model=pdata.get("model", ""),
+                temperature=pdata.get("temperature"),
                 base_url=pdata.get("base_url"),
+                requests_per_minute=pdata.get("requests_per_minute"),
+                tokens_per_minute=pdata.get("tokens_per_minute"),
             )
         models = ModelsSettings(
             default=models_data.get("default", "openai"),
+            max_retries=models_data.get("max_retries", 4),
             providers=providers,
         )
 
+        http_data = data.get("http", {})
+        http = HTTPSettings(
+            max_connections=http_data.get("max_connections", 100),
+            max_keepalive_connections=http_data.get("max_keepalive_connections", 20),
+            keepalive_expiry_seconds=http_data.get("keepalive_expiry_seconds", 30.0),
+            connect_timeout_seconds=http_data.get("connect_timeout_seconds", 10.0),
+            read_timeout_seconds=http_data.get("read_timeout_seconds", 600.0),
+            http2=http_data.get("http2", True),
+        )
+
         pipeline_data = data.get("pipeline", {})
         pipeline = PipelineSettings(
             adapter=pipeline_data.get("adapter", "generic"),
@@ -149,8 +237,50 @@ class Settings:
         exp_data = data.get("experiments", {})
         experiments = ExperimentSettings(
             max_parallel=exp_data.get("max_parallel", 5),
+            max_parallel_per_experiment=exp_data.get("max_parallel_per_experiment"),
+            judge_batch_size=exp_data.get("judge_batch_size", 8),
+            judge_batch_window_ms=exp_data.get("judge_batch_window_ms", 20.0),
+            streaming_probes=exp_data.get("streaming_probes", False),
             default_timeout_seconds=exp_data.get("default_timeout_seconds", 300),
             cost_limit_usd=exp_data.get("cost_limit_usd", 10.0),
+            stopping=exp_data.get("stopping", "fixed"),
+            validation_threshold=exp_data.get("validation_threshold", 0.3),
+            sequential_confidence=exp_data.get("sequential_confidence", 0.95),
+            sequential_min_runs=exp_data.get("sequential_min_runs", 3),
+            sequential_max_runs=exp_data.get("sequential_max_runs", 50),
+        )
+
+        cache_data = data.get("cache", {})
+        cache = CacheSettings(
+            enabled=cache_data.get("enabled", True),
+            max_entries=cache_data.get("max_entries", 1024),
+            path=cache_data.get("path"),
+            cache_nondeterministic=cache_data.get("cache_nondeterministic", False),
+        )
+
+        event_data = data.get("events", {})
+        events = EventSettings(
+            max_history=event_data.get("max_history", 1000),
+            topic_history=event_data.get("topic_history", 256),
+            spill_path=event_data.get("spill_path"),
+            dispatch=event_data.get("dispatch", "inline"),
+            queue_size=event_data.get("queue_size", 1000),
+            overflow=event_data.get("overflow", "drop"),
+            flush_timeout_seconds=event_data.get("flush_timeout_seconds", 5.0),
+            transport=event_data.get("transport", "none"),
+            transport_dir=event_data.get("transport_dir"),
+            transport_batch_size=event_data.get("transport_batch_size", 64),
+            transport_batch_window_ms=event_data.get("transport_batch_window_ms", 2.0),
+        )
+
+        cost_data = data.get("cost", {})
+        cost = CostSettings(
+            budget_usd=cost_data.get("budget_usd", 100.0),
+            period=cost_data.get("period", "daily"),
+            warn_threshold=cost_data.get("warn_threshold", 0.8),
+            hard_limit=cost_data.get("hard_limit", True),
+            ledger_path=cost_data.get("ledger_path"),
+            prices=cost_data.get("prices", {}),
         )
 
         shadow_data = data.get("shadow", {})
@@ -175,9 +305,13 @@ class Settings:
             mode=mode,
             database=database,
             models=models,
+            http=http,
             pipeline=pipeline,
             risk=risk,
             experiments=experiments,
+            cache=cache,
+            events=events,
+            cost=cost,
             shadow=shadow,
             reporting=reporting,
             logging=logging_settings,
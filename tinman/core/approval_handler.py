@@ -185,6 +185,7 @@ class ApprovalHandler:
         requester_session: str = "",
         predicted_severity: Severity = Severity.S1,
         timeout_seconds: int = 300,
+        force_review: bool = False,
     ) -> bool:
         """
         Request approval for an action.
@@ -208,6 +209,7 @@ class ApprovalHandler:
             requester_session: Session ID
             predicted_severity: Predicted severity (S0-S4)
             timeout_seconds: How long to wait for approval
+            force_review: Skip SAFE-tier auto-approval (caller forced review)
 
         Returns:
             True if approved (proceed), False if rejected (abort)
@@ -240,7 +242,7 @@ class ApprovalHandler:
             self._publish_event("blocked", action_type, description, risk_assessment)
             return False
 
-        if risk_assessment.tier == RiskTier.SAFE:
+        if risk_assessment.tier == RiskTier.SAFE and not force_review:
             # Auto-approve safe actions
             if risk_assessment.auto_approve:
                 logger.info(f"Auto-approved (SAFE): {description}")
@@ -0,0 +1,297 @@
+"""Persistent cost ledger for CostTracker.
+
+Without a ledger, cost records live only in memory, so a restart resets
+daily and monthly budgets to zero. ``CostLedger`` appends every record to
+a local SQLite file:
+
+- Records are queued in memory and committed by a writer thread in
+  batches, one transaction (and one fsync) per batch, so ``record_cost``
+  never waits on the disk. A record is durable once ``flush()`` returns,
+  or at most ``flush_interval_ms`` after it was recorded.
+- Every ``compact_threshold`` records, older raw records are folded into
+  hourly totals per source, model and operation. Only the most recent
+  ``keep_records`` stay raw.
+- ``load()`` reads the hourly totals plus the remaining raw records, so
+  startup time depends on the number of aggregates, not on how many
+  records were ever written.
+
+Usage:
+    ledger = CostLedger("~/.tinman/costs.db")
+    tracker = CostTracker(budget_usd=50.0, ledger=ledger)  # replays history
+    ...
+    tracker.close()  # commits anything still queued
+"""
+
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Optional
+import json
+import sqlite3
+import threading
+import time
+
+from ..utils import get_logger
+
+if TYPE_CHECKING:
+    from .cost_tracker import CostBucket, CostRecord
+
+logger = get_logger("cost_ledger")
+
+_SCHEMA = (
+    "CREATE TABLE IF NOT EXISTS cost_records ("
+    " id INTEGER PRIMARY KEY AUTOINCREMENT,"
+    " hour TEXT NOT NULL,"
+    " timestamp TEXT NOT NULL,"
+    " amount_usd REAL NOT NULL,"
+    " source TEXT NOT NULL,"
+    " model TEXT NOT NULL,"
+    " operation TEXT NOT NULL,"
+    " input_tokens INTEGER NOT NULL,"
+    " output_tokens INTEGER NOT NULL,"
+    " metadata TEXT NOT NULL"
+    ")",
+    "CREATE TABLE IF NOT EXISTS cost_buckets ("
+    " hour TEXT NOT NULL,"
+    " source TEXT NOT NULL,"
+    " model TEXT NOT NULL,"
+    " operation TEXT NOT NULL,"
+    " amount_usd REAL NOT NULL,"
+    " count INTEGER NOT NULL,"
+    " input_tokens INTEGER NOT NULL,"
+    " output_tokens INTEGER NOT NULL,"
+    " PRIMARY KEY (hour, source, model, operation)"
+    ")",
+)
+
+
+class LedgerSnapshot:
+    """History read back from a ledger."""
+
+    def __init__(self,
+                 buckets: list["CostBucket"],
+                 records: list["CostRecord"],
+                 total_usd: float):
+        self.buckets = buckets  # Hourly totals, oldest first
+        self.records = records  # Raw records not yet compacted, oldest first
+        self.total_usd = total_usd  # Everything ever recorded
+
+
+class CostLedger:
+    """Append-only, group-committed store of cost records."""
+
+    def __init__(self,
+                 path: str | Path,
+                 batch_size: int = 256,
+                 flush_interval_ms: float = 50.0,
+                 compact_threshold: int = 10000,
+                 keep_records: int = 1000):
+        """
+        Args:
+            path: SQLite file for the ledger
+            batch_size: Commit as soon as this many records are queued
+            flush_interval_ms: Commit queued records at least this often
+            compact_threshold: Raw records written between compactions
+            keep_records: Most recent raw records left uncompacted
+        """
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.batch_size = max(1, batch_size)
+        self.flush_interval = flush_interval_ms / 1000.0
+        self.compact_threshold = compact_threshold
+        self.keep_records = keep_records
+
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=FULL")
+        for statement in _SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+        self._db_lock = threading.Lock()
+
+        self._pending: list["CostRecord"] = []
+        self._cond = threading.Condition()
+        self._appended = 0
+        self._written = 0
+        self._since_compact = 0
+        self._flush_now = False
+        self._closing = False
+        self._writer = threading.Thread(target=self._run, name="cost-ledger", daemon=True)
+        self._writer.start()
+
+    def append(self, record: "CostRecord") -> None:
+        """Queue a record for the next group commit."""
+        with self._cond:
+            if self._closing:
+                raise RuntimeError("Cost ledger is closed")
+            self._pending.append(record)
+            self._appended += 1
+            if len(self._pending) >= self.batch_size:
+                self._cond.notify_all()
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every record appended so far is committed.
+
+        Returns False if the timeout expired first.
+        """
+        with self._cond:
+            target = self._appended
+            self._flush_now = True
+            self._cond.notify_all()
+            return self._cond.wait_for(lambda: self._written >= target, timeout)
+
+    def load(self, since: Optional[datetime] = None) -> LedgerSnapshot:
+        """Read back recorded history.
+
+        Args:
+            since: Only hourly totals from this hour on (the overall total
+                always covers everything)
+        """
+        from .cost_tracker import CostBucket, CostRecord
+
+        with self._db_lock:
+            total = self._conn.execute(
+                "SELECT COALESCE((SELECT SUM(amount_usd) FROM cost_buckets), 0)"
+                " + COALESCE((SELECT SUM(amount_usd) FROM cost_records), 0)"
+            ).fetchone()[0]
+            bucket_rows = self._conn.execute(
+                "SELECT hour, source, model, operation, amount_usd, count,"
+                " input_tokens, output_tokens FROM cost_buckets"
+                " WHERE hour >= ? ORDER BY hour",
+                (since.isoformat() if since else "",),
+            ).fetchall()
+            record_rows = self._conn.execute(
+                "SELECT timestamp, amount_usd, source, model, operation,"
+                " input_tokens, output_tokens, metadata FROM cost_records ORDER BY id"
+            ).fetchall()
+
+        buckets: dict[str, CostBucket] = {}
+        for hour, source, model, operation, amount, count, input_tokens, output_tokens in bucket_rows:
+            bucket = buckets.get(hour)
+            if bucket is None:
+                bucket = buckets[hour] = CostBucket(start=datetime.fromisoformat(hour))
+            bucket.merge(CostBucket(
+                start=bucket.start,
+                amount_usd=amount,
+                count=count,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                by_source={source: amount},
+                by_model={model: amount},
+                by_operation={operation: amount},
+            ))
+
+        records = [
+            CostRecord(
+                amount_usd=amount,
+                timestamp=datetime.fromisoformat(timestamp),
+                source=source,
+                model=model,
+                operation=operation,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                metadata=json.loads(metadata),
+            )
+            for timestamp, amount, source, model, operation, input_tokens, output_tokens, metadata
+            in record_rows
+        ]
+        return LedgerSnapshot(list(buckets.values()), records, total)
+
+    def compact(self) -> None:
+        """Fold all but the newest raw records into hourly totals."""
+        with self._db_lock:
+            row = self._conn.execute("SELECT MAX(id) FROM cost_records").fetchone()
+            if row[0] is None:
+                return
+            last_id = row[0] - self.keep_records
+            if last_id <= 0:
+                return
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO cost_buckets (hour, source, model, operation, amount_usd,"
+                    " count, input_tokens, output_tokens)"
+                    " SELECT hour, source, model, operation, SUM(amount_usd), COUNT(*),"
+                    " SUM(input_tokens), SUM(output_tokens) FROM cost_records"
+                    " WHERE id <= ? GROUP BY hour, source, model, operation"
+                    " ON CONFLICT (hour, source, model, operation) DO UPDATE SET"
+                    " amount_usd = amount_usd + excluded.amount_usd,"
+                    " count = count + excluded.count,"
+                    " input_tokens = input_tokens + excluded.input_tokens,"
+                    " output_tokens = output_tokens + excluded.output_tokens",
+                    (last_id,),
+                )
+                self._conn.execute("DELETE FROM cost_records WHERE id <= ?", (last_id,))
+        logger.debug(f"Compacted cost ledger up to record {last_id}")
+
+    def close(self) -> None:
+        """Commit queued records and close the file."""
+        with self._cond:
+            if self._closing:
+                return
+            self._closing = True
+            self._cond.notify_all()
+        self._writer.join()
+        with self._db_lock:
+            self._conn.close()
+
+    def _run(self) -> None:
+        """Writer thread: commit queued records in batches."""
+        while True:
+            with self._cond:
+                self._cond.wait_for(
+                    lambda: (self._closing or self._flush_now
+                             or len(self._pending) >= self.batch_size),
+                    self.flush_interval,
+                )
+                batch, self._pending = self._pending, []
+                self._flush_now = False
+                closing = self._closing
+            if batch and not self._write(batch) and closing:
+                logger.error(f"Closing cost ledger with {len(self._pending)} records unwritten")
+                return
+            if closing and not batch:
+                return
+
+    def _write(self, batch: list["CostRecord"]) -> bool:
+        started = time.monotonic()
+        rows = [
+            (
+                r.timestamp.replace(minute=0, second=0, microsecond=0).isoformat(),
+                r.timestamp.isoformat(),
+                r.amount_usd,
+                r.source,
+                r.model,
+                r.operation,
+                r.input_tokens,
+                r.output_tokens,
+                json.dumps(r.metadata, default=str),
+            )
+            for r in batch
+        ]
+        try:
+            with self._db_lock, self._conn:
+                self._conn.executemany(
+                    "INSERT INTO cost_records (hour, timestamp, amount_usd, source, model,"
+                    " operation, input_tokens, output_tokens, metadata)"
+                    " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    rows,
+                )
+        except sqlite3.Error as e:
+            logger.error(f"Failed to write {len(batch)} cost records, will retry: {e}")
+            with self._cond:
+                self._pending[:0] = batch
+            time.sleep(self.flush_interval)
+            return False
+
+        with self._cond:
+            self._written += len(batch)
+            self._cond.notify_all()
+        logger.debug(f"Committed {len(batch)} cost records in {time.monotonic() - started:.4f}s")
+
+        self._since_compact += len(batch)
+        if self.compact_threshold and self._since_compact >= self.compact_threshold:
+            self._since_compact = 0
+            try:
+                self.compact()
+            except sqlite3.Error as e:
+                logger.error(f"Cost ledger compaction failed: {e}")
+        return True
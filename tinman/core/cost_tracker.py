@@ -19,15 +19,39 @@ Usage:
 
     # Enforce budget (raises exception if exceeded)
     tracker.enforce_budget()
+
+    # Hold the worst-case cost while a call is in flight
+    reservation = tracker.reserve(0.08, source="experiment_001")
+    try:
+        response = await client.complete(...)
+        tracker.commit(reservation, 0.03, model="gpt-4o")
+    finally:
+        tracker.release(reservation)  # No-op once committed
+
+Budget checks read a running total for the current period, and reports
+read hourly buckets of running totals, so neither depends on how many
+records have been made. Only the most recent raw records are kept.
+
+Concurrent work reserves its worst-case cost before it starts. A
+reservation is refused when the period's spend plus everything already
+reserved would pass the limit, so parallel runs cannot jointly start more
+work than the budget covers; spend goes over the limit only when a single
+operation costs more than it reserved.
 """
 
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Optional
+from typing import TYPE_CHECKING, Any, Callable, Optional
 import threading
 
-from ..utils import get_logger, utc_now
+from ..utils import generate_id, get_logger, utc_now
+from .metrics import get_metrics
+from .pricing import PriceTable
+
+if TYPE_CHECKING:
+    from .cost_ledger import CostLedger, LedgerSnapshot
 
 logger = get_logger("cost_tracker")
 
@@ -55,6 +79,67 @@ class CostRecord:
     metadata: dict[str, Any] = field(default_factory=dict)
 
 
+def _hour_start(ts: datetime) -> datetime:
+    return ts.replace(minute=0, second=0, microsecond=0)
+
+
+@dataclass
+class CostBucket:
+    """Running totals for the costs recorded in one interval."""
+    start: datetime
+    amount_usd: float = 0.0
+    count: int = 0
+    input_tokens: int = 0
+    output_tokens: int = 0
+    by_source: dict[str, float] = field(default_factory=dict)
+    by_model: dict[str, float] = field(default_factory=dict)
+    by_operation: dict[str, float] = field(default_factory=dict)
+
+    def add(self, record: CostRecord) -> None:
+        self.amount_usd += record.amount_usd
+        self.count += 1
+        self.input_tokens += record.input_tokens
+        self.output_tokens += record.output_tokens
+        self.by_source[record.source] = self.by_source.get(record.source, 0) + record.amount_usd
+        self.by_model[record.model] = self.by_model.get(record.model, 0) + record.amount_usd
+        self.by_operation[record.operation] = (
+            self.by_operation.get(record.operation, 0) + record.amount_usd
+        )
+
+    def merge(self, other: "CostBucket") -> None:
+        self.amount_usd += other.amount_usd
+        self.count += other.count
+        self.input_tokens += other.input_tokens
+        self.output_tokens += other.output_tokens
+        for totals, other_totals in ((self.by_source, other.by_source),
+                                     (self.by_model, other.by_model),
+                                     (self.by_operation, other.by_operation)):
+            for key, amount in other_totals.items():
+                totals[key] = totals.get(key, 0) + amount
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "start": self.start.isoformat(),
+            "amount_usd": self.amount_usd,
+            "count": self.count,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "by_source": dict(self.by_source),
+            "by_model": dict(self.by_model),
+            "by_operation": dict(self.by_operation),
+        }
+
+
+@dataclass
+class Reservation:
+    """Budget held for an operation until its actual cost is known."""
+    amount_usd: float
+    source: str
+    operation: str = "unknown"
+    id: str = field(default_factory=generate_id)
+    open: bool = True  # False once committed or released
+
+
 @dataclass
 class BudgetConfig:
     """Configuration for cost budget."""
@@ -98,6 +183,10 @@ class CostTracker:
         period: BudgetPeriod = BudgetPeriod.DAILY,
         on_warning: Optional[Callable[[float, float], None]] = None,
         on_exceeded: Optional[Callable[[float, float], None]] = None,
+        max_records: int = 10000,
+        bucket_retention_hours: int = 24 * 62,
+        ledger: Optional["CostLedger"] = None,
+        prices: Optional[PriceTable] = None,
     ):
         """Initialize cost tracker.
 
@@ -107,6 +196,10 @@ class CostTracker:
             period: Budget period (if using simple limit)
             on_warning: Callback when warning threshold reached
             on_exceeded: Callback when budget exceeded
+            max_records: Most recent raw records kept for get_records
+            bucket_retention_hours: Hourly totals kept for summaries and reports
+            ledger: Persistent ledger; its history is replayed on startup
+            prices: Model prices for estimating and recording call costs
         """
         if budget_config:
             self.config = budget_config
@@ -117,18 +210,31 @@ class CostTracker:
 
         self.on_warning = on_warning
         self.on_exceeded = on_exceeded
+        self.prices = prices or PriceTable()
 
-        # Cost records
-        self._records: list[CostRecord] = []
+        # Cost records: recent raw records plus hourly running totals
+        self._records: deque[CostRecord] = deque(maxlen=max_records)
+        self._buckets: dict[datetime, CostBucket] = {}
+        self._bucket_retention = timedelta(hours=bucket_retention_hours)
         self._lock = threading.Lock()
 
         # Period tracking
         self._period_start = utc_now()
         self._total_ever_usd = 0.0
+        self._period_key: Optional[datetime] = None
+        self._period_cost = 0.0
+
+        # Budget held by in-flight operations
+        self._reserved = 0.0
+        self._open_reservations = 0
 
         # Warning state
         self._warning_issued = False
 
+        self.ledger = ledger
+        if ledger:
+            self._replay(ledger.load(since=self._period_start - self._bucket_retention))
+
         logger.info(
             f"CostTracker initialized: budget=${self.config.limit_usd:.2f}, "
             f"period={self.config.period.value}"
@@ -158,7 +264,7 @@ class CostTracker:
         Returns:
             The recorded CostRecord
         """
-        record = CostRecord(
+        return self._record(CostRecord(
             amount_usd=amount_usd,
             timestamp=utc_now(),
             source=source,
@@ -167,27 +273,172 @@ class CostTracker:
             input_tokens=input_tokens,
             output_tokens=output_tokens,
             metadata=metadata or {},
-        )
+        ))
 
+    def reserve(
+        self,
+        amount_usd: float,
+        source: str,
+        operation: str = "unknown",
+    ) -> Reservation:
+        """Hold budget for an operation before starting it.
+
+        Args:
+            amount_usd: Most the operation can cost
+            source: Component that will incur the cost
+            operation: Operation type
+
+        Returns:
+            A Reservation to pass to commit() or release()
+
+        Raises:
+            BudgetExceededError: If hard_limit is True and the amount does
+                not fit beside current spend and other reservations
+        """
+        limit = self.config.limit_usd
         with self._lock:
-            self._records.append(record)
-            self._total_ever_usd += amount_usd
+            self._roll_period(utc_now())
+            held = self._period_cost + self._reserved
+            if (self.config.hard_limit
+                    and self.config.period != BudgetPeriod.UNLIMITED
+                    and held + amount_usd > limit):
+                raise BudgetExceededError(
+                    held + amount_usd,
+                    limit,
+                    f"Reserving ${amount_usd:.4f} would exceed budget "
+                    f"(spent and reserved: ${held:.4f}, limit: ${limit:.2f})"
+                )
+            self._reserved += amount_usd
+            self._open_reservations += 1
+        return Reservation(amount_usd=amount_usd, source=source, operation=operation)
+
+    def commit(
+        self,
+        reservation: Reservation,
+        amount_usd: float,
+        model: str = "unknown",
+        input_tokens: int = 0,
+        output_tokens: int = 0,
+        metadata: Optional[dict[str, Any]] = None,
+    ) -> CostRecord:
+        """Record the actual cost of a reserved operation and free the reservation.
+
+        The cost is recorded even if it exceeds the amount reserved.
+        """
+        return self._record(CostRecord(
+            amount_usd=amount_usd,
+            timestamp=utc_now(),
+            source=reservation.source,
+            model=model,
+            operation=reservation.operation,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            metadata=metadata or {},
+        ), reservation)
+
+    def release(self, reservation: Reservation) -> None:
+        """Free a reservation without recording a cost (no-op once committed)."""
+        with self._lock:
+            self._close_reservation(reservation)
+
+    def _close_reservation(self, reservation: Reservation) -> None:
+        """Call with the lock held."""
+        if reservation.open:
+            reservation.open = False
+            self._open_reservations -= 1
+            # Reset exactly once nothing is held, so float error cannot accumulate
+            self._reserved = self._reserved - reservation.amount_usd if self._open_reservations else 0.0
+
+    def _record(self, record: CostRecord, reservation: Optional[Reservation] = None) -> CostRecord:
+        with self._lock:
+            # Swap the reservation for the actual cost in one step, so no
+            # concurrent reserve() sees the budget as briefly free
+            if reservation:
+                self._close_reservation(reservation)
+            self._add(record)
+
+        get_metrics().cost_usd_total.labels(
+            source=record.source, model=record.model, operation=record.operation
+        ).inc(record.amount_usd)
 
         # Check thresholds
         self._check_thresholds()
 
         logger.debug(
-            f"Cost recorded: ${amount_usd:.4f} from {source} "
-            f"(model={model}, op={operation})"
+            f"Cost recorded: ${record.amount_usd:.4f} from {record.source} "
+            f"(model={record.model}, op={record.operation})"
         )
 
         return record
 
+    def _add(self, record: CostRecord) -> None:
+        """Fold a record into the running totals. Call with the lock held."""
+        self._records.append(record)
+        self._total_ever_usd += record.amount_usd
+        self._bucket_for(record.timestamp).add(record)
+
+        self._roll_period(record.timestamp)
+        if record.timestamp >= self._period_key:
+            self._period_cost += record.amount_usd
+
+        if self.ledger:
+            self.ledger.append(record)
+
+    def _bucket_for(self, timestamp: datetime) -> CostBucket:
+        hour = _hour_start(timestamp)
+        bucket = self._buckets.get(hour)
+        if bucket is None:
+            bucket = self._buckets[hour] = CostBucket(start=hour)
+            # Buckets are created in time order, so the oldest come first
+            cutoff = hour - self._bucket_retention
+            while (oldest := next(iter(self._buckets))) < cutoff:
+                del self._buckets[oldest]
+        return bucket
+
+    def _replay(self, snapshot: "LedgerSnapshot") -> None:
+        """Rebuild running totals from a ledger's history."""
+        with self._lock:
+            for bucket in snapshot.buckets:
+                self._buckets[bucket.start] = bucket
+            for record in snapshot.records:
+                self._records.append(record)
+                self._bucket_for(record.timestamp).add(record)
+            self._total_ever_usd = snapshot.total_usd
+
+            self._roll_period(utc_now())
+            if self.config.period != BudgetPeriod.SESSION:
+                # Calendar periods start on the hour, so whole buckets add up exactly
+                self._period_cost = sum(
+                    b.amount_usd for hour, b in self._buckets.items()
+                    if hour >= self._period_key
+                )
+
+        logger.info(
+            f"Replayed cost ledger: {len(snapshot.buckets)} hourly totals, "
+            f"{len(snapshot.records)} records, "
+            f"${self.current_period_cost:.4f} spent this period"
+        )
+
+    def _roll_period(self, now: datetime) -> None:
+        """Start a new running total when the budget period changes."""
+        key = self._get_period_start(now)
+        if key != self._period_key:
+            if self._period_key is not None:
+                self._warning_issued = False
+            self._period_key = key
+            self._period_cost = 0.0
+
     def _check_thresholds(self) -> None:
         """Check budget thresholds and trigger callbacks."""
         current = self.current_period_cost
         limit = self.config.limit_usd
 
+        metrics = get_metrics()
+        period = self.config.period.value
+        if limit > 0:
+            metrics.cost_budget_utilization.labels(period=period).set(current / limit)
+        metrics.cost_budget_remaining_usd.labels(period=period).set(max(0.0, limit - current))
+
         # Check warning threshold
         if not self._warning_issued and current >= limit * self.config.warn_threshold:
             self._warning_issued = True
@@ -210,31 +461,31 @@ class CostTracker:
         if self.config.period == BudgetPeriod.UNLIMITED:
             return self._total_ever_usd
 
-        period_start = self._get_period_start()
-
         with self._lock:
-            return sum(
-                r.amount_usd
-                for r in self._records
-                if r.timestamp >= period_start
-            )
+            self._roll_period(utc_now())
+            return self._period_cost
+
+    @property
+    def reserved_budget(self) -> float:
+        """Budget held by reservations not yet committed or released."""
+        return self._reserved
 
     @property
     def remaining_budget(self) -> float:
-        """Get remaining budget for current period."""
+        """Get remaining budget for current period, less open reservations."""
         if self.config.period == BudgetPeriod.UNLIMITED:
             return float("inf")
 
-        return max(0, self.config.limit_usd - self.current_period_cost)
+        return max(0, self.config.limit_usd - self.current_period_cost - self._reserved)
 
     @property
     def total_cost_ever(self) -> float:
         """Get total cost ever recorded."""
         return self._total_ever_usd
 
-    def _get_period_start(self) -> datetime:
-        """Get the start of the current budget period."""
-        now = utc_now()
+    def _get_period_start(self, now: Optional[datetime] = None) -> datetime:
+        """Get the start of the budget period containing ``now``."""
+        now = now or utc_now()
 
         if self.config.period == BudgetPeriod.SESSION:
             return self._period_start
@@ -294,32 +545,27 @@ class CostTracker:
         if current >= limit:
             raise BudgetExceededError(current, limit)
 
-        if estimated_cost > 0 and current + estimated_cost > limit:
+        held = current + self._reserved
+        if estimated_cost > 0 and held + estimated_cost > limit:
             raise BudgetExceededError(
-                current + estimated_cost,
+                held + estimated_cost,
                 limit,
                 f"Estimated cost ${estimated_cost:.4f} would exceed budget "
-                f"(current: ${current:.4f}, limit: ${limit:.2f})"
+                f"(current: ${current:.4f}, reserved: ${self._reserved:.4f}, "
+                f"limit: ${limit:.2f})"
             )
 
     def get_summary(self) -> dict[str, Any]:
-        """Get cost summary."""
+        """Get cost summary over the retained hourly totals."""
+        totals = CostBucket(start=self._period_start)
         with self._lock:
-            records = list(self._records)
-
-        # Calculate by source
-        by_source: dict[str, float] = {}
-        by_model: dict[str, float] = {}
-        by_operation: dict[str, float] = {}
-
-        for r in records:
-            by_source[r.source] = by_source.get(r.source, 0) + r.amount_usd
-            by_model[r.model] = by_model.get(r.model, 0) + r.amount_usd
-            by_operation[r.operation] = by_operation.get(r.operation, 0) + r.amount_usd
+            for bucket in self._buckets.values():
+                totals.merge(bucket)
 
         return {
             "current_period_cost_usd": self.current_period_cost,
             "remaining_budget_usd": self.remaining_budget,
+            "reserved_budget_usd": self._reserved,
             "total_cost_ever_usd": self._total_ever_usd,
             "budget_limit_usd": self.config.limit_usd,
             "budget_period": self.config.period.value,
@@ -327,12 +573,53 @@ class CostTracker:
                 self.current_period_cost / self.config.limit_usd * 100
                 if self.config.limit_usd > 0 else 0
             ),
-            "record_count": len(records),
-            "by_source": by_source,
-            "by_model": by_model,
-            "by_operation": by_operation,
+            "record_count": totals.count,
+            "by_source": totals.by_source,
+            "by_model": totals.by_model,
+            "by_operation": totals.by_operation,
         }
 
+    def cost_between(self, start: datetime, end: Optional[datetime] = None) -> float:
+        """Total cost recorded between two times, to the hour.
+
+        Reads the hourly totals, so hours that only partly overlap the
+        range are counted in full.
+        """
+        first = _hour_start(start)
+        with self._lock:
+            return sum(
+                b.amount_usd for hour, b in self._buckets.items()
+                if hour >= first and (end is None or hour < end)
+            )
+
+    def get_cost_over_time(
+        self,
+        granularity: str = "hour",
+        since: Optional[datetime] = None,
+    ) -> list[dict[str, Any]]:
+        """Running totals per hour or day, oldest first.
+
+        Args:
+            granularity: "hour" or "day"
+            since: Only intervals from this time
+
+        Returns:
+            One dict per interval with costs by source, model and operation
+        """
+        if granularity not in ("hour", "day"):
+            raise ValueError(f"Unknown granularity: {granularity}")
+        first = _hour_start(since) if since else None
+        intervals: dict[datetime, CostBucket] = {}
+        with self._lock:
+            for hour, bucket in self._buckets.items():
+                if first and hour < first:
+                    continue
+                start = hour if granularity == "hour" else hour.replace(hour=0)
+                if start not in intervals:
+                    intervals[start] = CostBucket(start=start)
+                intervals[start].merge(bucket)
+        return [intervals[start].to_dict() for start in sorted(intervals)]
+
     def get_records(
         self,
         since: Optional[datetime] = None,
@@ -351,20 +638,16 @@ class CostTracker:
         Returns:
             List of matching CostRecord objects
         """
+        matches: list[CostRecord] = []
         with self._lock:
-            records = list(self._records)
-
-        if since:
-            records = [r for r in records if r.timestamp >= since]
-
-        if source:
-            records = [r for r in records if r.source == source]
-
-        if model:
-            records = [r for r in records if r.model == model]
-
-        # Return most recent first
-        return sorted(records, key=lambda r: r.timestamp, reverse=True)[:limit]
+            # Records are appended in time order, so walk back from the newest
+            for r in reversed(self._records):
+                if len(matches) >= limit or (since and r.timestamp < since):
+                    break
+                if (source and r.source != source) or (model and r.model != model):
+                    continue
+                matches.append(r)
+        return matches
 
     def reset_period(self) -> None:
         """Reset the current budget period.
@@ -375,17 +658,25 @@ class CostTracker:
         self._warning_issued = False
         self._period_start = utc_now()
 
-        if not self.config.rollover:
-            # Clear records for new period
-            with self._lock:
+        with self._lock:
+            self._roll_period(self._period_start)
+            if not self.config.rollover:
+                # Clear records for new period
                 period_start = self._get_period_start()
-                self._records = [
-                    r for r in self._records
-                    if r.timestamp >= period_start
-                ]
+                kept = [r for r in self._records if r.timestamp >= period_start]
+                self._records.clear()
+                self._records.extend(kept)
+                first_hour = _hour_start(period_start)
+                for hour in [h for h in self._buckets if h < first_hour]:
+                    del self._buckets[hour]
 
         logger.info("Budget period reset")
 
+    def close(self) -> None:
+        """Commit pending ledger writes and close the ledger."""
+        if self.ledger:
+            self.ledger.close()
+
 
 # Default tracker instance
 _default_tracker: Optional[CostTracker] = None
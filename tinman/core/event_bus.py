@@ -2,12 +2,20 @@
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Callable, Optional
-from collections import defaultdict
+from itertools import islice
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Callable, Optional
+from collections import defaultdict, deque
 import asyncio
+import json
 import threading
+import time
 
 from ..utils import generate_id, utc_now, get_logger
+from .metrics import get_metrics
+
+if TYPE_CHECKING:
+    from .event_transport import EventTransport
 
 logger = get_logger("event_bus")
 
@@ -22,10 +30,120 @@ class Event:
     correlation_id: Optional[str] = None
     causation_id: Optional[str] = None
 
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "topic": self.topic,
+            "timestamp": self.timestamp.isoformat(),
+            "data": self.data,
+            "correlation_id": self.correlation_id,
+            "causation_id": self.causation_id,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Event":
+        return cls(
+            id=data["id"],
+            topic=data["topic"],
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            data=data.get("data", {}),
+            correlation_id=data.get("correlation_id"),
+            causation_id=data.get("causation_id"),
+        )
+
 
 EventHandler = Callable[[Event], None]
 AsyncEventHandler = Callable[[Event], Any]
 
+DISPATCH_MODES = ("inline", "queued")
+OVERFLOW_POLICIES = ("drop", "block")
+
+# Resolved handler lists kept before the cache is reset
+MAX_RESOLVED_TOPICS = 4096
+
+
+class _TrieNode:
+    __slots__ = ("children", "pattern")
+
+    def __init__(self):
+        self.children: dict[str, "_TrieNode"] = {}
+        self.pattern: Optional[str] = None
+
+
+class TopicTrie:
+    """Subscription patterns indexed by dotted topic segment.
+
+    ``*`` matches exactly one segment and ``#`` matches zero or more, so
+    ``experiment.*`` matches ``experiment.created`` but not
+    ``experiment.run.completed``, and ``intervention.#`` matches
+    ``intervention`` and every topic below it. Matching walks one trie
+    level per segment instead of testing every pattern.
+    """
+
+    def __init__(self):
+        self._root = _TrieNode()
+
+    @staticmethod
+    def validate(pattern: str) -> list[str]:
+        segments = pattern.split(".")
+        for segment in segments:
+            if not segment or (segment not in ("*", "#") and ("*" in segment or "#" in segment)):
+                raise ValueError(f"Invalid topic pattern: {pattern!r}")
+        return segments
+
+    def add(self, pattern: str) -> None:
+        node = self._root
+        for segment in self.validate(pattern):
+            node = node.children.setdefault(segment, _TrieNode())
+        node.pattern = pattern
+
+    def remove(self, pattern: str) -> None:
+        segments = pattern.split(".")
+        path = [self._root]
+        for segment in segments:
+            node = path[-1].children.get(segment)
+            if node is None:
+                return
+            path.append(node)
+        path[-1].pattern = None
+        # Prune branches left without patterns
+        for depth in range(len(segments), 0, -1):
+            node = path[depth]
+            if node.pattern is not None or node.children:
+                break
+            del path[depth - 1].children[segments[depth - 1]]
+
+    def match(self, topic: str) -> list[str]:
+        """Patterns matching a concrete topic."""
+        matches: dict[str, None] = {}
+        self._match(self._root, topic.split("."), 0, matches)
+        return list(matches)
+
+    def _match(self, node: _TrieNode, segments: list[str], i: int,
+               matches: dict[str, None]) -> None:
+        if i == len(segments):
+            if node.pattern is not None:
+                matches[node.pattern] = None
+        else:
+            for key in (segments[i], "*"):
+                child = node.children.get(key)
+                if child is not None:
+                    self._match(child, segments, i + 1, matches)
+        multi = node.children.get("#")
+        if multi is not None:
+            for j in range(i, len(segments) + 1):
+                self._match(multi, segments, j, matches)
+
+
+@dataclass(eq=False)
+class _QueuedHandler:
+    """A subscriber's event queue and the task that drains it."""
+    topic: str  # Subscribed topic or pattern
+    handler: Callable[[Event], Any]
+    is_async: bool
+    queue: asyncio.Queue
+    worker: Optional[asyncio.Task] = None
+
 
 class EventBus:
     """
@@ -33,34 +151,118 @@ class EventBus:
 
     Supports both sync and async handlers. Errors in handlers are logged
     but don't prevent other handlers from executing.
+
+    Handlers can subscribe to an exact topic or a pattern such as
+    ``experiment.*`` or ``intervention.#`` (see ``TopicTrie``). The
+    handlers for each published topic are resolved once and cached until
+    the next subscribe or unsubscribe.
+
+    History is kept in ring buffers: one across all topics and one per
+    topic, so publishing is O(1) and a topic's recent events are found
+    without scanning the others. Events that fall off the global ring can
+    be appended to a JSON-lines spill file.
+
+    In ``queued`` dispatch mode each subscriber gets a bounded asyncio
+    queue drained by its own worker task, so publishing only enqueues and
+    a slow handler delays nothing but its own backlog. When a queue is
+    full the event is dropped for that subscriber (``drop``) or
+    ``publish_async`` waits for room (``block``); sync ``publish`` cannot
+    wait and drops under either policy. Publishing with no event loop
+    running falls back to inline dispatch. Call ``flush()`` before
+    shutdown to let the queues drain.
+
+    With a transport (see ``event_transport``), published events are also
+    forwarded to the buses of other processes, and events they publish are
+    dispatched here. ``connect()`` and ``disconnect()`` start and stop it.
     """
 
-    def __init__(self):
+    def __init__(self,
+                 max_history: int = 1000,
+                 topic_history: int = 256,
+                 spill_path: Optional[str] = None,
+                 dispatch: str = "inline",
+                 queue_size: int = 1000,
+                 overflow: str = "drop",
+                 transport: Optional["EventTransport"] = None):
+        """
+        Args:
+            max_history: Events kept across all topics
+            topic_history: Events kept per topic
+            spill_path: File that evicted events are appended to (optional)
+            dispatch: "inline" to call handlers on publish, "queued" for worker tasks
+            queue_size: Events buffered per subscriber in queued mode
+            overflow: "drop" or "block" when a subscriber's queue is full
+            transport: Forwards events to buses in other processes (optional)
+        """
+        if dispatch not in DISPATCH_MODES:
+            raise ValueError(f"Unknown dispatch mode: {dispatch}")
+        if overflow not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {overflow}")
         self._sync_handlers: dict[str, list[EventHandler]] = defaultdict(list)
         self._async_handlers: dict[str, list[AsyncEventHandler]] = defaultdict(list)
+        self._topics = TopicTrie()
+        self._resolved: dict[str, tuple[list[tuple[str, EventHandler]],
+                                        list[tuple[str, AsyncEventHandler]]]] = {}
         self._lock = threading.Lock()
-        self._event_history: list[Event] = []
-        self._max_history = 1000
+        self._max_history = max_history
+        self._event_history: deque[Event] = deque(maxlen=max_history)
+        self._topic_history: dict[str, deque[Event]] = defaultdict(
+            lambda: deque(maxlen=topic_history)
+        )
+        self._spill_path = Path(spill_path) if spill_path else None
+        self._spill_file: Optional[IO[str]] = None
+        self.dispatch = dispatch
+        self.queue_size = queue_size
+        self.overflow = overflow
+        self._queued: dict[tuple[str, int, bool], _QueuedHandler] = {}
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.transport = transport
+
+    async def connect(self) -> None:
+        """Start exchanging events with other processes."""
+        if self.transport:
+            await self.transport.start(self)
+
+    async def disconnect(self, timeout: Optional[float] = None) -> None:
+        """Stop the transport, first waiting for forwarded events to be acknowledged."""
+        if self.transport:
+            await self.transport.close(timeout)
 
     def subscribe(self, topic: str, handler: EventHandler) -> None:
-        """Register a synchronous handler for a topic."""
+        """Register a synchronous handler for a topic or pattern."""
         with self._lock:
+            self._topics.add(topic)
             self._sync_handlers[topic].append(handler)
+            self._resolved.clear()
         logger.debug(f"Subscribed sync handler to topic: {topic}")
 
     def subscribe_async(self, topic: str, handler: AsyncEventHandler) -> None:
-        """Register an async handler for a topic."""
+        """Register an async handler for a topic or pattern."""
         with self._lock:
+            self._topics.add(topic)
             self._async_handlers[topic].append(handler)
+            self._resolved.clear()
         logger.debug(f"Subscribed async handler to topic: {topic}")
 
     def unsubscribe(self, topic: str, handler: EventHandler) -> None:
-        """Remove a handler from a topic."""
+        """Remove a handler from a topic or pattern."""
         with self._lock:
-            if handler in self._sync_handlers[topic]:
-                self._sync_handlers[topic].remove(handler)
-            if handler in self._async_handlers[topic]:
-                self._async_handlers[topic].remove(handler)
+            sync_handlers = self._sync_handlers.get(topic, [])
+            async_handlers = self._async_handlers.get(topic, [])
+            if handler in sync_handlers:
+                sync_handlers.remove(handler)
+            if handler in async_handlers:
+                async_handlers.remove(handler)
+            for is_async, handlers in ((False, sync_handlers), (True, async_handlers)):
+                if handler not in handlers:
+                    queued = self._queued.pop((topic, id(handler), is_async), None)
+                    if queued and queued.worker:
+                        queued.worker.cancel()
+            if not sync_handlers and not async_handlers:
+                self._sync_handlers.pop(topic, None)
+                self._async_handlers.pop(topic, None)
+                self._topics.remove(topic)
+            self._resolved.clear()
 
     def publish(self, topic: str, data: dict[str, Any],
                 correlation_id: Optional[str] = None,
@@ -78,7 +280,10 @@ class EventBus:
         )
 
         self._store_event(event)
-        self._dispatch_sync(topic, event)
+        if not (self.dispatch == "queued" and self._enqueue_from_sync(event)):
+            self._dispatch_sync(topic, event)
+        if self.transport:
+            self.transport.send(event)
 
         logger.debug(f"Published event: {topic} (id={event.id})")
         return event
@@ -98,38 +303,179 @@ class EventBus:
             causation_id=causation_id,
         )
 
-        self._store_event(event)
-        self._dispatch_sync(topic, event)
-        await self._dispatch_async(topic, event)
+        await self.deliver(event)
+        if self.transport:
+            self.transport.send(event)
 
         logger.debug(f"Published async event: {topic} (id={event.id})")
         return event
 
+    async def deliver(self, event: Event) -> None:
+        """Record and dispatch an existing event without forwarding it.
+
+        Used by transports for events published in another process.
+        """
+        self._store_event(event)
+        if self.dispatch == "queued":
+            await self._enqueue(event, wait=self.overflow == "block")
+        else:
+            self._dispatch_sync(event.topic, event)
+            await self._dispatch_async(event.topic, event)
+
     def _store_event(self, event: Event) -> None:
         """Store event in history (bounded)."""
         with self._lock:
+            if (self._spill_path is not None
+                    and len(self._event_history) == self._max_history
+                    and self._max_history > 0):
+                self._spill(self._event_history[0])
             self._event_history.append(event)
-            if len(self._event_history) > self._max_history:
-                self._event_history = self._event_history[-self._max_history:]
+            self._topic_history[event.topic].append(event)
+
+    def _spill(self, event: Event) -> None:
+        """Append an evicted event to the spill file."""
+        try:
+            if self._spill_file is None:
+                self._spill_path.parent.mkdir(parents=True, exist_ok=True)
+                self._spill_file = open(self._spill_path, "a", encoding="utf-8")
+            self._spill_file.write(json.dumps(event.to_dict(), default=str) + "\n")
+        except OSError as e:
+            logger.error(f"Failed to spill event {event.id} to {self._spill_path}: {e}")
+
+    def _resolve(self, topic: str) -> tuple[list[tuple[str, EventHandler]],
+                                            list[tuple[str, AsyncEventHandler]]]:
+        """(pattern, handler) pairs for a topic. Call with the lock held.
+
+        The lists are replaced rather than mutated, so callers can iterate
+        them after releasing the lock.
+        """
+        resolved = self._resolved.get(topic)
+        if resolved is None:
+            patterns = self._topics.match(topic)
+            resolved = (
+                [(p, h) for p in patterns for h in self._sync_handlers.get(p, ())],
+                [(p, h) for p in patterns for h in self._async_handlers.get(p, ())],
+            )
+            if len(self._resolved) >= MAX_RESOLVED_TOPICS:
+                self._resolved.clear()
+            self._resolved[topic] = resolved
+        return resolved
 
     def _dispatch_sync(self, topic: str, event: Event) -> None:
         """Dispatch to synchronous handlers."""
         with self._lock:
-            handlers = list(self._sync_handlers[topic])
+            handlers = self._resolve(topic)[0]
+
+        for _, handler in handlers:
+            self._safe_call_sync(handler, event, topic)
+
+    def _safe_call_sync(self, handler: EventHandler, event: Event, topic: str) -> None:
+        """Call sync handler with error handling."""
+        try:
+            handler(event)
+        except Exception as e:
+            logger.error(f"Error in sync handler for {topic}: {e}")
+
+    def _enqueue_from_sync(self, event: Event) -> bool:
+        """Queue an event from sync code; False if no loop can take it."""
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            loop = self._loop
+            if loop is None or loop.is_closed() or not loop.is_running():
+                return False
+            # Published from another thread: hand over to the bus's loop
+            loop.call_soon_threadsafe(self._enqueue_nowait, event)
+            return True
+        self._enqueue_nowait(event)
+        return True
+
+    def _enqueue_nowait(self, event: Event) -> None:
+        enqueued_at = time.monotonic()
+        for queued in self._queued_handlers(event.topic):
+            try:
+                queued.queue.put_nowait((event, enqueued_at))
+            except asyncio.QueueFull:
+                self._record_drop(queued, event)
+
+    async def _enqueue(self, event: Event, wait: bool) -> None:
+        enqueued_at = time.monotonic()
+        for queued in self._queued_handlers(event.topic):
+            if wait:
+                await queued.queue.put((event, enqueued_at))
+                continue
+            try:
+                queued.queue.put_nowait((event, enqueued_at))
+            except asyncio.QueueFull:
+                self._record_drop(queued, event)
 
-        for handler in handlers:
+    def _queued_handlers(self, topic: str) -> list[_QueuedHandler]:
+        """Queues for a topic's handlers, starting workers on first use."""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            if self._loop is not loop:
+                # Queues and workers belong to the loop they were made on
+                self._loop = loop
+                self._queued.clear()
+            sync_handlers, async_handlers = self._resolve(topic)
+            subscribers = [(p, h, False) for p, h in sync_handlers]
+            subscribers += [(p, h, True) for p, h in async_handlers]
+            queued_handlers = []
+            for pattern, handler, is_async in subscribers:
+                key = (pattern, id(handler), is_async)
+                queued = self._queued.get(key)
+                if queued is None:
+                    queued = _QueuedHandler(
+                        pattern, handler, is_async, asyncio.Queue(maxsize=self.queue_size)
+                    )
+                    queued.worker = loop.create_task(self._drain(queued))
+                    self._queued[key] = queued
+                queued_handlers.append(queued)
+        return queued_handlers
+
+    async def _drain(self, queued: _QueuedHandler) -> None:
+        """Worker: deliver a subscriber's events in order."""
+        lag = get_metrics().event_delivery_lag_seconds.labels(topic=queued.topic)
+        while True:
+            event, enqueued_at = await queued.queue.get()
             try:
-                handler(event)
-            except Exception as e:
-                logger.error(f"Error in sync handler for {topic}: {e}")
+                lag.observe(time.monotonic() - enqueued_at)
+                if queued.is_async:
+                    await self._safe_call_async(queued.handler, event, queued.topic)
+                else:
+                    self._safe_call_sync(queued.handler, event, queued.topic)
+            finally:
+                queued.queue.task_done()
+
+    def _record_drop(self, queued: _QueuedHandler, event: Event) -> None:
+        get_metrics().events_dropped_total.labels(topic=queued.topic).inc()
+        logger.warning(f"Dropped event {event.id} for a slow {queued.topic} subscriber")
+
+    async def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait for queued events to be handled.
+
+        Returns False if the timeout expired first.
+        """
+        with self._lock:
+            queues = [q.queue for q in self._queued.values()]
+        if not queues:
+            return True
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(queue.join() for queue in queues)), timeout
+            )
+        except asyncio.TimeoutError:
+            logger.warning("Event bus flush timed out with events still queued")
+            return False
+        return True
 
     async def _dispatch_async(self, topic: str, event: Event) -> None:
         """Dispatch to async handlers."""
         with self._lock:
-            handlers = list(self._async_handlers[topic])
+            handlers = self._resolve(topic)[1]
 
         tasks = []
-        for handler in handlers:
+        for _, handler in handlers:
             tasks.append(self._safe_call_async(handler, event, topic))
 
         if tasks:
@@ -147,23 +493,41 @@ class EventBus:
 
     def get_history(self, topic: Optional[str] = None,
                     limit: int = 100) -> list[Event]:
-        """Get recent event history, optionally filtered by topic."""
+        """Get recent event history, optionally filtered by topic.
+
+        Returns up to ``limit`` events, oldest first.
+        """
         with self._lock:
-            events = self._event_history
             if topic:
-                events = [e for e in events if e.topic == topic]
-            return events[-limit:]
+                events = self._topic_history.get(topic, ())
+            else:
+                events = self._event_history
+            recent = list(islice(reversed(events), max(limit, 0)))
+        recent.reverse()
+        return recent
 
     def clear_history(self) -> None:
-        """Clear event history."""
+        """Clear event history (spilled events are kept)."""
+        with self._lock:
+            self._event_history.clear()
+            self._topic_history.clear()
+
+    def close(self) -> None:
+        """Stop queue workers, then flush and close the spill file."""
         with self._lock:
-            self._event_history = []
+            for queued in self._queued.values():
+                if queued.worker:
+                    queued.worker.cancel()
+            self._queued.clear()
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
 
     def get_subscriber_count(self, topic: str) -> int:
-        """Get number of subscribers for a topic."""
+        """Get number of subscribers for a topic, including pattern matches."""
         with self._lock:
-            return (len(self._sync_handlers[topic]) +
-                    len(self._async_handlers[topic]))
+            sync_handlers, async_handlers = self._resolve(topic)
+            return len(sync_handlers) + len(async_handlers)
 
 
 # Event topics used by the system
@@ -175,6 +539,7 @@ class Topics:
     FAILURE_DISCOVERED = "failure.discovered"
     INTERVENTION_PROPOSED = "intervention.proposed"
     SIMULATION_COMPLETED = "simulation.completed"
+    APPROVAL_REQUESTED = "approval.requested"
     INTERVENTION_APPROVED = "intervention.approved"
     INTERVENTION_REJECTED = "intervention.rejected"
     DEPLOYMENT_COMPLETED = "deployment.completed"
@@ -0,0 +1,335 @@
+"""Cross-process transports for the event bus.
+
+An ``EventBus`` only reaches handlers in its own process, so with several
+service workers an approval published in one never reaches the TUI or
+webhook subscribers attached to another. A transport forwards every
+locally published event to the buses in the other processes, which
+dispatch it to their own subscribers as if it had been published there.
+
+``UnixSocketTransport`` needs no broker. Each process listens on its own
+socket in a shared directory and connects to every other socket it finds
+there. Events are sent in length-prefixed JSON batches:
+
+- each batch is kept until the peer acknowledges it and is resent after
+  a reconnect, so delivery is at-least-once;
+- receivers skip event ids they have recently dispatched, so a resent
+  batch does not normally run handlers twice;
+- a peer whose socket refuses connections has exited; its socket file is
+  removed and its undelivered events are dropped.
+
+Anyone who can write to the socket directory can read and inject events,
+so the directory must belong to the current user and be closed to group
+and others. It is created that way, and an existing directory that is
+not is refused.
+
+Usage:
+    transport = UnixSocketTransport("/run/tinman/events")
+    bus = EventBus(transport=transport)
+    await bus.connect()
+    bus.publish(Topics.APPROVAL_REQUESTED, {...})  # reaches every worker
+    await bus.disconnect()
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Optional, Union
+import asyncio
+import json
+import os
+import stat
+import struct
+import tempfile
+import time
+
+from ..utils import generate_id, get_logger
+from .metrics import get_metrics
+
+if TYPE_CHECKING:
+    from .event_bus import Event, EventBus
+
+logger = get_logger("event_transport")
+
+_HEADER = struct.Struct(">I")
+MAX_FRAME_BYTES = 16 * 1024 * 1024
+
+
+def default_socket_dir() -> Path:
+    """Socket directory shared by processes of the same user."""
+    runtime_dir = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime_dir:
+        return Path(runtime_dir) / "tinman-events"
+    return Path(tempfile.gettempdir()) / f"tinman-events-{os.getuid()}"
+
+
+def ensure_private_dir(path: Path) -> None:
+    """Create ``path`` accessible only to this user, or check that it is.
+
+    Raises:
+        PermissionError: If ``path`` exists but is not a directory owned by
+            this user with no group or other permissions (for example, one
+            pre-created by another local user)
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        path.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+    info = os.lstat(path)
+    if (not stat.S_ISDIR(info.st_mode)
+            or info.st_uid != os.getuid()
+            or info.st_mode & (stat.S_IRWXG | stat.S_IRWXO)):
+        raise PermissionError(
+            f"Refusing event socket directory {path}: it must be a directory "
+            f"owned by uid {os.getuid()} with no group or other permissions"
+        )
+
+
+class EventTransport(ABC):
+    """Carries events between EventBus instances in different processes."""
+
+    @abstractmethod
+    async def start(self, bus: "EventBus") -> None:
+        """Start delivering remote events to ``bus``."""
+
+    @abstractmethod
+    def send(self, event: "Event") -> None:
+        """Queue a locally published event for other processes. Must not block."""
+
+    @abstractmethod
+    async def close(self, timeout: Optional[float] = None) -> None:
+        """Stop, first waiting up to ``timeout`` for queued events to be acknowledged."""
+
+
+async def _write_frame(writer: asyncio.StreamWriter, payload: dict[str, Any]) -> None:
+    body = json.dumps(payload, default=str).encode()
+    writer.write(_HEADER.pack(len(body)) + body)
+    await writer.drain()
+
+
+async def _read_frame(reader: asyncio.StreamReader) -> dict[str, Any]:
+    (size,) = _HEADER.unpack(await reader.readexactly(_HEADER.size))
+    if size > MAX_FRAME_BYTES:
+        raise ValueError(f"Event frame too large: {size} bytes")
+    return json.loads(await reader.readexactly(size))
+
+
+@dataclass(eq=False)
+class _Peer:
+    path: Path
+    pending: deque = field(default_factory=deque)  # Events not yet sent
+    unacked: "OrderedDict[int, list[dict[str, Any]]]" = field(default_factory=OrderedDict)
+    next_seq: int = 0
+    wake: asyncio.Event = field(default_factory=asyncio.Event)
+    task: Optional[asyncio.Task] = None
+
+    @property
+    def idle(self) -> bool:
+        return not self.pending and not self.unacked
+
+
+class UnixSocketTransport(EventTransport):
+    """Broker-less event fan-out over Unix domain sockets."""
+
+    def __init__(self,
+                 directory: Optional[Union[str, Path]] = None,
+                 batch_size: int = 64,
+                 batch_window_ms: float = 2.0,
+                 max_pending: int = 10000,
+                 peer_refresh_seconds: float = 1.0,
+                 dedupe_window: int = 10000):
+        """
+        Args:
+            directory: Directory holding one socket per process
+            batch_size: Events sent per frame at most
+            batch_window_ms: How long to wait for a batch to fill
+            max_pending: Unsent events kept per peer before the oldest are dropped
+            peer_refresh_seconds: How often to look for new processes
+            dedupe_window: Recently received event ids remembered
+        """
+        self.directory = Path(directory) if directory else default_socket_dir()
+        self.batch_size = max(1, batch_size)
+        self.batch_window = batch_window_ms / 1000.0
+        self.max_pending = max_pending
+        self.peer_refresh_seconds = peer_refresh_seconds
+        self.dedupe_window = dedupe_window
+        self.path = self.directory / f"{os.getpid()}-{generate_id()[:8]}.sock"
+        self._bus: Optional["EventBus"] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._refresher: Optional[asyncio.Task] = None
+        self._peers: dict[Path, _Peer] = {}
+        self._seen: OrderedDict[str, None] = OrderedDict()
+        self._connections: set[asyncio.StreamWriter] = set()
+        self._closing = False
+
+    async def start(self, bus: "EventBus") -> None:
+        self._bus = bus
+        self._loop = asyncio.get_running_loop()
+        self._closing = False
+        ensure_private_dir(self.directory)
+        self._server = await asyncio.start_unix_server(self._serve, path=str(self.path))
+        self._refresh_peers()
+        self._refresher = asyncio.create_task(self._refresh_loop())
+        logger.info(f"Event transport listening on {self.path}")
+
+    def send(self, event: "Event") -> None:
+        loop = self._loop
+        if loop is None or self._closing:
+            return
+        data = event.to_dict()
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is loop:
+            self._enqueue(data)
+        elif loop.is_running():
+            loop.call_soon_threadsafe(self._enqueue, data)
+
+    async def close(self, timeout: Optional[float] = None) -> None:
+        if self._loop is None:
+            return
+        if timeout:
+            deadline = time.monotonic() + timeout
+            while any(not p.idle for p in self._peers.values()) and time.monotonic() < deadline:
+                await asyncio.sleep(0.01)
+        self._closing = True
+        tasks = [p.task for p in self._peers.values() if p.task]
+        if self._refresher:
+            tasks.append(self._refresher)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        undelivered = sum(len(p.pending) + sum(map(len, p.unacked.values()))
+                          for p in self._peers.values())
+        if undelivered:
+            logger.warning(f"Event transport closed with {undelivered} events unacknowledged")
+        self._peers.clear()
+        if self._server:
+            self._server.close()
+            for writer in list(self._connections):
+                writer.close()
+            await self._server.wait_closed()
+        self.path.unlink(missing_ok=True)
+        self._loop = None
+
+    # Sending
+
+    def _enqueue(self, data: dict[str, Any]) -> None:
+        for peer in self._peers.values():
+            if len(peer.pending) >= self.max_pending:
+                peer.pending.popleft()
+                get_metrics().event_transport_events_total.labels(direction="dropped").inc()
+            peer.pending.append(data)
+            peer.wake.set()
+
+    def _refresh_peers(self) -> None:
+        for path in self.directory.glob("*.sock"):
+            if path != self.path and path not in self._peers:
+                peer = _Peer(path)
+                peer.task = asyncio.create_task(self._run_peer(peer))
+                self._peers[path] = peer
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.peer_refresh_seconds)
+            try:
+                self._refresh_peers()
+            except OSError as e:
+                logger.error(f"Failed to list event sockets in {self.directory}: {e}")
+
+    async def _run_peer(self, peer: _Peer) -> None:
+        """Keep a connection to one peer, resending unacknowledged batches."""
+        while True:
+            try:
+                reader, writer = await asyncio.open_unix_connection(str(peer.path))
+            except (ConnectionRefusedError, FileNotFoundError):
+                self._drop_peer(peer)
+                return
+            acks = asyncio.create_task(self._read_acks(peer, reader))
+            try:
+                for seq, batch in list(peer.unacked.items()):
+                    await _write_frame(writer, {"seq": seq, "events": batch})
+                    get_metrics().event_transport_events_total.labels(
+                        direction="resent").inc(len(batch))
+                await self._send_batches(peer, writer, acks)
+            except (ConnectionError, asyncio.IncompleteReadError, OSError, ValueError) as e:
+                logger.debug(f"Lost event peer {peer.path.name}: {e}")
+            finally:
+                acks.cancel()
+                writer.close()
+            await asyncio.sleep(0.05)
+
+    async def _send_batches(self, peer: _Peer, writer: asyncio.StreamWriter,
+                            acks: asyncio.Task) -> None:
+        sent = get_metrics().event_transport_events_total.labels(direction="sent")
+        while not acks.done():
+            if not peer.pending:
+                peer.wake.clear()
+                waiter = asyncio.create_task(peer.wake.wait())
+                await asyncio.wait({waiter, acks}, return_when=asyncio.FIRST_COMPLETED)
+                waiter.cancel()
+                continue
+            if len(peer.pending) < self.batch_size and self.batch_window:
+                await asyncio.sleep(self.batch_window)
+            while peer.pending:
+                batch = [peer.pending.popleft()
+                         for _ in range(min(self.batch_size, len(peer.pending)))]
+                seq = peer.next_seq
+                peer.next_seq += 1
+                peer.unacked[seq] = batch
+                await _write_frame(writer, {"seq": seq, "events": batch})
+                sent.inc(len(batch))
+        # Surface the error that ended the ack reader
+        acks.result()
+
+    async def _read_acks(self, peer: _Peer, reader: asyncio.StreamReader) -> None:
+        while True:
+            frame = await _read_frame(reader)
+            peer.unacked.pop(frame["ack"], None)
+
+    def _drop_peer(self, peer: _Peer) -> None:
+        lost = len(peer.pending) + sum(map(len, peer.unacked.values()))
+        if lost:
+            logger.warning(f"Event peer {peer.path.name} is gone; dropping {lost} events")
+        self._peers.pop(peer.path, None)
+        # Nothing listens on a refused socket: its process exited
+        if peer.path.exists():
+            try:
+                peer.path.unlink()
+            except OSError:
+                pass
+
+    # Receiving
+
+    async def _serve(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        from .event_bus import Event
+
+        received = get_metrics().event_transport_events_total.labels(direction="received")
+        duplicate = get_metrics().event_transport_events_total.labels(direction="duplicate")
+        self._connections.add(writer)
+        try:
+            while True:
+                frame = await _read_frame(reader)
+                for data in frame["events"]:
+                    if data["id"] in self._seen:
+                        duplicate.inc()
+                        continue
+                    self._remember(data["id"])
+                    received.inc()
+                    await self._bus.deliver(Event.from_dict(data))
+                await _write_frame(writer, {"ack": frame["seq"]})
+        except (asyncio.IncompleteReadError, ConnectionError):
+            pass
+        except Exception as e:
+            logger.error(f"Event transport connection failed: {e}")
+        finally:
+            self._connections.discard(writer)
+            writer.close()
+
+    def _remember(self, event_id: str) -> None:
+        self._seen[event_id] = None
+        if len(self._seen) > self.dedupe_window:
+            self._seen.popitem(last=False)
@@ -288,6 +288,127 @@ class TinmanMetrics:
             **kwargs,
         )
 
+        self.llm_retries_total = Counter(
+            "tinman_llm_retries_total",
+            "LLM request retries after transient errors",
+            ["provider", "reason"],  # reason: rate_limited/server_error/timeout/connection
+            **kwargs,
+        )
+
+        self.llm_retries_exhausted_total = Counter(
+            "tinman_llm_retries_exhausted_total",
+            "LLM requests that failed after exhausting retries",
+            ["provider"],
+            **kwargs,
+        )
+
+        self.llm_rate_limit_wait_seconds = Histogram(
+            "tinman_llm_rate_limit_wait_seconds",
+            "Time spent waiting on client-side rate limits",
+            ["provider", "limit"],  # limit: rpm/tpm
+            buckets=(0.01, 0.1, 0.5, 1, 2, 5, 10, 30, 60),
+            **kwargs,
+        )
+
+        self.llm_judge_batch_size = Histogram(
+            "tinman_llm_judge_batch_size",
+            "Items per batched failure-analysis call",
+            buckets=(2, 4, 8, 16, 32),
+            **kwargs,
+        )
+
+        self.llm_judge_fallbacks_total = Counter(
+            "tinman_llm_judge_fallbacks_total",
+            "Batched judge items re-judged with a single call",
+            **kwargs,
+        )
+
+        self.llm_judge_tokens_saved_total = Counter(
+            "tinman_llm_judge_tokens_saved_total",
+            "Estimated prompt tokens saved by batching judge calls",
+            **kwargs,
+        )
+
+        self.llm_cache_requests_total = Counter(
+            "tinman_llm_cache_requests_total",
+            "LLM response cache lookups",
+            ["mode", "result"],  # result: hit/miss
+            **kwargs,
+        )
+
+        self.llm_cache_entries = Gauge(
+            "tinman_llm_cache_entries",
+            "Entries held by the LLM response cache",
+            ["tier"],
+            **kwargs,
+        )
+
+        # HTTP transport metrics
+        self.http_pool_requests_total = Counter(
+            "tinman_http_pool_requests_total",
+            "HTTP requests through the shared transport",
+            ["host", "connection"],  # connection: new/reused
+            **kwargs,
+        )
+
+        self.http_pool_in_flight = Gauge(
+            "tinman_http_pool_in_flight",
+            "HTTP requests currently in flight per host",
+            ["host"],
+            **kwargs,
+        )
+
+        self.http_pool_saturated_total = Counter(
+            "tinman_http_pool_saturated_total",
+            "Requests that had to queue for a pooled connection",
+            ["host"],
+            **kwargs,
+        )
+
+        # Memory graph cache metrics
+        self.graph_cache_requests_total = Counter(
+            "tinman_graph_cache_requests_total",
+            "Memory graph cache lookups",
+            ["kind", "result"],  # kind: node/query, result: hit/miss
+            **kwargs,
+        )
+
+        self.graph_cache_entries = Gauge(
+            "tinman_graph_cache_entries",
+            "Entries held by the memory graph cache",
+            ["kind"],
+            **kwargs,
+        )
+
+        self.graph_cache_bytes = Gauge(
+            "tinman_graph_cache_bytes",
+            "Estimated memory held by the memory graph cache",
+            **kwargs,
+        )
+
+        # Event bus metrics
+        self.event_delivery_lag_seconds = Histogram(
+            "tinman_event_delivery_lag_seconds",
+            "Time queued events wait before their handler runs",
+            ["topic"],
+            buckets=(0.0001, 0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1, 5),
+            **kwargs,
+        )
+
+        self.events_dropped_total = Counter(
+            "tinman_events_dropped_total",
+            "Events dropped because a subscriber queue was full",
+            ["topic"],
+            **kwargs,
+        )
+
+        self.event_transport_events_total = Counter(
+            "tinman_event_transport_events_total",
+            "Events carried between processes by the event transport",
+            ["direction"],  # sent/resent/received/duplicate/dropped
+            **kwargs,
+        )
+
         # Mode metrics
         self.mode_transitions_total = Counter(
             "tinman_mode_transitions_total",
@@ -348,6 +469,23 @@ class TinmanMetrics:
         self.llm_requests_total = NoOpMetric()
         self.llm_tokens_total = NoOpMetric()
         self.llm_latency_seconds = NoOpMetric()
+        self.llm_retries_total = NoOpMetric()
+        self.llm_retries_exhausted_total = NoOpMetric()
+        self.llm_rate_limit_wait_seconds = NoOpMetric()
+        self.llm_judge_batch_size = NoOpMetric()
+        self.llm_judge_fallbacks_total = NoOpMetric()
+        self.llm_judge_tokens_saved_total = NoOpMetric()
+        self.llm_cache_requests_total = NoOpMetric()
+        self.llm_cache_entries = NoOpMetric()
+        self.http_pool_requests_total = NoOpMetric()
+        self.http_pool_in_flight = NoOpMetric()
+        self.http_pool_saturated_total = NoOpMetric()
+        self.graph_cache_requests_total = NoOpMetric()
+        self.graph_cache_entries = NoOpMetric()
+        self.graph_cache_bytes = NoOpMetric()
+        self.event_delivery_lag_seconds = NoOpMetric()
+        self.events_dropped_total = NoOpMetric()
+        self.event_transport_events_total = NoOpMetric()
         self.mode_transitions_total = NoOpMetric()
         self.current_mode = NoOpMetric()
         self.info = NoOpMetric()
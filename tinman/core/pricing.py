@@ -0,0 +1,217 @@
+"""Model prices and local token counting for cost estimates.
+
+Budget checks need a cost before a call is made, when the provider has
+not yet reported usage. ``count_tokens`` estimates the size of a built
+prompt locally, without a tokenizer download or a network round trip,
+and ``PriceTable`` turns token counts into USD for a given model. Local
+providers (Ollama) are free whatever the model is called.
+
+Token estimates follow the cl100k pre-tokenizer: words with their leading
+space, digit groups of at most three, punctuation runs and whitespace
+runs. For English prose and code they are within ``TOKEN_COUNT_TOLERANCE``
+(15%) of the count the provider reports; other tokenizers (Claude, Llama)
+differ from cl100k by a similar amount. Reservations add the tolerance to
+the prompt estimate and assume the full ``max_tokens`` of output, so the
+amount reserved is an upper bound on what a call can cost.
+
+Usage:
+    prices = PriceTable({"my-finetune": {"input_per_1m": 1.0, "output_per_1m": 2.0}})
+    input_tokens = count_message_tokens(messages)
+    worst_case = prices.max_cost("gpt-4o", messages, max_tokens=2048)
+    actual = prices.cost("gpt-4o", response.prompt_tokens, response.completion_tokens)
+"""
+
+from dataclasses import dataclass
+from typing import Any, Optional
+import math
+import re
+
+from ..utils import get_logger
+
+logger = get_logger("pricing")
+
+# Relative error of count_tokens against provider-reported prompt tokens
+TOKEN_COUNT_TOLERANCE = 0.15
+
+# Chat formatting adds a few tokens per message, plus the reply header
+MESSAGE_OVERHEAD_TOKENS = 3
+REPLY_OVERHEAD_TOKENS = 3
+
+_PIECES = re.compile(
+    r"'(?:[sdmt]|ll|ve|re)"       # English contractions
+    r"| ?[^\W\d_]+"              # Words, with their leading space
+    r"|\d{1,3}"                   # Digits, in groups of up to three
+    r"| ?[^\s\w]+[\r\n]*"         # Punctuation runs
+    r"|_+"
+    r"|\s*[\r\n]+"                # Line breaks
+    r"|\s+",                      # Other whitespace
+    re.IGNORECASE,
+)
+
+# Most words up to this many letters are a single token
+_WORD_CHARS_PER_TOKEN = 8
+
+
+def count_tokens(text: str) -> int:
+    """Estimate the number of tokens in ``text``."""
+    tokens = 0
+    for match in _PIECES.finditer(text):
+        piece = match.group()
+        if piece[-1].isalpha():
+            word = piece.lstrip()
+            if word.isascii():
+                tokens += 1 + (len(word) - 1) // _WORD_CHARS_PER_TOKEN
+            else:
+                # Scripts without spaces (CJK) run at about a token per character
+                tokens += len(word)
+        elif piece.isdigit() or not piece.strip():
+            tokens += 1
+        else:
+            tokens += math.ceil(len(piece.strip()) / 2) or 1
+    return tokens
+
+
+def count_message_tokens(messages: list[dict[str, Any]]) -> int:
+    """Estimate the prompt tokens of a chat request."""
+    total = REPLY_OVERHEAD_TOKENS
+    for message in messages:
+        total += MESSAGE_OVERHEAD_TOKENS + count_tokens(str(message.get("content") or ""))
+    return total
+
+
+@dataclass(frozen=True)
+class ModelPrice:
+    """Price of a model in USD per million tokens."""
+    input_per_1m: float
+    output_per_1m: float
+
+    def cost(self, input_tokens: int, output_tokens: int) -> float:
+        return (input_tokens * self.input_per_1m + output_tokens * self.output_per_1m) / 1_000_000
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "ModelPrice":
+        return cls(
+            input_per_1m=float(data["input_per_1m"]),
+            output_per_1m=float(data["output_per_1m"]),
+        )
+
+
+# List prices, matched by the longest model name prefix
+DEFAULT_PRICES: dict[str, ModelPrice] = {
+    # OpenAI
+    "gpt-4o-mini": ModelPrice(0.15, 0.60),
+    "gpt-4o": ModelPrice(2.50, 10.00),
+    "gpt-4-turbo": ModelPrice(10.00, 30.00),
+    "gpt-4": ModelPrice(30.00, 60.00),
+    "gpt-3.5-turbo": ModelPrice(0.50, 1.50),
+    "o1-mini": ModelPrice(3.00, 12.00),
+    "o1": ModelPrice(15.00, 60.00),
+    # Anthropic
+    "claude-3-5-haiku": ModelPrice(0.80, 4.00),
+    "claude-3-5-sonnet": ModelPrice(3.00, 15.00),
+    "claude-3-haiku": ModelPrice(0.25, 1.25),
+    "claude-3-sonnet": ModelPrice(3.00, 15.00),
+    "claude-3-opus": ModelPrice(15.00, 75.00),
+    "claude-sonnet-4": ModelPrice(3.00, 15.00),
+    "claude-opus-4": ModelPrice(15.00, 75.00),
+    # Groq
+    "llama-3.1-70b": ModelPrice(0.59, 0.79),
+    "llama-3.1-8b": ModelPrice(0.05, 0.08),
+    "mixtral-8x7b": ModelPrice(0.24, 0.24),
+    # Together
+    "meta-llama/Meta-Llama-3.1-70B": ModelPrice(0.88, 0.88),
+    "meta-llama/Meta-Llama-3.1-8B": ModelPrice(0.18, 0.18),
+    "deepseek-coder-33b": ModelPrice(0.80, 0.80),
+    # OpenRouter
+    "deepseek/deepseek-chat": ModelPrice(0.14, 0.28),
+    "qwen/qwen-2.5-72b-instruct": ModelPrice(0.35, 0.40),
+}
+
+# Providers priced as a whole, whatever the model (local servers cost nothing)
+PROVIDER_PRICES: dict[str, ModelPrice] = {
+    "ollama": ModelPrice(0.0, 0.0),
+}
+
+# Unknown models are priced high so estimates err towards reserving too much
+FALLBACK_PRICE = ModelPrice(10.00, 30.00)
+
+
+class PriceTable:
+    """Looks up model prices by the longest matching name prefix."""
+
+    def __init__(self,
+                 overrides: Optional[dict[str, Any]] = None,
+                 fallback: ModelPrice = FALLBACK_PRICE):
+        """
+        Args:
+            overrides: Prices by model name prefix, as ModelPrice or
+                {"input_per_1m": ..., "output_per_1m": ...}; added to the
+                defaults
+            fallback: Price for models matching no prefix
+        """
+        self.prices = dict(DEFAULT_PRICES)
+        for model, price in (overrides or {}).items():
+            self.prices[model] = price if isinstance(price, ModelPrice) else ModelPrice.from_dict(price)
+        self.fallback = fallback
+        # Longest prefixes first, so "gpt-4o-mini" wins over "gpt-4o" and "gpt-4"
+        self._prefixes = sorted(self.prices, key=len, reverse=True)
+        self._resolved: dict[str, ModelPrice] = {}
+
+    def price_for(self, model: Optional[str], provider: Optional[str] = None) -> ModelPrice:
+        """Price of ``model``, or the fallback price if it is unknown.
+
+        A provider in PROVIDER_PRICES sets the price for all its models.
+        """
+        if provider in PROVIDER_PRICES:
+            return PROVIDER_PRICES[provider]
+        model = model or ""
+        price = self._resolved.get(model)
+        if price is None:
+            name = model.lower()
+            prefix = next((p for p in self._prefixes if name.startswith(p.lower())), None)
+            if prefix is None:
+                logger.debug(f"No price for model '{model}', using fallback price")
+            price = self._resolved[model] = self.prices[prefix] if prefix else self.fallback
+        return price
+
+    def cost(self,
+             model: Optional[str],
+             input_tokens: int,
+             output_tokens: int,
+             provider: Optional[str] = None) -> float:
+        """Cost in USD of a call with the given usage."""
+        return self.price_for(model, provider).cost(input_tokens, output_tokens)
+
+    def max_cost(self,
+                 model: Optional[str],
+                 messages: list[dict[str, Any]],
+                 max_tokens: int,
+                 provider: Optional[str] = None) -> float:
+        """Upper bound on the cost of a chat request.
+
+        The prompt estimate is padded by the counter's tolerance and the
+        response is assumed to use all of ``max_tokens``.
+        """
+        input_tokens = math.ceil(count_message_tokens(messages) * (1 + TOKEN_COUNT_TOLERANCE))
+        return self.cost(model, input_tokens, max_tokens, provider)
+
+
+def response_usage(messages: list[dict[str, Any]], response: Any) -> tuple[int, int]:
+    """Prompt and completion tokens of a ModelResponse.
+
+    Counted locally when the provider did not report them.
+    """
+    return (
+        response.prompt_tokens or count_message_tokens(messages),
+        response.completion_tokens or count_tokens(response.content or ""),
+    )
+
+
+def client_model(client: Any) -> Optional[str]:
+    """The model a client calls when no model is passed explicitly."""
+    model = client.config.get("model")
+    # Wrappers (resilient, metered) hold the configured client as .client
+    inner = vars(client).get("client")
+    if not model and inner is not None:
+        return client_model(inner)
+    return model or getattr(client, "DEFAULT_MODEL", None)
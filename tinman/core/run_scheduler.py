@@ -0,0 +1,109 @@
+"""Bounded-concurrency scheduler for experiment runs.
+
+Runs are fanned out across the event loop but consumed strictly in
+run-number order, so stop rules (e.g. early termination) see exactly the
+same prefix of results they would have seen with serial execution.
+
+Usage:
+    scheduler = RunScheduler(max_parallel=5, max_parallel_per_experiment=3)
+
+    results = await scheduler.map_ordered(
+        count=20,
+        run_fn=lambda n: execute_run(n),
+        stop_when=lambda done: sum(r.failed for r in done) >= 3,
+    )
+"""
+
+from typing import Awaitable, Callable, Optional, TypeVar
+import asyncio
+
+from ..utils import get_logger
+
+logger = get_logger("run_scheduler")
+
+T = TypeVar("T")
+
+
+class RunScheduler:
+    """Schedules numbered runs with per-experiment and global concurrency limits.
+
+    A single scheduler instance is shared by all experiments of an executor;
+    its global limit bounds the total number of in-flight runs, while each
+    ``map_ordered`` call gets its own per-experiment limit.
+    """
+
+    def __init__(
+        self,
+        max_parallel: int = 5,
+        max_parallel_per_experiment: Optional[int] = None,
+    ):
+        """Initialize the scheduler.
+
+        Args:
+            max_parallel: Maximum in-flight runs across all experiments
+            max_parallel_per_experiment: Maximum in-flight runs for one
+                experiment (defaults to max_parallel)
+        """
+        self.max_parallel = max(1, max_parallel)
+        self.max_parallel_per_experiment = max(
+            1, min(max_parallel_per_experiment or self.max_parallel, self.max_parallel)
+        )
+        self._global_slots = asyncio.Semaphore(self.max_parallel)
+        self._in_flight = 0
+
+    @property
+    def in_flight(self) -> int:
+        """Number of runs currently executing."""
+        return self._in_flight
+
+    async def map_ordered(
+        self,
+        count: int,
+        run_fn: Callable[[int], Awaitable[T]],
+        stop_when: Optional[Callable[[list[T]], bool]] = None,
+    ) -> list[T]:
+        """Execute runs 1..count concurrently and return results in run order.
+
+        Args:
+            count: Number of runs to schedule
+            run_fn: Coroutine factory receiving the 1-based run number
+            stop_when: Predicate over the ordered results so far; when it
+                returns True, remaining runs are cancelled
+
+        Returns:
+            Results for runs 1..k in order, where k is the run at which
+            stop_when first held (or count)
+        """
+        if count <= 0:
+            return []
+
+        local_slots = asyncio.Semaphore(self.max_parallel_per_experiment)
+
+        async def guarded(run_number: int) -> T:
+            async with local_slots:
+                async with self._global_slots:
+                    self._in_flight += 1
+                    try:
+                        return await run_fn(run_number)
+                    finally:
+                        self._in_flight -= 1
+
+        tasks = [asyncio.create_task(guarded(n)) for n in range(1, count + 1)]
+        results: list[T] = []
+
+        try:
+            for task in tasks:
+                results.append(await task)
+                if stop_when and stop_when(results):
+                    break
+        finally:
+            cancelled = 0
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                    cancelled += 1
+            await asyncio.gather(*tasks, return_exceptions=True)
+            if cancelled:
+                logger.debug(f"Cancelled {cancelled} pending runs after stop condition")
+
+        return results
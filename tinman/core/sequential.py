@@ -0,0 +1,117 @@
+"""Sequential stopping for experiments.
+
+A fixed run count wastes runs on clear outcomes (a failure that
+reproduces every time is obvious after a handful of runs) and
+under-samples ambiguous ones. ``BetaBinomialStopping`` keeps a Beta
+posterior on an experiment's reproduction rate, updated after every run,
+and stops as soon as it is confident which side of the validation
+threshold the rate lies on:
+
+- validated once P(rate >= threshold) >= confidence;
+- not validated once P(rate >= threshold) <= 1 - confidence;
+- otherwise keep running, up to ``max_runs``.
+
+The Beta functions are implemented here (regularized incomplete beta by
+continued fraction, quantiles by bisection), so no SciPy is needed.
+
+Usage:
+    stopping = BetaBinomialStopping(threshold=0.3, confidence=0.95)
+    stopping.decide(failures=4, runs=4)           # True: validated
+    stopping.credible_interval(failures=4, runs=4)  # (0.48, 0.99)
+"""
+
+from dataclasses import dataclass
+from typing import Optional
+import math
+
+_EPS = 1e-12
+_MAX_ITERATIONS = 300
+
+
+def _beta_continued_fraction(x: float, a: float, b: float) -> float:
+    """Continued fraction for the incomplete beta function (modified Lentz)."""
+    qab, qap, qam = a + b, a + 1.0, a - 1.0
+    c, d = 1.0, 1.0 - qab * x / qap
+    d = 1.0 / (d if abs(d) > _EPS else _EPS)
+    h = d
+    for m in range(1, _MAX_ITERATIONS + 1):
+        m2 = 2 * m
+        for numerator in (m * (b - m) * x / ((qam + m2) * (a + m2)),
+                          -(a + m) * (qab + m) * x / ((a + m2) * (qap + m2))):
+            d = 1.0 + numerator * d
+            d = 1.0 / (d if abs(d) > _EPS else _EPS)
+            c = 1.0 + numerator / c
+            c = c if abs(c) > _EPS else _EPS
+            h *= d * c
+        if abs(d * c - 1.0) < 1e-10:
+            break
+    return h
+
+
+def beta_cdf(x: float, a: float, b: float) -> float:
+    """P(X <= x) for X ~ Beta(a, b)."""
+    if x <= 0.0:
+        return 0.0
+    if x >= 1.0:
+        return 1.0
+    log_front = (math.lgamma(a + b) - math.lgamma(a) - math.lgamma(b)
+                 + a * math.log(x) + b * math.log1p(-x))
+    # The continued fraction converges fastest below the mean
+    if x < (a + 1.0) / (a + b + 2.0):
+        return math.exp(log_front) * _beta_continued_fraction(x, a, b) / a
+    return 1.0 - math.exp(log_front) * _beta_continued_fraction(1.0 - x, b, a) / b
+
+
+def beta_ppf(q: float, a: float, b: float) -> float:
+    """The x with P(X <= x) = q for X ~ Beta(a, b)."""
+    low, high = 0.0, 1.0
+    for _ in range(60):
+        mid = (low + high) / 2
+        if beta_cdf(mid, a, b) < q:
+            low = mid
+        else:
+            high = mid
+    return (low + high) / 2
+
+
+@dataclass
+class BetaBinomialStopping:
+    """Bayesian stopping rule on an experiment's reproduction rate."""
+    threshold: float = 0.3  # Reproduction rate that validates a hypothesis
+    confidence: float = 0.95  # Posterior probability needed to decide
+    min_runs: int = 3
+    max_runs: int = 50
+    prior_alpha: float = 1.0  # Beta(1, 1): uniform prior
+    prior_beta: float = 1.0
+    interval_mass: float = 0.95  # Width of the reported credible interval
+
+    def __post_init__(self):
+        if not 0.0 < self.threshold < 1.0:
+            raise ValueError(f"threshold must be between 0 and 1, got {self.threshold}")
+        if not 0.5 < self.confidence < 1.0:
+            raise ValueError(f"confidence must be between 0.5 and 1, got {self.confidence}")
+
+    def posterior(self, failures: int, runs: int) -> tuple[float, float]:
+        """Beta parameters of the reproduction rate after ``runs`` runs."""
+        return self.prior_alpha + failures, self.prior_beta + runs - failures
+
+    def probability_validated(self, failures: int, runs: int) -> float:
+        """Posterior probability that the reproduction rate is at least the threshold."""
+        return 1.0 - beta_cdf(self.threshold, *self.posterior(failures, runs))
+
+    def decide(self, failures: int, runs: int) -> Optional[bool]:
+        """True (validated) or False (not validated) once confident, else None."""
+        if runs < self.min_runs:
+            return None
+        p = self.probability_validated(failures, runs)
+        if p >= self.confidence:
+            return True
+        if p <= 1.0 - self.confidence:
+            return False
+        return None
+
+    def credible_interval(self, failures: int, runs: int) -> tuple[float, float]:
+        """Equal-tailed credible interval for the reproduction rate."""
+        a, b = self.posterior(failures, runs)
+        tail = (1.0 - self.interval_mass) / 2
+        return beta_ppf(tail, a, b), beta_ppf(1.0 - tail, a, b)
@@ -387,6 +387,7 @@ async def guarded_call(
                 requester_session=requester_session,
                 predicted_severity=predicted_severity,
                 timeout_seconds=timeout_seconds,
+                force_review=requires_approval_override is True,
             )
         except Exception as e:
             logger.error(f"Approval request failed: {e}")
@@ -1,4 +1,4 @@
-from .connection import Database, get_db
+from .connection import AsyncDatabase, Database, get_db
 from .models import (
     Base,
     NodeModel,
@@ -20,6 +20,7 @@ from .audit import (
     ModeTransition,
     ToolExecution,
     AuditLogger,
+    AsyncAuditLogger,
     get_audit_logger,
     set_audit_logger,
 )
@@ -27,6 +28,7 @@ from .audit import (
 __all__ = [
     # Connection
     "Database",
+    "AsyncDatabase",
     "get_db",
     "Base",
     # Core models
@@ -48,6 +50,7 @@ __all__ = [
     "ModeTransition",
     "ToolExecution",
     "AuditLogger",
+    "AsyncAuditLogger",
     "get_audit_logger",
     "set_audit_logger",
 ]
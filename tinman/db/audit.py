@@ -12,7 +12,7 @@ This provides a complete history for compliance, debugging, and analysis.
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Optional, Union
 from enum import Enum
 import json
 import uuid
@@ -31,6 +31,7 @@ from sqlalchemy import (
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import Session
 
+from .connection import AsyncDatabase, Database, run_in_session
 from .models import Base
 from ..utils import get_logger, utc_now
 
@@ -676,6 +677,70 @@ class AuditLogger:
         }
 
 
+class AsyncAuditLogger:
+    """Awaitable AuditLogger for async callers.
+
+    Each call runs as its own unit of work through run_in_session
+    (asyncio driver or worker thread), so recording an event never
+    blocks the event loop and is durable once the call returns.
+    Returned records are detached from their session.
+    """
+
+    def __init__(self, database: Union[Database, AsyncDatabase]):
+        self.database = database
+        self._session_id: Optional[str] = None
+        self._mode: Optional[str] = None
+
+    def set_context(self, session_id: str, mode: str) -> None:
+        """Set the current context for audit logs."""
+        self._session_id = session_id
+        self._mode = mode
+
+    async def _call(self, method: str, *args: Any, **kwargs: Any) -> Any:
+        def work(session: Session) -> Any:
+            audit = AuditLogger(session)
+            audit._session_id, audit._mode = self._session_id, self._mode
+            return getattr(audit, method)(*args, **kwargs)
+
+        return await run_in_session(self.database, work)
+
+    async def log_event(self, event_type: AuditEventType, **kwargs: Any) -> AuditLog:
+        """Log a generic audit event (see AuditLogger.log_event)."""
+        return await self._call("log_event", event_type, **kwargs)
+
+    async def log_approval_decision(self, **kwargs: Any) -> ApprovalDecision:
+        """Log an approval decision (see AuditLogger.log_approval_decision)."""
+        return await self._call("log_approval_decision", **kwargs)
+
+    async def log_mode_transition(self, **kwargs: Any) -> ModeTransition:
+        """Log a mode transition (see AuditLogger.log_mode_transition)."""
+        return await self._call("log_mode_transition", **kwargs)
+
+    async def log_tool_execution(self, **kwargs: Any) -> ToolExecution:
+        """Log a tool execution (see AuditLogger.log_tool_execution)."""
+        return await self._call("log_tool_execution", **kwargs)
+
+    async def get_recent_events(self, **kwargs: Any) -> list[AuditLog]:
+        """Get recent audit events."""
+        return await self._call("get_recent_events", **kwargs)
+
+    async def get_approval_decisions(self, **kwargs: Any) -> list[ApprovalDecision]:
+        """Get approval decisions with filters."""
+        return await self._call("get_approval_decisions", **kwargs)
+
+    async def get_mode_transitions(self, **kwargs: Any) -> list[ModeTransition]:
+        """Get mode transitions."""
+        return await self._call("get_mode_transitions", **kwargs)
+
+    async def get_tool_executions(self, **kwargs: Any) -> list[ToolExecution]:
+        """Get tool executions with filters."""
+        return await self._call("get_tool_executions", **kwargs)
+
+    async def get_audit_summary(self, since: Optional[datetime] = None) -> dict[str, Any]:
+        """Get summary statistics from audit log."""
+        return await self._call("get_audit_summary", since)
+
+
 # Global audit logger instance
 _audit_logger: Optional[AuditLogger] = None
 
@@ -1,27 +1,68 @@
-"""Database connection management."""
+"""Database connection management.
 
-from contextlib import contextmanager
-from typing import Generator, Optional
+``Database`` wraps a synchronous engine with a ``QueuePool``.
+``AsyncDatabase`` wraps an asyncio engine (asyncpg / aiosqlite) so
+database I/O can be awaited without blocking the event loop; it needs
+the ``async`` extra.
+"""
+
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, Callable, Generator, Optional, Union
+import asyncio
 
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, Session
-from sqlalchemy.pool import QueuePool
+from sqlalchemy.pool import QueuePool, StaticPool
 
 from .models import Base
 
+try:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+    ASYNC_AVAILABLE = True
+except ImportError:
+    ASYNC_AVAILABLE = False
+
+# asyncio drivers per database backend
+ASYNC_DRIVERS = {
+    "postgresql": "asyncpg",
+    "sqlite": "aiosqlite",
+}
+
+
+def engine_options(url: str, pool_size: int = 10, asyncio: bool = False) -> dict:
+    """Engine arguments suited to the database behind a URL."""
+    if not url.startswith("sqlite"):
+        options = {
+            "pool_size": pool_size,
+            "max_overflow": 20,
+            "pool_pre_ping": True,
+        }
+        if not asyncio:
+            # Async engines use their own asyncio-aware queue pool
+            options["poolclass"] = QueuePool
+        return options
+    options: dict = {"connect_args": {"check_same_thread": False}}
+    if url.split("://", 1)[1] in ("", "/:memory:"):
+        # One shared connection, otherwise every checkout gets an empty database
+        options["poolclass"] = StaticPool
+    return options
+
+
+def async_url(url: str) -> str:
+    """Rewrite a database URL to use the backend's asyncio driver."""
+    scheme, _, rest = url.partition("://")
+    backend = scheme.split("+", 1)[0]
+    if backend not in ASYNC_DRIVERS:
+        raise ValueError(f"No asyncio driver for {backend} databases")
+    return f"{backend}+{ASYNC_DRIVERS[backend]}://{rest}"
+
 
 class Database:
     """Database connection manager."""
 
     def __init__(self, url: str, pool_size: int = 10):
         self.url = url
-        self.engine = create_engine(
-            url,
-            poolclass=QueuePool,
-            pool_size=pool_size,
-            max_overflow=20,
-            pool_pre_ping=True,
-        )
+        self.engine = create_engine(url, **engine_options(url, pool_size))
         self.SessionLocal = sessionmaker(
             autocommit=False,
             autoflush=False,
@@ -53,6 +94,95 @@ class Database:
         """Get a new session (caller must manage lifecycle)."""
         return self.SessionLocal()
 
+    def disconnect(self) -> None:
+        """Close all pooled connections."""
+        self.engine.dispose()
+
+
+class AsyncDatabase:
+    """Asyncio database connection manager.
+
+    Takes the same URLs as Database and switches them to the asyncpg or
+    aiosqlite driver.
+    """
+
+    def __init__(self, url: str, pool_size: int = 10):
+        if not ASYNC_AVAILABLE:
+            raise RuntimeError(
+                "Async database support requires the async extra: pip install tinman[async]"
+            )
+        self.url = async_url(url)
+        self.engine = create_async_engine(
+            self.url, **engine_options(url, pool_size, asyncio=True)
+        )
+        self.SessionLocal = async_sessionmaker(
+            self.engine,
+            autoflush=False,
+            expire_on_commit=False,
+        )
+
+    async def create_tables(self) -> None:
+        """Create all tables."""
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+
+    async def drop_tables(self) -> None:
+        """Drop all tables (use with caution)."""
+        async with self.engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+
+    @asynccontextmanager
+    async def session(self) -> AsyncGenerator["AsyncSession", None]:
+        """Provide a transactional scope around operations."""
+        async with self.SessionLocal() as session:
+            try:
+                yield session
+                await session.commit()
+            except Exception:
+                await session.rollback()
+                raise
+
+    def get_session(self) -> "AsyncSession":
+        """Get a new session (caller must manage lifecycle)."""
+        return self.SessionLocal()
+
+    async def disconnect(self) -> None:
+        """Close all pooled connections."""
+        await self.engine.dispose()
+
+
+async def run_in_session(database: Union[Database, AsyncDatabase],
+                         work: Callable[..., Any],
+                         *args: Any,
+                         **kwargs: Any) -> Any:
+    """
+    Run work(session, *args, **kwargs) as one unit of work without
+    blocking the event loop.
+
+    With an AsyncDatabase the synchronous work runs through
+    AsyncSession.run_sync, so the asyncio driver does the I/O. With a
+    Database it runs in a worker thread on its own pooled session.
+    Either way the session commits on success and rolls back on error,
+    and loaded objects stay usable after it closes.
+    """
+    if isinstance(database, AsyncDatabase):
+        async with database.session() as session:
+            return await session.run_sync(work, *args, **kwargs)
+
+    def run() -> Any:
+        session = database.SessionLocal(expire_on_commit=False)
+        try:
+            result = work(session, *args, **kwargs)
+            session.commit()
+            return result
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
+
+    return await asyncio.to_thread(run)
+
 
 _db_instance: Optional[Database] = None
 
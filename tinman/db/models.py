@@ -16,6 +16,7 @@ from sqlalchemy import (
     Index,
     CheckConstraint,
     BigInteger,
+    text,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import declarative_base, relationship
@@ -47,6 +48,22 @@ class NodeModel(Base):
         Index("idx_nodes_type", "node_type"),
         Index("idx_nodes_created_at", "created_at"),
         Index("idx_nodes_valid_range", "valid_from", "valid_to"),
+        # JSONB indexes (migration 0002); PostgreSQL only
+        Index(
+            "idx_nodes_data_gin", "data",
+            postgresql_using="gin", postgresql_ops={"data": "jsonb_path_ops"},
+        ).ddl_if(dialect="postgresql"),
+        *(
+            Index(f"idx_nodes_{key}", "node_type", text(f"(data->>'{key}')"))
+            .ddl_if(dialect="postgresql")
+            for key in ("severity", "primary_class", "is_resolved", "risk_tier")
+        ),
+        # SQLite JSON1 equivalents of the hot-key indexes
+        *(
+            Index(f"idx_nodes_sqlite_{key}", "node_type", text(f"(data ->> '$.\"{key}\"')"))
+            .ddl_if(dialect="sqlite")
+            for key in ("severity", "primary_class", "risk_tier")
+        ),
     )
 
 
@@ -7,6 +7,12 @@ from .openrouter_client import OpenRouterClient
 from .groq_client import GroqClient
 from .ollama_client import OllamaClient
 from .together_client import TogetherClient
+from .resilient_client import (
+    ResilientModelClient,
+    ModelRetryExhaustedError,
+    RateLimits,
+    TokenBucket,
+)
 from .pipeline_adapter import PipelineAdapter, PipelineHook
 
 __all__ = [
@@ -21,6 +27,11 @@ __all__ = [
     "GroqClient",        # Ultra-fast inference, generous free tier
     "OllamaClient",      # Local models, completely free
     "TogetherClient",    # $25 free credits for new accounts
+    # Retries and rate limiting
+    "ResilientModelClient",
+    "ModelRetryExhaustedError",
+    "RateLimits",
+    "TokenBucket",
     # Pipeline
     "PipelineAdapter",
     "PipelineHook",
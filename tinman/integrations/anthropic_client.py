@@ -17,6 +17,7 @@ class AnthropicClient(ModelClient):
     """
 
     DEFAULT_MODEL = "claude-3-5-sonnet-20241022"
+    DEFAULT_BASE_URL = "https://api.anthropic.com"
 
     def __init__(self,
                  api_key: Optional[str] = None,
@@ -34,13 +35,14 @@ class AnthropicClient(ModelClient):
 
     def _get_client(self):
         """Lazy initialization of Anthropic client."""
-        if self._client is None:
+        if self._client is None or self._sdk_client_stale():
             try:
                 from anthropic import AsyncAnthropic
 
                 kwargs = {"api_key": self.api_key}
                 if self.base_url:
                     kwargs["base_url"] = self.base_url
+                kwargs.update(self._pooled_http_kwargs(self.base_url or self.DEFAULT_BASE_URL))
 
                 self._client = AsyncAnthropic(**kwargs)
             except ImportError:
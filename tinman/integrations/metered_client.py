@@ -0,0 +1,205 @@
+"""Cost recording for every model call.
+
+``MeteredModelClient`` wraps a ModelClient and records the usage of each
+completion or stream with the CostTracker, priced from the tracker's
+price table, and feeds the ``tinman_llm_*`` metrics. Callers no longer
+have to remember to record costs, so budgets see every call.
+
+Costs are attributed to whatever is running the call. Agents, the LLM
+backbone and the experiment executor each set part of the attribution
+with ``attribute_costs``; it lives in a context variable, so it follows
+the call into tasks started from inside the block and never needs a
+lock. A call made while a budget Reservation is attributed commits its
+cost to that reservation.
+
+Usage:
+    client = MeteredModelClient(ResilientModelClient(OpenAIClient()), tracker)
+
+    with attribute_costs(agent="hypothesis_engine", mode="hypothesis_generation"):
+        await client.complete(messages)  # Recorded with source and operation set
+"""
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
+from typing import Any, Iterator, Optional
+import time
+
+from .model_client import ModelClient, ModelResponse
+from ..core.cost_tracker import CostTracker, Reservation, get_cost_tracker
+from ..core.metrics import get_metrics
+from ..core.pricing import client_model, count_message_tokens, count_tokens, response_usage
+from ..utils import get_logger
+
+logger = get_logger("metered_client")
+
+
+@dataclass(frozen=True)
+class CostAttribution:
+    """Who a model call's cost is charged to."""
+    agent: Optional[str] = None  # Agent type, recorded as the cost source
+    mode: Optional[str] = None  # Reasoning mode, recorded as the operation
+    experiment_id: Optional[str] = None
+    reservation: Optional[Reservation] = None  # Budget held for the call
+
+
+_EMPTY = CostAttribution()
+
+_attribution: ContextVar[Optional[CostAttribution]] = ContextVar(
+    "tinman_cost_attribution", default=None
+)
+
+
+def current_attribution() -> CostAttribution:
+    """Attribution for model calls made from the current context."""
+    return _attribution.get() or _EMPTY
+
+
+@contextmanager
+def attribute_costs(**fields: Any) -> Iterator[CostAttribution]:
+    """Attribute model calls made inside the block.
+
+    Fields are merged into the enclosing attribution, so nested blocks
+    only set what they know (the agent, then the reasoning mode, ...).
+    """
+    attribution = replace(current_attribution(), **fields)
+    token = _attribution.set(attribution)
+    try:
+        yield attribution
+    finally:
+        _attribution.reset(token)
+
+
+class MeteredModelClient(ModelClient):
+    """Wraps a ModelClient, recording the cost of every call."""
+
+    def __init__(self, client: ModelClient, cost_tracker: Optional[CostTracker] = None):
+        """Initialize the wrapper.
+
+        Args:
+            client: Client to record calls for
+            cost_tracker: Tracker to record costs with (defaults to the
+                shared tracker at call time)
+        """
+        super().__init__(api_key=client.api_key)
+        self.client = client
+        self.cost_tracker = cost_tracker
+
+    @property
+    def provider(self) -> str:
+        return self.client.provider
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose the wrapped client's helpers (DEFAULT_MODEL, list_models, ...)
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    async def complete(self,
+                       messages: list[dict[str, str]],
+                       model: Optional[str] = None,
+                       temperature: float = 0.7,
+                       max_tokens: int = 4096,
+                       tools: Optional[list[dict]] = None,
+                       **kwargs) -> ModelResponse:
+        """Send a completion request and record its usage."""
+        started = time.perf_counter()
+        try:
+            response = await self.client.complete(
+                messages=messages,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                tools=tools,
+                **kwargs,
+            )
+        except Exception:
+            self._count_request(model or client_model(self.client), "error", started)
+            raise
+
+        input_tokens, output_tokens = response_usage(messages, response)
+        self._record(response.model or model or client_model(self.client),
+                     input_tokens, output_tokens, started)
+        return response
+
+    async def stream(self,
+                     messages: list[dict[str, str]],
+                     model: Optional[str] = None,
+                     temperature: float = 0.7,
+                     max_tokens: int = 4096,
+                     **kwargs):
+        """Stream a completion response and record its estimated usage.
+
+        Streams report no usage, so tokens are counted locally. A stream
+        the caller stops early is charged for the output it produced.
+        """
+        started = time.perf_counter()
+        parts: list[str] = []
+        failed = False
+        try:
+            async for chunk in self.client.stream(
+                messages=messages,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs,
+            ):
+                parts.append(chunk)
+                yield chunk
+        except Exception:
+            failed = True
+            raise
+        finally:
+            model = model or client_model(self.client)
+            if failed and not parts:
+                self._count_request(model, "error", started)
+            else:
+                self._record(model, count_message_tokens(messages),
+                             count_tokens("".join(parts)), started)
+
+    def _count_request(self, model: Optional[str], status: str, started: float) -> None:
+        model = model or "unknown"
+        metrics = get_metrics()
+        metrics.llm_requests_total.labels(
+            model=model, mode=current_attribution().mode or "none", status=status
+        ).inc()
+        metrics.llm_latency_seconds.labels(model=model).observe(time.perf_counter() - started)
+
+    def _record(self,
+                model: Optional[str],
+                input_tokens: int,
+                output_tokens: int,
+                started: float) -> None:
+        model = model or "unknown"
+        self._count_request(model, "success", started)
+        metrics = get_metrics()
+        metrics.llm_tokens_total.labels(model=model, direction="input").inc(input_tokens)
+        metrics.llm_tokens_total.labels(model=model, direction="output").inc(output_tokens)
+
+        tracker = self.cost_tracker or get_cost_tracker()
+        attribution = current_attribution()
+        cost = tracker.prices.cost(model, input_tokens, output_tokens, self.provider)
+        metadata = {"provider": self.provider}
+        if attribution.experiment_id:
+            metadata["experiment_id"] = attribution.experiment_id
+
+        reservation = attribution.reservation
+        if reservation and reservation.open:
+            tracker.commit(
+                reservation,
+                cost,
+                model=model,
+                input_tokens=input_tokens,
+                output_tokens=output_tokens,
+                metadata=metadata,
+            )
+            return
+        tracker.record_cost(
+            cost,
+            source=attribution.agent or "unattributed",
+            model=model,
+            operation=attribution.mode or "completion",
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            metadata=metadata,
+        )
@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
+from .transport import get_transport_manager
 from ..utils import generate_id, utc_now
 
 
@@ -25,6 +26,7 @@ class ModelResponse:
     # Metadata
     finish_reason: str = ""
     latency_ms: int = 0
+    retries: int = 0  # Transient-error retries before this response
 
     # Raw response for debugging
     raw: Optional[dict[str, Any]] = None
@@ -85,6 +87,16 @@ class ModelClient(ABC):
         """
         pass
 
+    def _pooled_http_kwargs(self, base_url: str) -> dict[str, Any]:
+        """SDK constructor kwargs routing requests through the shared HTTP pool."""
+        self._http_client = get_transport_manager().get_client(base_url)
+        return {"http_client": self._http_client} if self._http_client is not None else {}
+
+    def _sdk_client_stale(self) -> bool:
+        """Whether the pooled HTTP client under the cached SDK client was closed."""
+        http_client = getattr(self, "_http_client", None)
+        return http_client is not None and http_client.is_closed
+
     def format_messages(self,
                         system: Optional[str] = None,
                         messages: Optional[list[dict]] = None,
@@ -11,6 +11,7 @@ import os
 from typing import Any, Optional
 
 from .model_client import ModelClient, ModelResponse
+from .transport import get_transport_manager
 from ..utils import utc_now, get_logger
 
 logger = get_logger("ollama_client")
@@ -107,13 +108,14 @@ class OllamaClient(ModelClient):
 
     def _get_client(self):
         """Lazy initialization of OpenAI client pointed at Ollama."""
-        if self._client is None:
+        if self._client is None or self._sdk_client_stale():
             try:
                 from openai import AsyncOpenAI
 
                 self._client = AsyncOpenAI(
                     api_key="ollama",  # Ollama doesn't check this
                     base_url=self.base_url,
+                    **self._pooled_http_kwargs(self.base_url),
                 )
             except ImportError:
                 raise ImportError(
@@ -255,12 +257,24 @@ class OllamaClient(ModelClient):
 
     async def list_local_models(self) -> list[str]:
         """List models available on the local Ollama server."""
-        import aiohttp
-
         # Use the Ollama native API for listing models
         base = self.base_url.replace("/v1", "")
         url = f"{base}/api/tags"
 
+        http_client = get_transport_manager().get_client(url)
+        if http_client is not None:
+            try:
+                response = await http_client.get(url)
+                if response.status_code == 200:
+                    return [m["name"] for m in response.json().get("models", [])]
+                logger.warning(f"Failed to list Ollama models: {response.status_code}")
+                return []
+            except Exception as e:
+                logger.error(f"Error listing Ollama models: {e}")
+                return []
+
+        import aiohttp
+
         try:
             async with aiohttp.ClientSession() as session:
                 async with session.get(url) as response:
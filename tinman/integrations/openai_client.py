@@ -17,6 +17,7 @@ class OpenAIClient(ModelClient):
     """
 
     DEFAULT_MODEL = "gpt-4-turbo-preview"
+    DEFAULT_BASE_URL = "https://api.openai.com/v1"
 
     def __init__(self,
                  api_key: Optional[str] = None,
@@ -36,7 +37,7 @@ class OpenAIClient(ModelClient):
 
     def _get_client(self):
         """Lazy initialization of OpenAI client."""
-        if self._client is None:
+        if self._client is None or self._sdk_client_stale():
             try:
                 from openai import AsyncOpenAI
 
@@ -45,6 +46,7 @@ class OpenAIClient(ModelClient):
                     kwargs["base_url"] = self.base_url
                 if self.organization:
                     kwargs["organization"] = self.organization
+                kwargs.update(self._pooled_http_kwargs(self.base_url or self.DEFAULT_BASE_URL))
 
                 self._client = AsyncOpenAI(**kwargs)
             except ImportError:
@@ -108,7 +108,7 @@ class OpenRouterClient(ModelClient):
 
     def _get_client(self):
         """Lazy initialization of OpenAI client pointed at OpenRouter."""
-        if self._client is None:
+        if self._client is None or self._sdk_client_stale():
             try:
                 from openai import AsyncOpenAI
 
@@ -119,6 +119,7 @@ class OpenRouterClient(ModelClient):
                         "HTTP-Referer": self.site_url,
                         "X-Title": self.site_name,
                     },
+                    **self._pooled_http_kwargs(self.BASE_URL),
                 )
             except ImportError:
                 raise ImportError(
@@ -0,0 +1,341 @@
+"""Retry, backoff and client-side rate limiting for model clients.
+
+``ResilientModelClient`` wraps any ``ModelClient`` and:
+
+- paces requests with token buckets for requests-per-minute and
+  tokens-per-minute (per-provider defaults, overridable)
+- retries 429/5xx/timeouts with jittered exponential backoff, honoring a
+  ``Retry-After`` header when the provider sends one
+- raises ``ModelRetryExhaustedError`` once retries are used up, so callers
+  can tell infrastructure trouble apart from genuine model failures
+
+Usage:
+    client = ResilientModelClient(OpenAIClient(), max_retries=4)
+    response = await client.complete(messages=[...])
+    response.retries  # attempts beyond the first
+"""
+
+from dataclasses import dataclass
+from typing import Any, Optional
+import asyncio
+import random
+import time
+
+from .model_client import ModelClient, ModelResponse
+from ..core.metrics import get_metrics
+from ..core.pricing import count_message_tokens
+from ..utils import get_logger
+
+logger = get_logger("resilient_client")
+
+RETRYABLE_STATUS_CODES = {408, 429, 500, 502, 503, 504, 529}
+
+# SDK exception class names that indicate a transient condition even when
+# no status code is attached (connection resets, client-side timeouts).
+RETRYABLE_ERROR_NAMES = {
+    "APIConnectionError",
+    "APITimeoutError",
+    "RateLimitError",
+    "InternalServerError",
+    "ServiceUnavailableError",
+    "OverloadedError",
+    "ClientConnectionError",
+    "ServerDisconnectedError",
+}
+
+
+@dataclass
+class RateLimits:
+    """Client-side request and token budgets (None = unlimited)."""
+    requests_per_minute: Optional[int] = None
+    tokens_per_minute: Optional[int] = None
+
+
+# Conservative defaults sized for entry-level API tiers; raise them in
+# config for higher tiers.
+PROVIDER_RATE_LIMITS: dict[str, RateLimits] = {
+    "openai": RateLimits(requests_per_minute=500, tokens_per_minute=200_000),
+    "anthropic": RateLimits(requests_per_minute=50, tokens_per_minute=80_000),
+    "groq": RateLimits(requests_per_minute=30, tokens_per_minute=15_000),
+    "together": RateLimits(requests_per_minute=600, tokens_per_minute=180_000),
+    "openrouter": RateLimits(requests_per_minute=200, tokens_per_minute=None),
+    "ollama": RateLimits(),  # Local server, no provider-side limits
+}
+
+
+class ModelRetryExhaustedError(Exception):
+    """Raised when a model call keeps failing with transient errors."""
+
+    def __init__(self, provider: str, attempts: int, last_error: BaseException):
+        self.provider = provider
+        self.attempts = attempts
+        self.last_error = last_error
+        self.status_code = error_status_code(last_error)
+        super().__init__(
+            f"{provider} call failed after {attempts} attempts: {last_error}"
+        )
+
+
+def error_status_code(error: BaseException) -> Optional[int]:
+    """Extract an HTTP status code from an SDK/transport exception."""
+    for attr in ("status_code", "status", "http_status"):
+        value = getattr(error, attr, None)
+        if isinstance(value, int):
+            return value
+    response = getattr(error, "response", None)
+    value = getattr(response, "status_code", None) or getattr(response, "status", None)
+    return value if isinstance(value, int) else None
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Whether an exception is transient infrastructure trouble.
+
+    True for rate limits, 5xx, timeouts and connection errors (and for
+    ``ModelRetryExhaustedError``), False for errors that say something
+    about the request or the model itself.
+    """
+    if isinstance(error, ModelRetryExhaustedError):
+        return True
+    if isinstance(error, (asyncio.TimeoutError, ConnectionError)):
+        return True
+    status = error_status_code(error)
+    if status is not None:
+        return status in RETRYABLE_STATUS_CODES
+    return type(error).__name__ in RETRYABLE_ERROR_NAMES
+
+
+def retry_after_seconds(error: BaseException) -> Optional[float]:
+    """Read a Retry-After hint (seconds) from an exception, if present."""
+    headers = getattr(error, "headers", None)
+    if headers is None:
+        headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    value = headers.get("retry-after") or headers.get("Retry-After")
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except (TypeError, ValueError):
+        return None
+
+
+def _retry_reason(error: BaseException) -> str:
+    status = error_status_code(error)
+    if status == 429:
+        return "rate_limited"
+    if status is not None and status >= 500:
+        return "server_error"
+    if isinstance(error, asyncio.TimeoutError) or "Timeout" in type(error).__name__:
+        return "timeout"
+    return "connection"
+
+
+class TokenBucket:
+    """Async token bucket refilled continuously at ``rate_per_minute``.
+
+    ``acquire`` waits until enough tokens are available. ``debit`` charges
+    tokens after the fact and may push the level negative, which delays
+    subsequent acquirers until the overdraft is paid back.
+    """
+
+    def __init__(self, rate_per_minute: float, capacity: Optional[float] = None):
+        self.rate_per_second = rate_per_minute / 60.0
+        self.capacity = capacity or rate_per_minute
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate_per_second
+        )
+        self._updated = now
+
+    async def acquire(self, amount: float = 1.0) -> float:
+        """Take ``amount`` tokens, waiting if needed.
+
+        Returns:
+            Seconds spent waiting
+        """
+        amount = min(amount, self.capacity)
+        waited = 0.0
+        async with self._lock:
+            while True:
+                self._refill()
+                if self._tokens >= amount:
+                    self._tokens -= amount
+                    return waited
+                delay = (amount - self._tokens) / self.rate_per_second
+                await asyncio.sleep(delay)
+                waited += delay
+
+    def debit(self, amount: float) -> None:
+        """Charge tokens without waiting (used to settle actual usage)."""
+        self._refill()
+        self._tokens -= amount
+
+    @property
+    def available(self) -> float:
+        self._refill()
+        return self._tokens
+
+
+class ResilientModelClient(ModelClient):
+    """Wraps a ModelClient with rate limiting and retries."""
+
+    def __init__(self,
+                 client: ModelClient,
+                 max_retries: int = 4,
+                 base_delay: float = 0.5,
+                 max_delay: float = 30.0,
+                 rate_limits: Optional[RateLimits] = None):
+        """Initialize the wrapper.
+
+        Args:
+            client: Underlying provider client
+            max_retries: Retries after the first attempt
+            base_delay: First backoff delay in seconds
+            max_delay: Upper bound for a single backoff delay
+            rate_limits: Request/token budgets (defaults per provider)
+        """
+        super().__init__(api_key=client.api_key)
+        self.client = client
+        self.max_retries = max(0, max_retries)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+        limits = rate_limits or PROVIDER_RATE_LIMITS.get(client.provider, RateLimits())
+        self.rate_limits = limits
+        self._request_bucket = (
+            TokenBucket(limits.requests_per_minute) if limits.requests_per_minute else None
+        )
+        self._token_bucket = (
+            TokenBucket(limits.tokens_per_minute) if limits.tokens_per_minute else None
+        )
+
+    @property
+    def provider(self) -> str:
+        return self.client.provider
+
+    def __getattr__(self, name: str) -> Any:
+        # Expose provider-specific helpers (list_models, MODELS, ...)
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    @staticmethod
+    def estimate_prompt_tokens(messages: list[dict[str, str]]) -> int:
+        """Prompt size counted locally, before the provider reports usage."""
+        return count_message_tokens(messages)
+
+    def _backoff_delay(self, attempt: int, error: BaseException) -> float:
+        """Delay before retry ``attempt`` (1-based), full jitter."""
+        hinted = retry_after_seconds(error)
+        if hinted is not None:
+            return min(hinted, self.max_delay)
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    async def _wait_for_capacity(self, prompt_tokens: int) -> None:
+        metrics = get_metrics()
+        if self._request_bucket:
+            waited = await self._request_bucket.acquire(1)
+            if waited:
+                metrics.llm_rate_limit_wait_seconds.labels(
+                    provider=self.provider, limit="rpm"
+                ).observe(waited)
+        if self._token_bucket:
+            waited = await self._token_bucket.acquire(prompt_tokens)
+            if waited:
+                metrics.llm_rate_limit_wait_seconds.labels(
+                    provider=self.provider, limit="tpm"
+                ).observe(waited)
+
+    def _settle_tokens(self, estimated: int, actual: int) -> None:
+        """Charge the token bucket for usage beyond the up-front estimate."""
+        if self._token_bucket and actual > estimated:
+            self._token_bucket.debit(actual - estimated)
+
+    async def _before_retry(self, attempt: int, error: BaseException) -> None:
+        reason = _retry_reason(error)
+        get_metrics().llm_retries_total.labels(provider=self.provider, reason=reason).inc()
+        delay = self._backoff_delay(attempt, error)
+        logger.warning(
+            f"{self.provider} call failed ({reason}), retry {attempt}/{self.max_retries} "
+            f"in {delay:.2f}s: {error}"
+        )
+        await asyncio.sleep(delay)
+
+    async def complete(self,
+                       messages: list[dict[str, str]],
+                       model: Optional[str] = None,
+                       temperature: float = 0.7,
+                       max_tokens: int = 4096,
+                       tools: Optional[list[dict]] = None,
+                       **kwargs) -> ModelResponse:
+        """Send a completion request, pacing and retrying as needed."""
+        estimated = self.estimate_prompt_tokens(messages)
+        attempt = 0
+        while True:
+            await self._wait_for_capacity(estimated)
+            try:
+                response = await self.client.complete(
+                    messages=messages,
+                    model=model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    tools=tools,
+                    **kwargs,
+                )
+            except Exception as e:
+                if not is_transient_error(e):
+                    raise
+                attempt += 1
+                if attempt > self.max_retries:
+                    get_metrics().llm_retries_exhausted_total.labels(provider=self.provider).inc()
+                    raise ModelRetryExhaustedError(self.provider, attempt, e) from e
+                await self._before_retry(attempt, e)
+                continue
+
+            self._settle_tokens(estimated, response.total_tokens)
+            response.retries = attempt
+            return response
+
+    async def stream(self,
+                     messages: list[dict[str, str]],
+                     model: Optional[str] = None,
+                     temperature: float = 0.7,
+                     max_tokens: int = 4096,
+                     **kwargs):
+        """Stream a completion response.
+
+        Retries only happen before the first chunk is yielded; once output
+        has been delivered to the caller a failure is re-raised as-is.
+        """
+        estimated = self.estimate_prompt_tokens(messages)
+        attempt = 0
+        while True:
+            await self._wait_for_capacity(estimated)
+            streamed_chars = 0
+            try:
+                async for chunk in self.client.stream(
+                    messages=messages,
+                    model=model,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **kwargs,
+                ):
+                    streamed_chars += len(chunk)
+                    yield chunk
+            except Exception as e:
+                if streamed_chars or not is_transient_error(e):
+                    raise
+                attempt += 1
+                if attempt > self.max_retries:
+                    get_metrics().llm_retries_exhausted_total.labels(provider=self.provider).inc()
+                    raise ModelRetryExhaustedError(self.provider, attempt, e) from e
+                await self._before_retry(attempt, e)
+                continue
+
+            self._settle_tokens(estimated, estimated + streamed_chars // 4)
+            return
@@ -95,13 +95,14 @@ class TogetherClient(ModelClient):
 
     def _get_client(self):
         """Lazy initialization of OpenAI client pointed at Together."""
-        if self._client is None:
+        if self._client is None or self._sdk_client_stale():
             try:
                 from openai import AsyncOpenAI
 
                 self._client = AsyncOpenAI(
                     api_key=self.api_key,
                     base_url=self.BASE_URL,
+                    **self._pooled_http_kwargs(self.BASE_URL),
                 )
             except ImportError:
                 raise ImportError(
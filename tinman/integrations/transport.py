@@ -0,0 +1,208 @@
+"""Shared pooled HTTP transport for model provider clients.
+
+Provider SDKs (openai, anthropic) each build a private HTTP client, so the
+executor, the reasoning backbone and the simulation engine never share
+connections. ``HTTPTransportManager`` owns one keep-alive ``httpx``
+connection pool per origin and hands it to every provider client that
+talks to that origin. HTTP/2 is negotiated when the ``h2`` package is
+installed.
+
+The manager's lifecycle is explicit: Tinman creates one in ``initialize``
+and closes it in ``close``. Without httpx installed, ``get_client``
+returns None and clients fall back to their SDK defaults.
+
+Usage:
+    manager = HTTPTransportManager(TransportConfig(max_connections=50))
+    set_transport_manager(manager)
+    ...
+    await manager.close()
+"""
+
+from dataclasses import dataclass
+from typing import Any, Optional
+from urllib.parse import urlsplit
+import threading
+
+from ..core.metrics import get_metrics
+from ..utils import get_logger
+
+logger = get_logger("transport")
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
+
+@dataclass
+class TransportConfig:
+    """Connection pool sizing and timeouts (applied per origin)."""
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry_seconds: float = 30.0
+    connect_timeout_seconds: float = 10.0
+    read_timeout_seconds: float = 600.0
+    http2: bool = True
+
+
+def origin_of(url: str) -> str:
+    """Pool key for a URL: scheme://host[:port]."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}" if parts.netloc else url
+
+
+if HTTPX_AVAILABLE:
+
+    class _InstrumentedTransport(httpx.AsyncHTTPTransport):
+        """httpx transport that reports connection reuse and pool pressure."""
+
+        def __init__(self, origin: str, max_connections: int, **kwargs: Any):
+            super().__init__(**kwargs)
+            self.origin = origin
+            self.max_connections = max_connections
+            self.in_flight = 0
+            self.requests = 0
+            self.new_connections = 0
+
+        def _open_connections(self) -> int:
+            pool = getattr(self, "_pool", None)
+            return len(getattr(pool, "connections", []) or [])
+
+        async def handle_async_request(self, request: "httpx.Request") -> "httpx.Response":
+            metrics = get_metrics()
+            host = request.url.host
+            if self.in_flight >= self.max_connections:
+                metrics.http_pool_saturated_total.labels(host=host).inc()
+
+            opened_before = self._open_connections()
+            self.in_flight += 1
+            metrics.http_pool_in_flight.labels(host=host).set(self.in_flight)
+            try:
+                response = await super().handle_async_request(request)
+            finally:
+                self.in_flight -= 1
+                metrics.http_pool_in_flight.labels(host=host).set(self.in_flight)
+
+            # A request that didn't grow the pool was served by an existing
+            # keep-alive connection.
+            reused = self._open_connections() <= opened_before
+            if not reused:
+                self.new_connections += 1
+            self.requests += 1
+            metrics.http_pool_requests_total.labels(
+                host=host, connection="reused" if reused else "new"
+            ).inc()
+            return response
+
+
+class HTTPTransportManager:
+    """Owns keep-alive HTTP connection pools shared by provider clients."""
+
+    def __init__(self, config: Optional[TransportConfig] = None):
+        self.config = config or TransportConfig()
+        self._clients: dict[str, "httpx.AsyncClient"] = {}
+        self._transports: dict[str, "_InstrumentedTransport"] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def available(self) -> bool:
+        """Whether pooled transport is usable (httpx installed)."""
+        return HTTPX_AVAILABLE
+
+    def get_client(self, base_url: str) -> Optional["httpx.AsyncClient"]:
+        """Get the pooled client for a base URL's origin.
+
+        Args:
+            base_url: Any URL on the target origin
+
+        Returns:
+            Shared httpx.AsyncClient, or None if httpx is not installed
+        """
+        if not HTTPX_AVAILABLE:
+            return None
+
+        origin = origin_of(base_url)
+        with self._lock:
+            client = self._clients.get(origin)
+            if client is None or client.is_closed:
+                client, transport = self._build_client(origin)
+                self._clients[origin] = client
+                self._transports[origin] = transport
+            return client
+
+    def _build_client(self, origin: str) -> tuple["httpx.AsyncClient", "_InstrumentedTransport"]:
+        config = self.config
+        http2 = config.http2 and HTTP2_AVAILABLE
+        transport = _InstrumentedTransport(
+            origin=origin,
+            max_connections=config.max_connections,
+            http2=http2,
+            limits=httpx.Limits(
+                max_connections=config.max_connections,
+                max_keepalive_connections=config.max_keepalive_connections,
+                keepalive_expiry=config.keepalive_expiry_seconds,
+            ),
+        )
+        logger.debug(f"Opened HTTP pool for {origin} (http2={http2})")
+        client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(
+                config.read_timeout_seconds,
+                connect=config.connect_timeout_seconds,
+            ),
+        )
+        return client, transport
+
+    def get_stats(self) -> dict[str, dict[str, Any]]:
+        """Per-origin request, connection and in-flight counts."""
+        stats = {}
+        with self._lock:
+            for origin, transport in self._transports.items():
+                requests = transport.requests
+                stats[origin] = {
+                    "requests": requests,
+                    "new_connections": transport.new_connections,
+                    "reuse_rate": (
+                        (requests - transport.new_connections) / requests if requests else 0.0
+                    ),
+                    "in_flight": transport.in_flight,
+                }
+        return stats
+
+    async def close(self) -> None:
+        """Close every pool. Later get_client calls open fresh pools."""
+        with self._lock:
+            clients, self._clients = list(self._clients.values()), {}
+            self._transports = {}
+        for client in clients:
+            await client.aclose()
+        if clients:
+            logger.info(f"Closed {len(clients)} HTTP connection pools")
+
+
+# Global transport manager
+_transport_manager: Optional[HTTPTransportManager] = None
+_transport_lock = threading.Lock()
+
+
+def get_transport_manager() -> HTTPTransportManager:
+    """Get the global transport manager."""
+    global _transport_manager
+    with _transport_lock:
+        if _transport_manager is None:
+            _transport_manager = HTTPTransportManager()
+        return _transport_manager
+
+
+def set_transport_manager(manager: HTTPTransportManager) -> None:
+    """Set the global transport manager."""
+    global _transport_manager
+    with _transport_lock:
+        _transport_manager = manager
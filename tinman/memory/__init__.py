@@ -1,12 +1,21 @@
-from .models import Node, Edge, NodeType, EdgeRelation
+from .models import Node, Edge, NodeType, EdgeRelation, Subgraph
 from .graph import MemoryGraph
+from .async_graph import AsyncMemoryGraph
+from .backends import GraphBackend, InMemoryGraphRepository
 from .repository import GraphRepository
+from .cache import GraphCache, CachedGraphRepository
 
 __all__ = [
     "Node",
     "Edge",
     "NodeType",
     "EdgeRelation",
+    "Subgraph",
     "MemoryGraph",
+    "AsyncMemoryGraph",
+    "GraphBackend",
     "GraphRepository",
+    "InMemoryGraphRepository",
+    "GraphCache",
+    "CachedGraphRepository",
 ]
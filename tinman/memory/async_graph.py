@@ -0,0 +1,135 @@
+"""Awaitable access to the Research Memory Graph.
+
+Agents run as coroutines, so a synchronous graph call blocks every other
+in-flight cycle and model call until the database answers.
+``AsyncMemoryGraph`` exposes the ``MemoryGraph`` API as coroutines:
+
+- Over a ``Database``, each call runs in a worker thread on its own
+  pooled session.
+- Over an ``AsyncDatabase`` (asyncpg / aiosqlite), each call runs through
+  ``AsyncSession.run_sync`` so the asyncio driver does the I/O.
+- Wrapping an existing ``MemoryGraph`` (in-memory backend or a
+  caller-owned session) calls it inline.
+
+Usage:
+    graph = AsyncMemoryGraph(database=db, cache=GraphCache())
+    async with graph.batch():
+        await graph.record_failure(...)
+    failures = await graph.get_failures(limit=20)
+"""
+
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from typing import Any, AsyncIterator, Optional, Union
+
+from sqlalchemy.orm import Session
+
+from ..db.connection import AsyncDatabase, Database, run_in_session
+from .backends import InMemoryGraphRepository
+from .cache import GraphCache
+from .graph import GraphBatch, MemoryGraph
+
+# MemoryGraph callables that are not per-graph operations
+_NOT_FORWARDED = {"batch", "in_memory", "sqlite"}
+
+# Writes that only append to an active batch, so need no session
+BUFFERED_WRITES = {
+    "add_node",
+    "add_edge",
+    "add_many",
+    "link",
+    "record_hypothesis",
+    "record_experiment",
+    "record_failure",
+    "record_intervention",
+    "record_deployment",
+    "record_rollback",
+}
+
+
+class AsyncMemoryGraph:
+    """MemoryGraph API as coroutines that don't block the event loop."""
+
+    def __init__(self,
+                 graph: Optional[MemoryGraph] = None,
+                 database: Optional[Union[Database, AsyncDatabase]] = None,
+                 cache: Optional[GraphCache] = None):
+        """
+        Args:
+            graph: Graph to call inline
+            database: Database to run each call against as a unit of work
+            cache: Read-through cache shared by calls (database only)
+        """
+        if (graph is None) == (database is None):
+            raise ValueError("AsyncMemoryGraph needs exactly one of graph or database")
+        self.graph = graph
+        self.database = database
+        self.cache = cache if database is not None else graph.cache
+        # Per-task batch, so concurrent cycles never flush each other's writes
+        self._batch: ContextVar[Optional[GraphBatch]] = ContextVar(
+            f"graph_batch_{id(self)}", default=None
+        )
+        # Stand-in for buffered writes; the batch intercepts them before storage
+        self._detached = MemoryGraph(backend=InMemoryGraphRepository())
+
+    @classmethod
+    def wrap(cls,
+             graph: Optional[Union[MemoryGraph, "AsyncMemoryGraph"]]) -> Optional["AsyncMemoryGraph"]:
+        """Accept either graph flavour; sync graphs are called inline."""
+        if graph is None or isinstance(graph, AsyncMemoryGraph):
+            return graph
+        return cls(graph=graph)
+
+    @asynccontextmanager
+    async def batch(self) -> AsyncIterator[GraphBatch]:
+        """Buffer this task's writes and flush them in bulk on exit.
+
+        Same semantics as MemoryGraph.batch: nested calls join the
+        outermost batch and writes are discarded if the block raises.
+        """
+        current = self._batch.get()
+        if current is not None:
+            yield current
+            return
+
+        batch = GraphBatch()
+        token = self._batch.set(batch)
+        try:
+            yield batch
+        finally:
+            self._batch.reset(token)
+        if batch:
+            await self._call("add_many", list(batch.nodes.values()), batch.edges)
+
+    async def _call(self, name: str, *args: Any, **kwargs: Any) -> Any:
+        if self.graph is not None:
+            return self._invoke(self.graph, name, args, kwargs)
+        if name in BUFFERED_WRITES and self._batch.get() is not None:
+            return self._invoke(self._detached, name, args, kwargs)
+
+        def work(session: Session) -> Any:
+            return self._invoke(MemoryGraph(session, cache=self.cache), name, args, kwargs)
+
+        return await run_in_session(self.database, work)
+
+    def _invoke(self, graph: MemoryGraph, name: str, args: tuple, kwargs: dict) -> Any:
+        previous, batch = graph._batch, self._batch.get()
+        if batch is not None:
+            graph._batch = batch
+        try:
+            return getattr(graph, name)(*args, **kwargs)
+        finally:
+            graph._batch = previous
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or name in _NOT_FORWARDED or not callable(
+            getattr(MemoryGraph, name, None)
+        ):
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            return await self._call(name, *args, **kwargs)
+
+        call.__name__ = name
+        call.__doc__ = getattr(MemoryGraph, name).__doc__
+        return call
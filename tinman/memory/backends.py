@@ -0,0 +1,556 @@
+"""Storage backends for the Research Memory Graph.
+
+``MemoryGraph`` talks to storage through the ``GraphBackend`` interface.
+Three implementations share it:
+
+- ``GraphRepository``: SQL storage through SQLAlchemy. PostgreSQL uses
+  JSONB operators and GIN indexes. SQLite uses JSON1 with expression
+  indexes on hot data keys, so a file or ``:memory:`` database works
+  with no server.
+- ``InMemoryGraphRepository``: pure-Python adjacency lists with type,
+  time and hot-key indexes. Nothing is persisted, so it suits tests and
+  short-lived lab sessions.
+
+Usage:
+    graph = MemoryGraph.in_memory()
+    graph = MemoryGraph.sqlite("~/.tinman/graph.db")
+"""
+
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from datetime import datetime
+from typing import Any, Iterable, Optional, Sequence
+import json
+import threading
+
+from ..utils import utc_now, get_logger
+from .models import Node, Edge, NodeType, EdgeRelation, Subgraph
+
+logger = get_logger("graph_backends")
+
+# Data keys indexed by every backend (expression indexes in SQL)
+INDEXED_DATA_KEYS = ("severity", "primary_class", "is_resolved", "risk_tier")
+
+TIME_BUCKETS = ("hour", "day")
+
+
+class GraphBackend(ABC):
+    """Storage interface behind MemoryGraph."""
+
+    # --- Writes ---
+
+    @abstractmethod
+    def add_node(self, node: Node) -> str:
+        """Persist a node and return its ID."""
+
+    @abstractmethod
+    def add_edge(self, edge: Edge) -> str:
+        """Persist an edge and return its ID."""
+
+    @abstractmethod
+    def add_many(self, nodes: Iterable[Node], edges: Iterable[Edge] = ()) -> None:
+        """Persist nodes, then edges, in bulk."""
+
+    @abstractmethod
+    def invalidate_node(self, node_id: str, at: Optional[datetime] = None) -> bool:
+        """Mark a node as no longer valid."""
+
+    # --- Point reads ---
+
+    @abstractmethod
+    def get_node(self, node_id: str) -> Optional[Node]:
+        """Retrieve a node by ID."""
+
+    @abstractmethod
+    def get_edge(self, edge_id: str) -> Optional[Edge]:
+        """Retrieve an edge by ID."""
+
+    @abstractmethod
+    def get_outgoing_edges(self,
+                           node_id: str,
+                           relation: Optional[EdgeRelation] = None) -> list[Edge]:
+        """Get edges originating from a node."""
+
+    @abstractmethod
+    def get_incoming_edges(self,
+                           node_id: str,
+                           relation: Optional[EdgeRelation] = None) -> list[Edge]:
+        """Get edges pointing to a node."""
+
+    @abstractmethod
+    def get_edges_from_nodes(self,
+                             node_ids: Sequence[str],
+                             relations: Optional[Iterable[EdgeRelation]] = None) -> list[Edge]:
+        """Get outgoing edges of many nodes at once."""
+
+    @abstractmethod
+    def get_neighbors(self,
+                      node_id: str,
+                      relation: Optional[EdgeRelation] = None,
+                      direction: str = "outgoing") -> list[Node]:
+        """Get neighboring nodes."""
+
+    # --- Queries ---
+
+    @abstractmethod
+    def get_nodes_by_type(self,
+                          node_type: NodeType,
+                          valid_only: bool = True,
+                          limit: int = 100) -> list[Node]:
+        """Get nodes of a type, newest first."""
+
+    @abstractmethod
+    def query_at_time(self,
+                      node_type: Optional[NodeType] = None,
+                      at: Optional[datetime] = None,
+                      limit: int = 100) -> list[Node]:
+        """Query nodes valid at a point in time, newest first."""
+
+    @abstractmethod
+    def search_nodes(self,
+                     data_filter: dict[str, Any],
+                     node_type: Optional[NodeType] = None,
+                     limit: int = 100) -> list[Node]:
+        """Search nodes by data values, newest first."""
+
+    @abstractmethod
+    def get_failure_evolution(self, failure_class: str, limit: int = 50) -> list[Node]:
+        """Failure nodes of a class, oldest first."""
+
+    @abstractmethod
+    def nodes_between(self,
+                      node_type: NodeType,
+                      start: Optional[datetime] = None,
+                      end: Optional[datetime] = None,
+                      data_filter: Optional[dict[str, Any]] = None,
+                      limit: Optional[int] = None) -> list[Node]:
+        """Nodes of a type created within [start, end], oldest first."""
+
+    @abstractmethod
+    def traverse(self,
+                 node_id: str,
+                 direction: str = "outgoing",
+                 relations: Optional[Iterable[EdgeRelation]] = None,
+                 max_depth: int = 10,
+                 valid_at: Optional[datetime] = None) -> Subgraph:
+        """Collect everything reachable from a node."""
+
+    # --- Aggregates ---
+
+    @abstractmethod
+    def count_by_type(self, valid_at: Optional[datetime] = None) -> dict[str, int]:
+        """Count nodes per type."""
+
+    @abstractmethod
+    def count_by_validity(self, at: Optional[datetime] = None) -> dict[str, dict[str, int]]:
+        """Count valid and invalidated nodes per type."""
+
+    @abstractmethod
+    def count_by_field(self,
+                       node_type: NodeType,
+                       field: str,
+                       valid_only: bool = False,
+                       unresolved_only: bool = False) -> dict[str, int]:
+        """Count nodes of one type grouped by a data field."""
+
+    @abstractmethod
+    def activity_since(self, since: datetime) -> dict[str, dict[str, Any]]:
+        """Per-type totals, recent counts and latest creation time."""
+
+    @abstractmethod
+    def count_over_time(self,
+                        node_type: Optional[NodeType] = None,
+                        since: Optional[datetime] = None,
+                        bucket: str = "hour") -> list[tuple[datetime, int]]:
+        """Count nodes created per time bucket."""
+
+    @abstractmethod
+    def count_between(self,
+                      node_type: NodeType,
+                      start: Optional[datetime] = None,
+                      end: Optional[datetime] = None,
+                      group_by: Sequence[str] = (),
+                      data_filter: Optional[dict[str, Any]] = None,
+                      bucket: Optional[str] = None,
+                      periods: Optional[Sequence[datetime]] = None) -> list[dict[str, Any]]:
+        """Count nodes created in a window, grouped by data keys and time."""
+
+    # --- Traversal helpers ---
+
+    def get_ancestors(self,
+                      node_id: str,
+                      relations: Optional[Iterable[EdgeRelation]] = None,
+                      max_depth: int = 10,
+                      valid_at: Optional[datetime] = None) -> Subgraph:
+        """Nodes with a path into this node (following edges backwards)."""
+        return self.traverse(node_id, "incoming", relations, max_depth, valid_at)
+
+    def get_descendants(self,
+                        node_id: str,
+                        relations: Optional[Iterable[EdgeRelation]] = None,
+                        max_depth: int = 10,
+                        valid_at: Optional[datetime] = None) -> Subgraph:
+        """Nodes reachable from this node along edge direction."""
+        return self.traverse(node_id, "outgoing", relations, max_depth, valid_at)
+
+    def get_neighborhood(self,
+                         node_id: str,
+                         hops: int = 1,
+                         relations: Optional[Iterable[EdgeRelation]] = None,
+                         valid_at: Optional[datetime] = None) -> Subgraph:
+        """Nodes within k hops of this node, ignoring edge direction."""
+        return self.traverse(node_id, "both", relations, hops, valid_at)
+
+    def get_lineage(self, node_id: str, max_depth: int = 10) -> list[tuple[Node, Edge]]:
+        """
+        Get the causal lineage of a node.
+
+        Traverses incoming CAUSED_BY edges, following every cause, not just
+        the first. Returns (cause node, edge) tuples ordered from the
+        nearest causes to the root causes.
+        """
+        ancestors = self.get_ancestors(node_id, [EdgeRelation.CAUSED_BY], max_depth)
+        return [
+            (ancestors.nodes[edge.src_id], edge)
+            for edge in sorted(ancestors.edges, key=lambda e: ancestors.depths[e.src_id])
+        ]
+
+
+def _is_valid_at(node: Node, at: datetime) -> bool:
+    return node.valid_from <= at and (node.valid_to is None or node.valid_to >= at)
+
+
+def _data_text(value: Any) -> Any:
+    """Group value of a data field, matching SQL ->> (booleans stay bool)."""
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    return json.dumps(value)
+
+
+def _contains(stored: Any, wanted: Any) -> bool:
+    """JSON containment, as PostgreSQL's @> operator."""
+    if isinstance(wanted, dict):
+        return isinstance(stored, dict) and all(
+            key in stored and _contains(stored[key], value) for key, value in wanted.items()
+        )
+    if isinstance(wanted, list):
+        return isinstance(stored, list) and all(
+            any(_contains(item, w) for item in stored) for w in wanted
+        )
+    if isinstance(wanted, bool) or isinstance(stored, bool):
+        return type(stored) is type(wanted) and stored == wanted
+    return stored == wanted
+
+
+def _truncate(ts: datetime, bucket: str) -> datetime:
+    if bucket not in TIME_BUCKETS:
+        raise ValueError(f"Unknown time bucket: {bucket}")
+    ts = ts.replace(minute=0, second=0, microsecond=0)
+    return ts.replace(hour=0) if bucket == "day" else ts
+
+
+class InMemoryGraphRepository(GraphBackend):
+    """
+    Pure in-memory graph storage using adjacency lists.
+
+    Nodes are indexed by id, by type and by the values of hot data keys;
+    edges by id and by both endpoints. All operations are thread-safe.
+    """
+
+    def __init__(self):
+        self._nodes: dict[str, Node] = {}
+        self._by_type: dict[NodeType, set[str]] = defaultdict(set)
+        self._by_field: dict[tuple[str, Any], set[str]] = defaultdict(set)
+        self._edges: dict[str, Edge] = {}
+        self._outgoing: dict[str, list[Edge]] = defaultdict(list)
+        self._incoming: dict[str, list[Edge]] = defaultdict(list)
+        self._lock = threading.RLock()
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    # --- Writes ---
+
+    def add_node(self, node: Node) -> str:
+        with self._lock:
+            if node.id in self._nodes:
+                raise ValueError(f"Node already exists: {node.id}")
+            self._nodes[node.id] = node
+            self._by_type[node.node_type].add(node.id)
+            for key in INDEXED_DATA_KEYS:
+                if key in node.data:
+                    self._by_field[(key, _data_text(node.data[key]))].add(node.id)
+        logger.debug(f"Added node: {node.id} ({node.node_type.value})")
+        return node.id
+
+    def add_edge(self, edge: Edge) -> str:
+        with self._lock:
+            if edge.id in self._edges:
+                raise ValueError(f"Edge already exists: {edge.id}")
+            self._edges[edge.id] = edge
+            self._outgoing[edge.src_id].append(edge)
+            self._incoming[edge.dst_id].append(edge)
+        return edge.id
+
+    def add_many(self, nodes: Iterable[Node], edges: Iterable[Edge] = ()) -> None:
+        with self._lock:
+            for node in nodes:
+                self.add_node(node)
+            for edge in edges:
+                self.add_edge(edge)
+
+    def invalidate_node(self, node_id: str, at: Optional[datetime] = None) -> bool:
+        with self._lock:
+            node = self._nodes.get(node_id)
+            if node is None:
+                return False
+            node.valid_to = at or utc_now()
+            return True
+
+    # --- Point reads ---
+
+    def get_node(self, node_id: str) -> Optional[Node]:
+        return self._nodes.get(node_id)
+
+    def get_edge(self, edge_id: str) -> Optional[Edge]:
+        return self._edges.get(edge_id)
+
+    def get_outgoing_edges(self,
+                           node_id: str,
+                           relation: Optional[EdgeRelation] = None) -> list[Edge]:
+        with self._lock:
+            edges = list(self._outgoing.get(node_id, ()))
+        return [e for e in edges if not relation or e.relation == relation]
+
+    def get_incoming_edges(self,
+                           node_id: str,
+                           relation: Optional[EdgeRelation] = None) -> list[Edge]:
+        with self._lock:
+            edges = list(self._incoming.get(node_id, ()))
+        return [e for e in edges if not relation or e.relation == relation]
+
+    def get_edges_from_nodes(self,
+                             node_ids: Sequence[str],
+                             relations: Optional[Iterable[EdgeRelation]] = None) -> list[Edge]:
+        wanted = set(relations) if relations else None
+        with self._lock:
+            return [
+                e for node_id in node_ids for e in self._outgoing.get(node_id, ())
+                if wanted is None or e.relation in wanted
+            ]
+
+    def get_neighbors(self,
+                      node_id: str,
+                      relation: Optional[EdgeRelation] = None,
+                      direction: str = "outgoing") -> list[Node]:
+        if direction == "outgoing":
+            ids = [e.dst_id for e in self.get_outgoing_edges(node_id, relation)]
+        else:
+            ids = [e.src_id for e in self.get_incoming_edges(node_id, relation)]
+        return [self._nodes[i] for i in dict.fromkeys(ids) if i in self._nodes]
+
+    # --- Queries ---
+
+    def _select(self,
+                node_type: Optional[NodeType] = None,
+                data_filter: Optional[dict[str, Any]] = None) -> list[Node]:
+        """Candidate nodes, narrowed by the type and hot-key indexes first."""
+        with self._lock:
+            candidates: Optional[set[str]] = None
+            if node_type is not None:
+                candidates = set(self._by_type.get(node_type, ()))
+            for key, value in (data_filter or {}).items():
+                if key in INDEXED_DATA_KEYS and isinstance(value, (str, bool)):
+                    ids = self._by_field.get((key, value), set())
+                    candidates = ids & candidates if candidates is not None else set(ids)
+            nodes = (
+                [self._nodes[i] for i in candidates]
+                if candidates is not None else list(self._nodes.values())
+            )
+        if data_filter:
+            nodes = [n for n in nodes if _contains(n.data, data_filter)]
+        return nodes
+
+    def _newest(self, nodes: list[Node], limit: Optional[int]) -> list[Node]:
+        nodes.sort(key=lambda n: n.created_at, reverse=True)
+        return nodes if limit is None else nodes[:limit]
+
+    def get_nodes_by_type(self,
+                          node_type: NodeType,
+                          valid_only: bool = True,
+                          limit: int = 100) -> list[Node]:
+        nodes = self._select(node_type)
+        if valid_only:
+            now = utc_now()
+            nodes = [n for n in nodes if _is_valid_at(n, now)]
+        return self._newest(nodes, limit)
+
+    def query_at_time(self,
+                      node_type: Optional[NodeType] = None,
+                      at: Optional[datetime] = None,
+                      limit: int = 100) -> list[Node]:
+        timestamp = at or utc_now()
+        nodes = [n for n in self._select(node_type) if _is_valid_at(n, timestamp)]
+        return self._newest(nodes, limit)
+
+    def search_nodes(self,
+                     data_filter: dict[str, Any],
+                     node_type: Optional[NodeType] = None,
+                     limit: int = 100) -> list[Node]:
+        return self._newest(self._select(node_type, data_filter), limit)
+
+    def get_failure_evolution(self, failure_class: str, limit: int = 50) -> list[Node]:
+        nodes = self._select(NodeType.FAILURE_MODE, {"primary_class": failure_class})
+        nodes.sort(key=lambda n: n.created_at)
+        return nodes[:limit]
+
+    def nodes_between(self,
+                      node_type: NodeType,
+                      start: Optional[datetime] = None,
+                      end: Optional[datetime] = None,
+                      data_filter: Optional[dict[str, Any]] = None,
+                      limit: Optional[int] = None) -> list[Node]:
+        nodes = [
+            n for n in self._select(node_type, data_filter)
+            if (start is None or n.created_at >= start) and (end is None or n.created_at <= end)
+        ]
+        nodes.sort(key=lambda n: n.created_at)
+        return nodes if limit is None else nodes[:limit]
+
+    def traverse(self,
+                 node_id: str,
+                 direction: str = "outgoing",
+                 relations: Optional[Iterable[EdgeRelation]] = None,
+                 max_depth: int = 10,
+                 valid_at: Optional[datetime] = None) -> Subgraph:
+        if direction not in ("outgoing", "incoming", "both"):
+            raise ValueError(f"Unknown traversal direction: {direction}")
+        wanted = set(relations) if relations else None
+        subgraph = Subgraph(root_id=node_id)
+        seen_edges: set[str] = set()
+
+        with self._lock:
+            frontier = deque([(node_id, 0)])
+            expanded: set[str] = set()
+            while frontier:
+                current, depth = frontier.popleft()
+                if depth >= max_depth or current in expanded:
+                    continue
+                expanded.add(current)
+
+                hops: list[tuple[Edge, str]] = []
+                if direction in ("outgoing", "both"):
+                    hops.extend((e, e.dst_id) for e in self._outgoing.get(current, ()))
+                if direction in ("incoming", "both"):
+                    hops.extend((e, e.src_id) for e in self._incoming.get(current, ()))
+
+                for edge, far_id in hops:
+                    if wanted is not None and edge.relation not in wanted:
+                        continue
+                    far = self._nodes.get(far_id)
+                    if far is None or (valid_at is not None and not _is_valid_at(far, valid_at)):
+                        continue
+                    if far_id == node_id or edge.id in seen_edges:
+                        continue
+                    seen_edges.add(edge.id)
+                    subgraph.edges.append(edge)
+                    if far_id not in subgraph.nodes:
+                        subgraph.nodes[far_id] = far
+                        subgraph.depths[far_id] = depth + 1
+                        frontier.append((far_id, depth + 1))
+        return subgraph
+
+    # --- Aggregates ---
+
+    def count_by_type(self, valid_at: Optional[datetime] = None) -> dict[str, int]:
+        counts = {node_type.value: 0 for node_type in NodeType}
+        with self._lock:
+            for node_type, ids in self._by_type.items():
+                if valid_at is None:
+                    counts[node_type.value] = len(ids)
+                else:
+                    counts[node_type.value] = sum(
+                        1 for i in ids if _is_valid_at(self._nodes[i], valid_at)
+                    )
+        return counts
+
+    def count_by_validity(self, at: Optional[datetime] = None) -> dict[str, dict[str, int]]:
+        at = at or utc_now()
+        counts = {node_type.value: {"valid": 0, "invalid": 0} for node_type in NodeType}
+        with self._lock:
+            for node in self._nodes.values():
+                counts[node.node_type.value]["valid" if _is_valid_at(node, at) else "invalid"] += 1
+        return counts
+
+    def count_by_field(self,
+                       node_type: NodeType,
+                       field: str,
+                       valid_only: bool = False,
+                       unresolved_only: bool = False) -> dict[str, int]:
+        now = utc_now()
+        counts: dict[str, int] = defaultdict(int)
+        for node in self._select(node_type):
+            if valid_only and not _is_valid_at(node, now):
+                continue
+            if unresolved_only and node.data.get("is_resolved"):
+                continue
+            value = _data_text(node.data.get(field))
+            if isinstance(value, bool):
+                value = "true" if value else "false"
+            counts[value if value is not None else "unknown"] += 1
+        return dict(counts)
+
+    def activity_since(self, since: datetime) -> dict[str, dict[str, Any]]:
+        activity = {
+            node_type.value: {"total": 0, "recent": 0, "last_created_at": None}
+            for node_type in NodeType
+        }
+        with self._lock:
+            for node in self._nodes.values():
+                entry = activity[node.node_type.value]
+                entry["total"] += 1
+                if node.created_at >= since:
+                    entry["recent"] += 1
+                if entry["last_created_at"] is None or node.created_at > entry["last_created_at"]:
+                    entry["last_created_at"] = node.created_at
+        return activity
+
+    def count_over_time(self,
+                        node_type: Optional[NodeType] = None,
+                        since: Optional[datetime] = None,
+                        bucket: str = "hour") -> list[tuple[datetime, int]]:
+        counts: dict[datetime, int] = defaultdict(int)
+        for node in self._select(node_type):
+            if since is None or node.created_at >= since:
+                counts[_truncate(node.created_at, bucket)] += 1
+        return sorted(counts.items())
+
+    def count_between(self,
+                      node_type: NodeType,
+                      start: Optional[datetime] = None,
+                      end: Optional[datetime] = None,
+                      group_by: Sequence[str] = (),
+                      data_filter: Optional[dict[str, Any]] = None,
+                      bucket: Optional[str] = None,
+                      periods: Optional[Sequence[datetime]] = None) -> list[dict[str, Any]]:
+        counts: dict[tuple, int] = defaultdict(int)
+        for node in self.nodes_between(node_type, start, end, data_filter):
+            key: list[Any] = [_data_text(node.data.get(k)) for k in group_by]
+            if bucket is not None:
+                key.append(_truncate(node.created_at, bucket))
+            if periods:
+                key.append(max(
+                    (i for i, boundary in enumerate(periods) if node.created_at >= boundary),
+                    default=-1,
+                ))
+            counts[tuple(key)] += 1
+
+        names = list(group_by)
+        if bucket is not None:
+            names.append("bucket")
+        if periods:
+            names.append("period")
+        return [
+            {**dict(zip(names, key, strict=True)), "count": count}
+            for key, count in counts.items()
+        ]
@@ -0,0 +1,302 @@
+"""In-process read-through cache for the Research Memory Graph.
+
+Agents re-read the same nodes every research cycle (recent failures for
+hypothesis generation, failure nodes during simulation, context for
+dialogue). ``GraphCache`` keeps an identity map of nodes by id and an
+LRU of query results keyed by the query and its arguments.
+``CachedGraphRepository`` puts it in front of ``GraphRepository``:
+
+- node writes refresh the identity map, and ``invalidate_node`` evicts
+  the node
+- any node or edge write drops every cached query result
+- a session rollback clears the whole cache
+
+Cached nodes and query results both expire after a TTL, which bounds
+how long a write from another process stays invisible. Cached nodes are
+shared objects and must not be mutated by callers.
+
+Usage:
+    graph = MemoryGraph(session, cache=GraphCache(max_nodes=4096))
+"""
+
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Callable, Hashable, Iterable, Optional
+import json
+import sys
+import threading
+import time
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from ..core.metrics import get_metrics
+from ..utils import get_logger
+from .models import Node, Edge, NodeType, EdgeRelation, Subgraph
+from .repository import GraphRepository
+
+logger = get_logger("graph_cache")
+
+# Rough per-object overhead on top of the JSON payload, for footprint estimates
+NODE_OVERHEAD_BYTES = 400
+EDGE_OVERHEAD_BYTES = 300
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate memory held by a cached value, in bytes."""
+    if isinstance(value, Node):
+        return NODE_OVERHEAD_BYTES + len(json.dumps(value.data, default=str))
+    if isinstance(value, Edge):
+        return EDGE_OVERHEAD_BYTES + len(json.dumps(value.metadata, default=str))
+    if isinstance(value, Subgraph):
+        return (
+            sum(estimate_size(n) for n in value.nodes.values())
+            + sum(estimate_size(e) for e in value.edges)
+        )
+    if isinstance(value, (list, tuple)):
+        return sys.getsizeof(value) + sum(estimate_size(v) for v in value)
+    return sys.getsizeof(value)
+
+
+class GraphCache:
+    """Node identity map plus an LRU of query results."""
+
+    def __init__(self,
+                 max_nodes: int = 4096,
+                 max_queries: int = 256,
+                 ttl_seconds: float = 60.0):
+        """Initialize the cache.
+
+        Args:
+            max_nodes: Nodes kept in the identity map (LRU beyond this)
+            max_queries: Query results kept (LRU beyond this)
+            ttl_seconds: Age after which a node or query result is reloaded
+        """
+        self.max_nodes = max_nodes
+        self.max_queries = max_queries
+        self.ttl = ttl_seconds
+        self._nodes: OrderedDict[str, tuple[float, Node, int]] = OrderedDict()
+        self._queries: OrderedDict[Hashable, tuple[float, Any, int]] = OrderedDict()
+        self._node_bytes = 0
+        self._query_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = {"node": 0, "query": 0}
+        self.misses = {"node": 0, "query": 0}
+
+    # --- Nodes ---
+
+    def get_node(self, node_id: str) -> Optional[Node]:
+        """Get a cached node, or None on a miss."""
+        with self._lock:
+            entry = self._nodes.get(node_id)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._discard_node(node_id)
+                entry = None
+            if entry is not None:
+                self._nodes.move_to_end(node_id)
+        self._record("node", entry is not None)
+        return entry[1] if entry else None
+
+    def put_node(self, node: Node) -> None:
+        with self._lock:
+            self._discard_node(node.id)
+            size = estimate_size(node)
+            self._nodes[node.id] = (time.monotonic() + self.ttl, node, size)
+            self._node_bytes += size
+            while len(self._nodes) > self.max_nodes:
+                self._discard_node(next(iter(self._nodes)))
+        self._update_gauges()
+
+    def evict_node(self, node_id: str) -> None:
+        with self._lock:
+            self._discard_node(node_id)
+        self._update_gauges()
+
+    # --- Queries ---
+
+    def get_query(self, key: Hashable) -> tuple[bool, Any]:
+        """Look up a query result; returns (hit, value)."""
+        with self._lock:
+            entry = self._queries.get(key)
+            if entry is not None and entry[0] <= time.monotonic():
+                self._discard_query(key)
+                entry = None
+            if entry is not None:
+                self._queries.move_to_end(key)
+        self._record("query", entry is not None)
+        return (True, entry[1]) if entry else (False, None)
+
+    def put_query(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._discard_query(key)
+            size = estimate_size(value)
+            self._queries[key] = (time.monotonic() + self.ttl, value, size)
+            self._query_bytes += size
+            while len(self._queries) > self.max_queries:
+                self._discard_query(next(iter(self._queries)))
+        self._update_gauges()
+
+    def clear_queries(self) -> None:
+        """Drop every cached query result (after any graph write)."""
+        with self._lock:
+            self._queries.clear()
+            self._query_bytes = 0
+        self._update_gauges()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._nodes.clear()
+            self._queries.clear()
+            self._node_bytes = 0
+            self._query_bytes = 0
+        self._update_gauges()
+
+    # --- Stats ---
+
+    @property
+    def approx_bytes(self) -> int:
+        return self._node_bytes + self._query_bytes
+
+    def get_stats(self) -> dict[str, Any]:
+        """Entry counts, hit ratios and estimated footprint."""
+        stats: dict[str, Any] = {
+            "nodes": len(self._nodes),
+            "queries": len(self._queries),
+            "approx_bytes": self.approx_bytes,
+        }
+        for kind in ("node", "query"):
+            lookups = self.hits[kind] + self.misses[kind]
+            stats[f"{kind}_hit_ratio"] = self.hits[kind] / lookups if lookups else 0.0
+        return stats
+
+    def _discard_node(self, node_id: str) -> None:
+        entry = self._nodes.pop(node_id, None)
+        if entry is not None:
+            self._node_bytes -= entry[2]
+
+    def _discard_query(self, key: Hashable) -> None:
+        entry = self._queries.pop(key, None)
+        if entry is not None:
+            self._query_bytes -= entry[2]
+
+    def _record(self, kind: str, hit: bool) -> None:
+        if hit:
+            self.hits[kind] += 1
+        else:
+            self.misses[kind] += 1
+        get_metrics().graph_cache_requests_total.labels(
+            kind=kind, result="hit" if hit else "miss"
+        ).inc()
+
+    def _update_gauges(self) -> None:
+        metrics = get_metrics()
+        metrics.graph_cache_entries.labels(kind="node").set(len(self._nodes))
+        metrics.graph_cache_entries.labels(kind="query").set(len(self._queries))
+        metrics.graph_cache_bytes.set(self.approx_bytes)
+
+
+class CachedGraphRepository(GraphRepository):
+    """GraphRepository that reads through a GraphCache."""
+
+    def __init__(self,
+                 session: Optional[Session] = None,
+                 cache: Optional[GraphCache] = None,
+                 session_factory: Optional[Callable[[], Session]] = None):
+        super().__init__(session, session_factory)
+        self.cache = cache or GraphCache()
+        # Cached writes from a rolled-back shared transaction must not
+        # survive it. Factory sessions commit each write before caching it.
+        if session is not None:
+            event.listen(session, "after_rollback", self._on_rollback)
+
+    def _on_rollback(self, session: Session) -> None:
+        self.cache.clear()
+
+    def _cached(self, key: Hashable, load: Callable[[], Any]) -> Any:
+        hit, value = self.cache.get_query(key)
+        if hit:
+            return value
+        value = load()
+        self.cache.put_query(key, value)
+        return value
+
+    # --- Writes (invalidate) ---
+
+    def add_node(self, node: Node) -> str:
+        node_id = super().add_node(node)
+        self.cache.put_node(node)
+        self.cache.clear_queries()
+        return node_id
+
+    def add_edge(self, edge: Edge) -> str:
+        edge_id = super().add_edge(edge)
+        self.cache.clear_queries()
+        return edge_id
+
+    def add_many(self, nodes: Iterable[Node], edges: Iterable[Edge] = ()) -> None:
+        nodes = list(nodes)
+        super().add_many(nodes, edges)
+        for node in nodes:
+            self.cache.put_node(node)
+        self.cache.clear_queries()
+
+    def invalidate_node(self, node_id: str, at: Optional[datetime] = None) -> bool:
+        invalidated = super().invalidate_node(node_id, at)
+        self.cache.evict_node(node_id)
+        self.cache.clear_queries()
+        return invalidated
+
+    # --- Reads ---
+
+    def get_node(self, node_id: str) -> Optional[Node]:
+        node = self.cache.get_node(node_id)
+        if node is None:
+            node = super().get_node(node_id)
+            if node is not None:
+                self.cache.put_node(node)
+        return node
+
+    def get_nodes_by_type(self,
+                          node_type: NodeType,
+                          valid_only: bool = True,
+                          limit: int = 100) -> list[Node]:
+        return self._cached(
+            ("nodes_by_type", node_type, valid_only, limit),
+            lambda: super(CachedGraphRepository, self).get_nodes_by_type(
+                node_type, valid_only, limit
+            ),
+        )
+
+    def search_nodes(self,
+                     data_filter: dict[str, Any],
+                     node_type: Optional[NodeType] = None,
+                     limit: int = 100) -> list[Node]:
+        key = ("search", json.dumps(data_filter, sort_keys=True, default=str), node_type, limit)
+        return self._cached(
+            key,
+            lambda: super(CachedGraphRepository, self).search_nodes(data_filter, node_type, limit),
+        )
+
+    def get_neighbors(self,
+                      node_id: str,
+                      relation: Optional[EdgeRelation] = None,
+                      direction: str = "outgoing") -> list[Node]:
+        return self._cached(
+            ("neighbors", node_id, relation, direction),
+            lambda: super(CachedGraphRepository, self).get_neighbors(node_id, relation, direction),
+        )
+
+    def traverse(self,
+                 node_id: str,
+                 direction: str = "outgoing",
+                 relations: Optional[Iterable[EdgeRelation]] = None,
+                 max_depth: int = 10,
+                 valid_at: Optional[datetime] = None) -> Subgraph:
+        relations = tuple(relations) if relations else None
+        key = ("traverse", node_id, direction, relations, max_depth, valid_at)
+        return self._cached(
+            key,
+            lambda: super(CachedGraphRepository, self).traverse(
+                node_id, direction, relations, max_depth, valid_at
+            ),
+        )
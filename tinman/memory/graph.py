@@ -1,16 +1,46 @@
 """Research Memory Graph - core API for behavioral lineage tracking."""
 
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
 from sqlalchemy.orm import Session
 
 from ..utils import get_logger
-from .models import Node, Edge, NodeType, EdgeRelation
+from .models import Node, Edge, NodeType, EdgeRelation, Subgraph
+from .backends import GraphBackend, InMemoryGraphRepository
+from .cache import CachedGraphRepository, GraphCache
 from .repository import GraphRepository
 
 logger = get_logger("memory_graph")
 
 
+def sqlite_url(path: Optional[str] = None) -> str:
+    """SQLAlchemy URL for an embedded SQLite graph (in memory if no path)."""
+    if not path or path == ":memory:":
+        return "sqlite://"
+    return f"sqlite:///{Path(path).expanduser()}"
+
+
+class GraphBatch:
+    """Unit of work that buffers node and edge writes for one bulk flush."""
+
+    def __init__(self):
+        self.nodes: dict[str, Node] = {}
+        self.edges: list[Edge] = []
+
+    def add_node(self, node: Node) -> str:
+        self.nodes[node.id] = node
+        return node.id
+
+    def add_edge(self, edge: Edge) -> str:
+        self.edges.append(edge)
+        return edge.id
+
+    def __len__(self) -> int:
+        return len(self.nodes) + len(self.edges)
+
+
 class MemoryGraph:
     """
     Research Memory Graph with temporal versioning.
@@ -23,19 +53,103 @@ class MemoryGraph:
 
     Supports temporal queries ("what did we know at time T?")
     and lineage tracking ("what caused this failure?").
+
+    Storage is pluggable (see tinman.memory.backends): PostgreSQL or
+    SQLite through a session, or MemoryGraph.in_memory() with no database.
+    Pass a GraphCache to serve repeated SQL reads from memory; see
+    tinman.memory.cache for the invalidation rules.
+
+    Writes made inside ``with graph.batch():`` are buffered and persisted
+    with one bulk insert per table when the block exits:
+
+        with graph.batch():
+            for failure in failures:
+                graph.record_failure(...)
     """
 
-    def __init__(self, session: Session):
-        self.repo = GraphRepository(session)
+    def __init__(self,
+                 session: Optional[Session] = None,
+                 cache: Optional[GraphCache] = None,
+                 backend: Optional[GraphBackend] = None,
+                 session_factory: Optional[Callable[[], Session]] = None):
+        """
+        Args:
+            session: SQLAlchemy session shared with the caller
+            cache: Optional read-through cache (SQL storage only)
+            backend: Storage backend to use instead of SQL
+            session_factory: Session factory; every graph call checks out
+                its own pooled connection and commits on success
+        """
+        if backend is not None:
+            self.repo = backend
+        elif session is None and session_factory is None:
+            raise ValueError("MemoryGraph needs a session, session_factory or backend")
+        elif cache is not None:
+            self.repo = CachedGraphRepository(session, cache, session_factory=session_factory)
+        else:
+            self.repo = GraphRepository(session, session_factory)
+        self.cache = cache if backend is None else None
+        self._batch: Optional[GraphBatch] = None
+
+    @classmethod
+    def in_memory(cls) -> "MemoryGraph":
+        """Graph held in process memory (nothing is persisted)."""
+        return cls(backend=InMemoryGraphRepository())
+
+    @classmethod
+    def sqlite(cls, path: Optional[str] = None, cache: Optional[GraphCache] = None) -> "MemoryGraph":
+        """Graph stored in an embedded SQLite database (in memory if no path)."""
+        from ..db.connection import Database
+
+        db = Database(sqlite_url(path))
+        db.create_tables()
+        return cls(cache=cache, session_factory=db.SessionLocal)
+
+    # --- Batching ---
+
+    @contextmanager
+    def batch(self) -> Iterator[GraphBatch]:
+        """Buffer writes and flush them in bulk when the block exits.
+
+        Nested calls join the outermost batch. If the block raises, the
+        buffered writes are discarded. Buffered nodes are visible to
+        get_node before the flush.
+        """
+        if self._batch is not None:
+            yield self._batch
+            return
+
+        batch = GraphBatch()
+        self._batch = batch
+        try:
+            yield batch
+        finally:
+            self._batch = None
+        if batch:
+            self.repo.add_many(batch.nodes.values(), batch.edges)
+
+    def add_many(self, nodes: Iterable[Node], edges: Iterable[Edge] = ()) -> None:
+        """Add several nodes and edges with bulk inserts."""
+        if self._batch is not None:
+            for node in nodes:
+                self._batch.add_node(node)
+            for edge in edges:
+                self._batch.add_edge(edge)
+            return
+        self.repo.add_many(nodes, edges)
 
     # --- Node Operations ---
 
     def add_node(self, node: Node) -> str:
         """Add a node to the graph."""
+        if self._batch is not None:
+            return self._batch.add_node(node)
         return self.repo.add_node(node)
 
     def get_node(self, node_id: str) -> Optional[Node]:
         """Get a node by ID."""
+        if self._batch is not None and node_id in self._batch.nodes:
+            return self._batch.nodes[node_id]
         return self.repo.get_node(node_id)
 
     def invalidate_node(self, node_id: str) -> bool:
@@ -46,6 +160,8 @@ class MemoryGraph:
 
     def add_edge(self, edge: Edge) -> str:
         """Add an edge to the graph."""
+        if self._batch is not None:
+            return self._batch.add_edge(edge)
         return self.repo.add_edge(edge)
 
     def link(self,
@@ -92,6 +208,30 @@ class MemoryGraph:
         """Get neighboring nodes."""
         return self.repo.get_neighbors(node_id, relation, direction)
 
+    def get_ancestors(self,
+                      node_id: str,
+                      relations: Optional[Iterable[EdgeRelation]] = None,
+                      max_depth: int = 10,
+                      valid_at: Optional[datetime] = None) -> Subgraph:
+        """Get every node with a path into this one, as a subgraph."""
+        return self.repo.get_ancestors(node_id, relations, max_depth, valid_at)
+
+    def get_descendants(self,
+                        node_id: str,
+                        relations: Optional[Iterable[EdgeRelation]] = None,
+                        max_depth: int = 10,
+                        valid_at: Optional[datetime] = None) -> Subgraph:
+        """Get every node reachable from this one, as a subgraph."""
+        return self.repo.get_descendants(node_id, relations, max_depth, valid_at)
+
+    def get_neighborhood(self,
+                         node_id: str,
+                         hops: int = 1,
+                         relations: Optional[Iterable[EdgeRelation]] = None,
+                         valid_at: Optional[datetime] = None) -> Subgraph:
+        """Get the k-hop neighborhood of a node, ignoring edge direction."""
+        return self.repo.get_neighborhood(node_id, hops, relations, valid_at)
+
     # --- Temporal Queries ---
 
     def snapshot_at(self,
@@ -111,7 +251,8 @@ class MemoryGraph:
         """
         Get the causal lineage of a node.
 
-        Returns the chain of causes from effect to root cause.
+        Returns every cause (multi-parent), nearest first, down to the
+        root causes.
         """
         return self.repo.get_lineage(node_id, max_depth)
 
@@ -302,9 +443,58 @@ class MemoryGraph:
     # --- Statistics ---
 
     def get_stats(self) -> dict[str, int]:
-        """Get graph statistics."""
-        stats = {}
-        for node_type in NodeType:
-            nodes = self.repo.get_nodes_by_type(node_type, valid_only=False, limit=10000)
-            stats[node_type.value] = len(nodes)
-        return stats
+        """Get node counts per type (aggregate query, no rows loaded)."""
+        return self.repo.count_by_type()
+
+    def nodes_between(self,
+                      node_type: NodeType,
+                      start: Optional[datetime] = None,
+                      end: Optional[datetime] = None,
+                      filters: Optional[dict[str, Any]] = None,
+                      limit: Optional[int] = None) -> list[Node]:
+        """Get nodes created in a time window, filtered in the database."""
+        return self.repo.nodes_between(node_type, start, end, filters, limit)
+
+    def count_between(self,
+                      node_type: NodeType,
+                      start: Optional[datetime] = None,
+                      end: Optional[datetime] = None,
+                      group_by: Sequence[str] = (),
+                      filters: Optional[dict[str, Any]] = None,
+                      bucket: Optional[str] = None,
+                      periods: Optional[Sequence[datetime]] = None) -> list[dict[str, Any]]:
+        """
+        Count nodes created in a time window, grouped server-side.
+
+        See GraphRepository.count_between for the grouping options.
+        """
+        return self.repo.count_between(
+            node_type, start, end, group_by, filters, bucket, periods
+        )
+
+    def get_detailed_stats(self,
+                           since: Optional[datetime] = None,
+                           bucket: str = "hour") -> dict[str, Any]:
+        """
+        Get graph statistics computed with GROUP BY queries.
+
+        Args:
+            since: Start of the window for activity and time-bucketed counts
+            bucket: Time bucket size for created-over-time counts ("hour", "day")
+        """
+        return {
+            "nodes_by_type": self.repo.count_by_type(),
+            "validity_by_type": self.repo.count_by_validity(),
+            "failures_by_severity": self.repo.count_by_field(NodeType.FAILURE_MODE, "severity"),
+            "failures_by_class": self.repo.count_by_field(NodeType.FAILURE_MODE, "primary_class"),
+            "unresolved_failures_by_severity": self.repo.count_by_field(
+                NodeType.FAILURE_MODE, "severity", unresolved_only=True
+            ),
+            "interventions_by_risk_tier": self.repo.count_by_field(
+                NodeType.INTERVENTION, "risk_tier"
+            ),
+            "created_over_time": [
+                (start.isoformat(), count)
+                for start, count in self.repo.count_over_time(since=since, bucket=bucket)
+            ],
+        }
@@ -117,6 +117,31 @@ class Edge:
         )
 
 
+@dataclass
+class Subgraph:
+    """Nodes and edges reached by a traversal from a root node."""
+    root_id: str
+    nodes: dict[str, Node] = field(default_factory=dict)
+    edges: list[Edge] = field(default_factory=list)
+    depths: dict[str, int] = field(default_factory=dict)  # node id -> hops from root
+
+    def __len__(self) -> int:
+        return len(self.nodes)
+
+    def nodes_of_type(self, node_type: NodeType) -> list[Node]:
+        """Reached nodes of one type, nearest first."""
+        return sorted(
+            (n for n in self.nodes.values() if n.node_type == node_type),
+            key=lambda n: self.depths[n.id],
+        )
+
+    def edges_into(self, node_id: str) -> list[Edge]:
+        return [e for e in self.edges if e.dst_id == node_id]
+
+    def edges_from(self, node_id: str) -> list[Edge]:
+        return [e for e in self.edges if e.src_id == node_id]
+
+
 # Convenience constructors for common node types
 
 def create_hypothesis_node(
@@ -1,124 +1,202 @@
-"""PostgreSQL repository for the Research Memory Graph."""
+"""SQL repository for the Research Memory Graph (PostgreSQL or SQLite)."""
 
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Callable, Iterable, Iterator, Optional, Sequence
+import re
+from sqlalchemy import String, and_, case, cast, func, insert, literal, literal_column, or_, select
 from sqlalchemy.orm import Session
 
 from ..db.models import NodeModel, EdgeModel
 from ..utils import utc_now, get_logger
-from .models import Node, Edge, NodeType, EdgeRelation
+from .backends import GraphBackend
+from .models import Node, Edge, NodeType, EdgeRelation, Subgraph
 
 logger = get_logger("graph_repository")
 
+JSON_BOOLEANS = {"true": True, "false": False}
 
-class GraphRepository:
+# Data keys that can be inlined into a SQLite JSON path literal
+SAFE_DATA_KEY = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+# strftime formats truncating a timestamp to a bucket (non-PostgreSQL backends)
+TIME_BUCKET_FORMATS = {
+    "hour": "%Y-%m-%d %H:00:00",
+    "day": "%Y-%m-%d 00:00:00",
+}
+
+
+class GraphRepository(GraphBackend):
     """
-    PostgreSQL persistence layer for the Research Memory Graph.
+    SQL persistence layer for the Research Memory Graph.
 
     Handles storage and retrieval of nodes and edges with
-    temporal versioning support.
+    temporal versioning support. PostgreSQL uses JSONB operators;
+    SQLite uses JSON1 functions.
     """
 
-    def __init__(self, session: Session):
+    def __init__(self,
+                 session: Optional[Session] = None,
+                 session_factory: Optional[Callable[[], Session]] = None):
+        """
+        Args:
+            session: Session to share with the caller, whose transaction
+                owns commit and rollback
+            session_factory: Session factory (e.g. Database.SessionLocal);
+                each call then runs as its own unit of work on a pooled
+                connection and commits on success
+        """
+        if (session is None) == (session_factory is None):
+            raise ValueError("GraphRepository needs exactly one of session or session_factory")
         self.session = session
+        self.session_factory = session_factory
+        self._dialect: Optional[str] = None
+
+    @property
+    def is_postgresql(self) -> bool:
+        """Whether the session is bound to PostgreSQL (JSONB operators available)."""
+        if self._dialect is None:
+            with self._session() as session:
+                self._dialect = session.get_bind().dialect.name
+        return self._dialect == "postgresql"
+
+    @contextmanager
+    def _session(self) -> Iterator[Session]:
+        """Session for one repository call."""
+        if self.session is not None:
+            yield self.session
+            return
+
+        session = self.session_factory()
+        try:
+            yield session
+            session.commit()
+        except Exception:
+            session.rollback()
+            raise
+        finally:
+            session.close()
 
     def add_node(self, node: Node) -> str:
         """Persist a node and return its ID."""
-        db_node = NodeModel(
-            id=node.id,
-            node_type=node.node_type.value,
-            created_at=node.created_at,
-            valid_from=node.valid_from,
-            valid_to=node.valid_to,
-            data=node.data,
-        )
-        self.session.add(db_node)
-        self.session.flush()
-        logger.debug(f"Added node: {node.id} ({node.node_type.value})")
-        return node.id
+        db_node = NodeModel(**self._node_row(node))
+        with self._session() as session:
+            session.add(db_node)
+            session.flush()
+            logger.debug(f"Added node: {node.id} ({node.node_type.value})")
+            return node.id
 
     def get_node(self, node_id: str) -> Optional[Node]:
         """Retrieve a node by ID."""
-        db_node = self.session.query(NodeModel).filter(
-            NodeModel.id == node_id
-        ).first()
+        with self._session() as session:
+            db_node = session.query(NodeModel).filter(
+                NodeModel.id == node_id
+            ).first()
 
-        if not db_node:
-            return None
+            if not db_node:
+                return None
 
-        return self._db_to_node(db_node)
+            return self._db_to_node(db_node)
 
     def add_edge(self, edge: Edge) -> str:
         """Persist an edge and return its ID."""
-        db_edge = EdgeModel(
-            id=edge.id,
-            src_id=edge.src_id,
-            dst_id=edge.dst_id,
-            relation=edge.relation.value,
-            created_at=edge.created_at,
-            metadata=edge.metadata,
-        )
-        self.session.add(db_edge)
-        self.session.flush()
-        logger.debug(f"Added edge: {edge.src_id} -[{edge.relation.value}]-> {edge.dst_id}")
-        return edge.id
+        db_edge = EdgeModel(**self._edge_row(edge))
+        with self._session() as session:
+            session.add(db_edge)
+            session.flush()
+            logger.debug(f"Added edge: {edge.src_id} -[{edge.relation.value}]-> {edge.dst_id}")
+            return edge.id
+
+    def add_many(self, nodes: Iterable[Node], edges: Iterable[Edge] = ()) -> None:
+        """Persist nodes and edges with one bulk INSERT per table.
+
+        Nodes are written before edges so edge foreign keys resolve. The
+        driver batches the rows (executemany / multi-row VALUES), so the
+        cost is a couple of statements regardless of row count.
+        """
+        node_rows = [self._node_row(n) for n in nodes]
+        edge_rows = [self._edge_row(e) for e in edges]
+
+        with self._session() as session:
+            if node_rows:
+                session.execute(insert(NodeModel), node_rows)
+            if edge_rows:
+                session.execute(insert(EdgeModel), edge_rows)
+
+        logger.debug(f"Bulk added {len(node_rows)} nodes, {len(edge_rows)} edges")
 
     def get_edge(self, edge_id: str) -> Optional[Edge]:
         """Retrieve an edge by ID."""
-        db_edge = self.session.query(EdgeModel).filter(
-            EdgeModel.id == edge_id
-        ).first()
+        with self._session() as session:
+            db_edge = session.query(EdgeModel).filter(
+                EdgeModel.id == edge_id
+            ).first()
 
-        if not db_edge:
-            return None
+            if not db_edge:
+                return None
 
-        return self._db_to_edge(db_edge)
+            return self._db_to_edge(db_edge)
 
     def get_nodes_by_type(self,
                           node_type: NodeType,
                           valid_only: bool = True,
                           limit: int = 100) -> list[Node]:
         """Get all nodes of a specific type."""
-        query = self.session.query(NodeModel).filter(
-            NodeModel.node_type == node_type.value
-        )
-
-        if valid_only:
-            now = utc_now()
-            query = query.filter(
-                NodeModel.valid_from <= now,
-                (NodeModel.valid_to.is_(None)) | (NodeModel.valid_to >= now)
+        with self._session() as session:
+            query = session.query(NodeModel).filter(
+                NodeModel.node_type == node_type.value
             )
 
-        query = query.order_by(NodeModel.created_at.desc()).limit(limit)
+            if valid_only:
+                now = utc_now()
+                query = query.filter(
+                    NodeModel.valid_from <= now,
+                    (NodeModel.valid_to.is_(None)) | (NodeModel.valid_to >= now)
+                )
+
+            query = query.order_by(NodeModel.created_at.desc()).limit(limit)
 
-        return [self._db_to_node(n) for n in query.all()]
+            return [self._db_to_node(n) for n in query.all()]
 
     def get_outgoing_edges(self,
                            node_id: str,
                            relation: Optional[EdgeRelation] = None) -> list[Edge]:
         """Get edges originating from a node."""
-        query = self.session.query(EdgeModel).filter(
-            EdgeModel.src_id == node_id
-        )
+        with self._session() as session:
+            query = session.query(EdgeModel).filter(
+                EdgeModel.src_id == node_id
+            )
 
-        if relation:
-            query = query.filter(EdgeModel.relation == relation.value)
+            if relation:
+                query = query.filter(EdgeModel.relation == relation.value)
 
-        return [self._db_to_edge(e) for e in query.all()]
+            return [self._db_to_edge(e) for e in query.all()]
 
     def get_incoming_edges(self,
                            node_id: str,
                            relation: Optional[EdgeRelation] = None) -> list[Edge]:
         """Get edges pointing to a node."""
-        query = self.session.query(EdgeModel).filter(
-            EdgeModel.dst_id == node_id
-        )
+        with self._session() as session:
+            query = session.query(EdgeModel).filter(
+                EdgeModel.dst_id == node_id
+            )
+
+            if relation:
+                query = query.filter(EdgeModel.relation == relation.value)
 
-        if relation:
-            query = query.filter(EdgeModel.relation == relation.value)
+            return [self._db_to_edge(e) for e in query.all()]
 
-        return [self._db_to_edge(e) for e in query.all()]
+    def get_edges_from_nodes(self,
+                             node_ids: Sequence[str],
+                             relations: Optional[Iterable[EdgeRelation]] = None) -> list[Edge]:
+        """Get outgoing edges of many nodes in one query."""
+        if not node_ids:
+            return []
+        with self._session() as session:
+            query = session.query(EdgeModel).filter(EdgeModel.src_id.in_(list(node_ids)))
+            if relations:
+                query = query.filter(EdgeModel.relation.in_([r.value for r in relations]))
+            return [self._db_to_edge(e) for e in query.all()]
 
     def get_neighbors(self,
                       node_id: str,
@@ -126,33 +204,126 @@ class GraphRepository:
                       direction: str = "outgoing") -> list[Node]:
         """Get neighboring nodes."""
         if direction == "outgoing":
-            edges = self.get_outgoing_edges(node_id, relation)
-            neighbor_ids = [e.dst_id for e in edges]
+            edge_end, neighbor_end = EdgeModel.src_id, EdgeModel.dst_id
         else:
-            edges = self.get_incoming_edges(node_id, relation)
-            neighbor_ids = [e.src_id for e in edges]
+            edge_end, neighbor_end = EdgeModel.dst_id, EdgeModel.src_id
 
-        if not neighbor_ids:
-            return []
+        with self._session() as session:
+            query = session.query(NodeModel).join(
+                EdgeModel, NodeModel.id == neighbor_end
+            ).filter(edge_end == node_id)
+
+            if relation:
+                query = query.filter(EdgeModel.relation == relation.value)
 
-        db_nodes = self.session.query(NodeModel).filter(
-            NodeModel.id.in_(neighbor_ids)
-        ).all()
+            return [self._db_to_node(n) for n in query.distinct().all()]
 
-        return [self._db_to_node(n) for n in db_nodes]
+    def traverse(self,
+                 node_id: str,
+                 direction: str = "outgoing",
+                 relations: Optional[Iterable[EdgeRelation]] = None,
+                 max_depth: int = 10,
+                 valid_at: Optional[datetime] = None) -> Subgraph:
+        """
+        Collect everything reachable from a node in one recursive query.
+
+        Args:
+            node_id: Root of the traversal
+            direction: "outgoing" follows src -> dst, "incoming" follows
+                dst -> src, "both" ignores edge direction
+            relations: Only follow these edge relations (all if None)
+            max_depth: Maximum number of hops from the root
+            valid_at: Only pass through nodes valid at this time; traversal
+                stops at nodes outside their validity window
+
+        Returns:
+            Subgraph holding reached nodes (root excluded), the edges used
+            to reach them and each node's shortest hop count
+        """
+        if direction not in ("outgoing", "incoming", "both"):
+            raise ValueError(f"Unknown traversal direction: {direction}")
+
+        relation_values = [r.value for r in relations] if relations else None
+
+        def hop(frontier_id):
+            """Edge match condition and far endpoint for one hop."""
+            if direction == "outgoing":
+                return EdgeModel.src_id == frontier_id, EdgeModel.dst_id
+            if direction == "incoming":
+                return EdgeModel.dst_id == frontier_id, EdgeModel.src_id
+            return (
+                or_(EdgeModel.src_id == frontier_id, EdgeModel.dst_id == frontier_id),
+                case((EdgeModel.src_id == frontier_id, EdgeModel.dst_id), else_=EdgeModel.src_id),
+            )
+
+        def step_filters():
+            filters = []
+            if relation_values is not None:
+                filters.append(EdgeModel.relation.in_(relation_values))
+            if valid_at is not None:
+                filters.append(NodeModel.valid_from <= valid_at)
+                filters.append(or_(NodeModel.valid_to.is_(None), NodeModel.valid_to >= valid_at))
+            return filters
+
+        match, far_end = hop(node_id)
+        anchor = (
+            select(
+                EdgeModel.id.label("edge_id"),
+                far_end.label("node_id"),
+                literal(1).label("depth"),
+            )
+            .join(NodeModel, NodeModel.id == far_end)
+            .where(match, *step_filters())
+        )
+        walk = anchor.cte("walk", recursive=True)
+
+        match, far_end = hop(walk.c.node_id)
+        recursive = (
+            select(EdgeModel.id, far_end, walk.c.depth + 1)
+            .select_from(walk)
+            .join(EdgeModel, match)
+            .join(NodeModel, NodeModel.id == far_end)
+            .where(walk.c.depth < max_depth, *step_filters())
+        )
+        walk = walk.union(recursive)
+
+        reached = (
+            select(walk.c.edge_id, walk.c.node_id, func.min(walk.c.depth).label("depth"))
+            .group_by(walk.c.edge_id, walk.c.node_id)
+            .subquery()
+        )
+        with self._session() as session:
+            rows = session.execute(
+                select(EdgeModel, NodeModel, reached.c.depth)
+                .join(reached, EdgeModel.id == reached.c.edge_id)
+                .join(NodeModel, NodeModel.id == reached.c.node_id)
+                .order_by(reached.c.depth)
+            ).all()
+
+            subgraph = Subgraph(root_id=node_id)
+            for db_edge, db_node, depth in rows:
+                node = self._db_to_node(db_node)
+                if node.id == node_id:
+                    continue
+                if node.id not in subgraph.nodes:
+                    subgraph.nodes[node.id] = node
+                    subgraph.depths[node.id] = depth
+                subgraph.edges.append(self._db_to_edge(db_edge))
+            return subgraph
 
     def invalidate_node(self, node_id: str, at: Optional[datetime] = None) -> bool:
         """Mark a node as no longer valid."""
-        db_node = self.session.query(NodeModel).filter(
-            NodeModel.id == node_id
-        ).first()
+        with self._session() as session:
+            db_node = session.query(NodeModel).filter(
+                NodeModel.id == node_id
+            ).first()
 
-        if not db_node:
-            return False
+            if not db_node:
+                return False
 
-        db_node.valid_to = at or utc_now()
-        self.session.flush()
-        return True
+            db_node.valid_to = at or utc_now()
+            session.flush()
+            return True
 
     def query_at_time(self,
                       node_type: Optional[NodeType] = None,
@@ -165,48 +336,18 @@ class GraphRepository:
         """
         timestamp = at or utc_now()
 
-        query = self.session.query(NodeModel).filter(
-            NodeModel.valid_from <= timestamp,
-            (NodeModel.valid_to.is_(None)) | (NodeModel.valid_to >= timestamp)
-        )
-
-        if node_type:
-            query = query.filter(NodeModel.node_type == node_type.value)
-
-        query = query.order_by(NodeModel.created_at.desc()).limit(limit)
-
-        return [self._db_to_node(n) for n in query.all()]
-
-    def get_lineage(self, node_id: str, max_depth: int = 10) -> list[tuple[Node, Edge]]:
-        """
-        Get the causal lineage of a node.
-
-        Traverses CAUSED_BY edges to find the causal chain.
-        Returns list of (node, edge) tuples from effect to cause.
-        """
-        lineage = []
-        current_id = node_id
-        visited = set()
-
-        for _ in range(max_depth):
-            if current_id in visited:
-                break
-            visited.add(current_id)
-
-            # Get incoming CAUSED_BY edges
-            edges = self.get_incoming_edges(current_id, EdgeRelation.CAUSED_BY)
-            if not edges:
-                break
+        with self._session() as session:
+            query = session.query(NodeModel).filter(
+                NodeModel.valid_from <= timestamp,
+                (NodeModel.valid_to.is_(None)) | (NodeModel.valid_to >= timestamp)
+            )
 
-            edge = edges[0]  # Take first cause
-            cause_node = self.get_node(edge.src_id)
-            if not cause_node:
-                break
+            if node_type:
+                query = query.filter(NodeModel.node_type == node_type.value)
 
-            lineage.append((cause_node, edge))
-            current_id = cause_node.id
+            query = query.order_by(NodeModel.created_at.desc()).limit(limit)
 
-        return lineage
+            return [self._db_to_node(n) for n in query.all()]
 
     def get_failure_evolution(self, failure_class: str, limit: int = 50) -> list[Node]:
         """
@@ -216,12 +357,13 @@ class GraphRepository:
         EVOLVED_INTO edges where present.
         """
         # Get all failure nodes of this class
-        failures = self.session.query(NodeModel).filter(
-            NodeModel.node_type == NodeType.FAILURE_MODE.value,
-            NodeModel.data["primary_class"].astext == failure_class
-        ).order_by(NodeModel.created_at.asc()).limit(limit).all()
+        with self._session() as session:
+            failures = session.query(NodeModel).filter(
+                NodeModel.node_type == NodeType.FAILURE_MODE.value,
+                *self._data_conditions({"primary_class": failure_class}),
+            ).order_by(NodeModel.created_at.asc()).limit(limit).all()
 
-        return [self._db_to_node(f) for f in failures]
+            return [self._db_to_node(f) for f in failures]
 
     def search_nodes(self,
                      data_filter: dict[str, Any],
@@ -230,27 +372,323 @@ class GraphRepository:
         """
         Search nodes by data field values.
 
-        Uses PostgreSQL JSONB operators for efficient querying.
+        On PostgreSQL the whole filter becomes one containment predicate
+        (data @> filter) served by the GIN jsonb_path_ops index. Scalar
+        values match exactly; list and dict values match when the stored
+        value contains them.
         """
-        query = self.session.query(NodeModel)
+        with self._session() as session:
+            query = session.query(NodeModel)
+
+            if node_type:
+                query = query.filter(NodeModel.node_type == node_type.value)
+
+            query = query.filter(*self._data_conditions(data_filter))
+
+            query = query.order_by(NodeModel.created_at.desc()).limit(limit)
 
+            return [self._db_to_node(n) for n in query.all()]
+
+    def count_by_type(self, valid_at: Optional[datetime] = None) -> dict[str, int]:
+        """
+        Count nodes per type with a single GROUP BY.
+
+        Every node type is present in the result (zero if absent). If
+        valid_at is given, only nodes valid at that time are counted.
+        """
+        query = select(NodeModel.node_type, func.count()).group_by(NodeModel.node_type)
+        if valid_at is not None:
+            query = query.where(*self._valid_at(valid_at))
+
+        counts = {node_type.value: 0 for node_type in NodeType}
+        with self._session() as session:
+            counts.update(dict(session.execute(query).all()))
+        return counts
+
+    def count_by_validity(self, at: Optional[datetime] = None) -> dict[str, dict[str, int]]:
+        """Count valid and invalidated nodes per type."""
+        is_valid = case((and_(*self._valid_at(at or utc_now())), 1), else_=0)
+        query = select(
+            NodeModel.node_type,
+            func.sum(is_valid),
+            func.count(),
+        ).group_by(NodeModel.node_type)
+
+        counts = {node_type.value: {"valid": 0, "invalid": 0} for node_type in NodeType}
+        with self._session() as session:
+            rows = session.execute(query).all()
+        for node_type, valid, total in rows:
+            counts[node_type] = {"valid": int(valid or 0), "invalid": total - int(valid or 0)}
+        return counts
+
+    def count_by_field(self,
+                       node_type: NodeType,
+                       field: str,
+                       valid_only: bool = False,
+                       unresolved_only: bool = False) -> dict[str, int]:
+        """
+        Count nodes of one type grouped by a top-level data field.
+
+        Nodes missing the field are counted under "unknown".
+        unresolved_only skips nodes whose data has is_resolved set.
+        """
+        value = self._data_text(field)
+        query = (
+            select(value, func.count())
+            .where(NodeModel.node_type == node_type.value)
+            .group_by(value)
+        )
+        if valid_only:
+            query = query.where(*self._valid_at(utc_now()))
+        if unresolved_only:
+            resolved = NodeModel.data["is_resolved"].as_boolean()
+            query = query.where(func.coalesce(resolved, False) == False)  # noqa: E712
+
+        with self._session() as session:
+            rows = session.execute(query).all()
+        return {(key if key is not None else "unknown"): count for key, count in rows}
+
+    def activity_since(self, since: datetime) -> dict[str, dict[str, Any]]:
+        """
+        Per-type activity summary in one query.
+
+        Returns {node_type: {"total", "recent", "last_created_at"}} where
+        recent counts nodes created at or after since.
+        """
+        recent = case((NodeModel.created_at >= since, 1), else_=0)
+        query = select(
+            NodeModel.node_type,
+            func.count(),
+            func.sum(recent),
+            func.max(NodeModel.created_at),
+        ).group_by(NodeModel.node_type)
+
+        activity = {
+            node_type.value: {"total": 0, "recent": 0, "last_created_at": None}
+            for node_type in NodeType
+        }
+        with self._session() as session:
+            rows = session.execute(query).all()
+        for node_type, total, recent_count, last_created in rows:
+            activity[node_type] = {
+                "total": total,
+                "recent": int(recent_count or 0),
+                "last_created_at": self._as_datetime(last_created),
+            }
+        return activity
+
+    def nodes_between(self,
+                      node_type: NodeType,
+                      start: Optional[datetime] = None,
+                      end: Optional[datetime] = None,
+                      data_filter: Optional[dict[str, Any]] = None,
+                      limit: Optional[int] = None) -> list[Node]:
+        """
+        Get nodes of a type created within [start, end], oldest first.
+
+        The time window and data filter are applied in the database, and
+        there is no implicit row limit.
+        """
+        with self._session() as session:
+            query = session.query(NodeModel).filter(
+                NodeModel.node_type == node_type.value,
+                *self._created_between(start, end),
+                *self._data_conditions(data_filter or {}),
+            ).order_by(NodeModel.created_at.asc())
+
+            if limit is not None:
+                query = query.limit(limit)
+
+            return [self._db_to_node(n) for n in query.all()]
+
+    def count_between(self,
+                      node_type: NodeType,
+                      start: Optional[datetime] = None,
+                      end: Optional[datetime] = None,
+                      group_by: Sequence[str] = (),
+                      data_filter: Optional[dict[str, Any]] = None,
+                      bucket: Optional[str] = None,
+                      periods: Optional[Sequence[datetime]] = None) -> list[dict[str, Any]]:
+        """
+        Count nodes created within [start, end] in one GROUP BY query.
+
+        Args:
+            node_type: Type of node to count
+            start: Window start (inclusive), unbounded if None
+            end: Window end (inclusive), unbounded if None
+            group_by: Top-level data keys to group on
+            data_filter: Data values every counted node must match
+            bucket: Also group by creation time bucket ("hour" or "day")
+            periods: Also group by period, given as ascending period start
+                times; nodes before the first start are in period -1
+
+        Returns:
+            One dict per group holding the group_by keys (JSON booleans as
+            bool, missing keys as None), "bucket" and/or "period" when
+            requested, and "count"
+        """
+        # Each key's text value, then whether it holds a JSON boolean, so only
+        # real booleans (not the strings "true"/"false") come back as bool
+        columns = [self._data_text(key) for key in group_by]
+        columns += [self._data_is_boolean(key) for key in group_by]
+        if bucket is not None:
+            columns.append(self._time_bucket(bucket))
+        if periods:
+            # Latest boundary first, so each node lands in the period it starts
+            whens = [
+                (NodeModel.created_at >= boundary, index)
+                for index, boundary in reversed(list(enumerate(periods)))
+            ]
+            columns.append(case(*whens, else_=-1))
+
+        query = (
+            select(*columns, func.count())
+            .where(
+                NodeModel.node_type == node_type.value,
+                *self._created_between(start, end),
+                *self._data_conditions(data_filter or {}),
+            )
+            .group_by(*columns)
+        )
+
+        with self._session() as session:
+            results = session.execute(query).all()
+
+        keys = len(group_by)
+        rows = []
+        for row in results:
+            values: dict[str, Any] = {}
+            for i, key in enumerate(group_by):
+                values[key] = JSON_BOOLEANS[row[i]] if row[keys + i] else row[i]
+            extra = iter(row[2 * keys:-1])
+            if bucket is not None:
+                values["bucket"] = self._as_datetime(next(extra))
+            if periods:
+                values["period"] = next(extra)
+            values["count"] = row[-1]
+            rows.append(values)
+        return rows
+
+    def count_over_time(self,
+                        node_type: Optional[NodeType] = None,
+                        since: Optional[datetime] = None,
+                        bucket: str = "hour") -> list[tuple[datetime, int]]:
+        """
+        Count nodes created per time bucket ("hour" or "day").
+
+        Returns (bucket start, count) pairs in chronological order;
+        empty buckets are omitted.
+        """
+        bucket_start = self._time_bucket(bucket)
+        query = select(bucket_start, func.count()).group_by(bucket_start).order_by(bucket_start)
         if node_type:
-            query = query.filter(NodeModel.node_type == node_type.value)
+            query = query.where(NodeModel.node_type == node_type.value)
+        if since:
+            query = query.where(NodeModel.created_at >= since)
 
-        # Apply JSONB filters
+        with self._session() as session:
+            rows = session.execute(query).all()
+        return [(self._as_datetime(start), count) for start, count in rows]
+
+    def _data_conditions(self, data_filter: dict[str, Any]) -> list:
+        """Filter conditions matching top-level data values."""
+        if not data_filter:
+            return []
+        if self.is_postgresql:
+            return [NodeModel.data.contains(data_filter)]
+
+        conditions = []
         for key, value in data_filter.items():
+            field = NodeModel.data[key]
             if isinstance(value, str):
-                query = query.filter(
-                    NodeModel.data[key].astext == value
-                )
+                conditions.append(self._json_text(key) == value)
+            elif isinstance(value, bool):
+                conditions.append(field.as_boolean() == value)
+            elif isinstance(value, (int, float)):
+                conditions.append(field.as_float() == value)
             else:
-                query = query.filter(
-                    NodeModel.data[key] == value
-                )
+                conditions.append(field == value)
+        return conditions
 
-        query = query.order_by(NodeModel.created_at.desc()).limit(limit)
+    def _json_text(self, key: str):
+        """
+        data->>key. On SQLite the JSON path is inlined as a literal so the
+        expression matches the idx_nodes_sqlite_* indexes.
+        """
+        if self.is_postgresql or not SAFE_DATA_KEY.match(key):
+            return NodeModel.data[key].astext
+        return NodeModel.data.op("->>")(literal_column(f"'$.\"{key}\"'"))
+
+    def _data_text(self, key: str):
+        """Text value of a top-level data key (JSON booleans as 'true'/'false')."""
+        if self.is_postgresql:
+            return NodeModel.data[key].astext
+        # SQLite's ->> returns native values (booleans as 1/0, numbers as
+        # numbers); match PostgreSQL's ->>, which always returns text
+        json_type = func.json_type(NodeModel.data, f'$."{key}"')
+        return case(
+            (json_type == "true", "true"),
+            (json_type == "false", "false"),
+            else_=cast(self._json_text(key), String),
+        )
 
-        return [self._db_to_node(n) for n in query.all()]
+    def _data_is_boolean(self, key: str):
+        """Whether a top-level data key holds a JSON boolean."""
+        if self.is_postgresql:
+            return func.coalesce(func.jsonb_typeof(NodeModel.data[key]) == "boolean", False)
+        json_type = func.json_type(NodeModel.data, f'$."{key}"')
+        return func.coalesce(json_type.in_(("true", "false")), False)
+
+    def _time_bucket(self, bucket: str):
+        """Expression truncating created_at to an hour or day bucket."""
+        if bucket not in TIME_BUCKET_FORMATS:
+            raise ValueError(f"Unknown time bucket: {bucket}")
+        if self.is_postgresql:
+            return func.date_trunc(bucket, NodeModel.created_at)
+        return func.strftime(TIME_BUCKET_FORMATS[bucket], NodeModel.created_at)
+
+    def _created_between(self, start: Optional[datetime], end: Optional[datetime]) -> list:
+        conditions = []
+        if start is not None:
+            conditions.append(NodeModel.created_at >= start)
+        if end is not None:
+            conditions.append(NodeModel.created_at <= end)
+        return conditions
+
+    def _valid_at(self, at: datetime) -> list:
+        """Filter conditions for nodes valid at a point in time."""
+        return [
+            NodeModel.valid_from <= at,
+            (NodeModel.valid_to.is_(None)) | (NodeModel.valid_to >= at),
+        ]
+
+    def _as_datetime(self, value: Any) -> Optional[datetime]:
+        """Normalize aggregate results (SQLite returns strings)."""
+        if value is None or isinstance(value, datetime):
+            return value
+        return datetime.fromisoformat(str(value))
+
+    def _node_row(self, node: Node) -> dict[str, Any]:
+        """Column values for a node."""
+        return {
+            "id": node.id,
+            "node_type": node.node_type.value,
+            "created_at": node.created_at,
+            "valid_from": node.valid_from,
+            "valid_to": node.valid_to,
+            "data": node.data,
+        }
+
+    def _edge_row(self, edge: Edge) -> dict[str, Any]:
+        """Column values for an edge."""
+        return {
+            "id": edge.id,
+            "src_id": edge.src_id,
+            "dst_id": edge.dst_id,
+            "relation": edge.relation.value,
+            "created_at": edge.created_at,
+            "edge_metadata": edge.metadata,
+        }
 
     def _db_to_node(self, db_node: NodeModel) -> Node:
         """Convert database model to domain model."""
@@ -271,5 +709,5 @@ class GraphRepository:
             dst_id=str(db_edge.dst_id),
             relation=EdgeRelation(db_edge.relation),
             created_at=db_edge.created_at,
-            metadata=db_edge.metadata or {},
+            metadata=db_edge.edge_metadata or {},
         )
@@ -1,6 +1,13 @@
 """LLM-powered reasoning core for Tinman."""
 
 from .llm_backbone import LLMBackbone, ReasoningContext, ReasoningResult
+from .response_cache import (
+    CachePolicy,
+    ResponseCache,
+    MemoryResponseCache,
+    SQLiteResponseCache,
+    TieredResponseCache,
+)
 from .prompts import PromptLibrary
 from .insight_synthesizer import InsightSynthesizer
 from .adaptive_memory import AdaptiveMemory
@@ -9,6 +16,11 @@ __all__ = [
     "LLMBackbone",
     "ReasoningContext",
     "ReasoningResult",
+    "CachePolicy",
+    "ResponseCache",
+    "MemoryResponseCache",
+    "SQLiteResponseCache",
+    "TieredResponseCache",
     "PromptLibrary",
     "InsightSynthesizer",
     "AdaptiveMemory",
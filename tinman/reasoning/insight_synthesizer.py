@@ -7,7 +7,7 @@ from typing import Any, Optional
 from .llm_backbone import LLMBackbone, ReasoningContext, ReasoningMode
 from .adaptive_memory import AdaptiveMemory
 from ..memory.graph import MemoryGraph
-from ..memory.models import NodeType
+from ..memory.models import EdgeRelation, NodeType
 from ..utils import generate_id, utc_now, get_logger
 
 logger = get_logger("insight_synthesizer")
@@ -343,8 +343,16 @@ Write in clear, professional prose.""",
         if not failure:
             return f"Failure {failure_id} not found."
 
-        # Get lineage
-        lineage = self.graph.get_lineage(failure_id)
+        # Full cause DAG (including failures this one evolved from) in one query
+        causes = self.graph.get_ancestors(
+            failure_id,
+            relations=[EdgeRelation.CAUSED_BY, EdgeRelation.EVOLVED_INTO],
+        )
+        cause_lines = [
+            f"{'Evolved from' if edge.relation == EdgeRelation.EVOLVED_INTO else 'Caused by'} "
+            f"(depth {causes.depths[edge.src_id]}): {causes.nodes[edge.src_id].data}"
+            for edge in sorted(causes.edges, key=lambda e: causes.depths[e.src_id])
+        ]
 
         context = ReasoningContext(
             mode=ReasoningMode.FAILURE_ANALYSIS,
@@ -353,10 +361,7 @@ Write in clear, professional prose.""",
                 f"Description: {failure.data.get('description', 'No description')}",
                 f"Trigger: {failure.data.get('trigger_signature', [])}",
                 f"Reproducibility: {failure.data.get('reproducibility', 0):.0%}",
-            ] + [
-                f"Cause chain: {node.data}"
-                for node, edge in lineage
-            ],
+            ] + cause_lines,
             task_description="Explain this failure in plain language. What happened? Why? What should we do?",
         )
 
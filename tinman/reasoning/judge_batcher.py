@@ -0,0 +1,200 @@
+"""Micro-batching for failure-analysis judge calls.
+
+Every experiment run asks the LLM backbone whether the target model's
+response shows a failure. Issued one by one, each of those calls repeats
+the full system prompt and analysis template. ``FailureAnalysisBatcher``
+coalesces requests that arrive within a short window into a single
+multi-item FAILURE_ANALYSIS call and fans the per-item verdicts back to
+the waiting callers. Items the batched response does not cover are
+re-judged individually.
+
+Usage:
+    batcher = FailureAnalysisBatcher(llm, max_batch_size=8, max_wait_ms=20)
+    verdict = await batcher.analyze(observations)  # {"failure": ..., "analysis": ...}
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+import asyncio
+
+from ..core.metrics import get_metrics
+from ..utils import get_logger
+from .llm_backbone import LLMBackbone, ReasoningContext, ReasoningMode
+
+logger = get_logger("judge_batcher")
+
+
+@dataclass
+class _PendingJudgement:
+    observations: list[str]
+    task_description: str
+    future: asyncio.Future = field(repr=False)
+
+
+@dataclass
+class BatchStats:
+    """Counters describing batching effectiveness."""
+    requests: int = 0
+    batches: int = 0
+    batched_items: int = 0
+    single_calls: int = 0
+    fallbacks: int = 0
+    tokens_used: int = 0
+    estimated_tokens_saved: int = 0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "batches": self.batches,
+            "batched_items": self.batched_items,
+            "single_calls": self.single_calls,
+            "fallbacks": self.fallbacks,
+            "tokens_used": self.tokens_used,
+            "estimated_tokens_saved": self.estimated_tokens_saved,
+            "avg_batch_size": self.batched_items / self.batches if self.batches else 0.0,
+        }
+
+
+class FailureAnalysisBatcher:
+    """Coalesces concurrent failure-analysis requests into batched LLM calls."""
+
+    def __init__(self,
+                 llm: LLMBackbone,
+                 max_batch_size: int = 8,
+                 max_wait_ms: float = 20.0):
+        """Initialize the batcher.
+
+        Args:
+            llm: Backbone used for the judge calls
+            max_batch_size: Flush as soon as this many requests are pending
+            max_wait_ms: Flush a partial batch after this long
+        """
+        self.llm = llm
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait = max_wait_ms / 1000.0
+        self.stats = BatchStats()
+        self._pending: list[_PendingJudgement] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: set[asyncio.Task] = set()
+
+    async def analyze(self,
+                      observations: list[str],
+                      task_description: str = "") -> dict[str, Any]:
+        """Judge one run, possibly as part of a batch.
+
+        Args:
+            observations: Observation lines describing the run
+            task_description: Instructions used if the item is judged alone
+
+        Returns:
+            Structured verdict with at least ``failure`` and ``analysis`` keys
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append(_PendingJudgement(observations, task_description, future))
+        self.stats.requests += 1
+
+        if len(self._pending) >= self.max_batch_size:
+            self._dispatch()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._dispatch)
+
+        return await future
+
+    async def flush(self) -> None:
+        """Dispatch any pending requests and wait for in-flight batches."""
+        if self._pending:
+            self._dispatch()
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get batching statistics, including estimated token savings."""
+        return self.stats.to_dict()
+
+    def _dispatch(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.create_task(self._run_batch(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list[_PendingJudgement]) -> None:
+        # Callers cancelled while waiting (e.g. early-stopped runs) are skipped
+        batch = [item for item in batch if not item.future.done()]
+        if not batch:
+            return
+
+        try:
+            if len(batch) == 1:
+                verdicts = {0: await self._judge_single(batch[0])}
+            else:
+                verdicts = await self._judge_batch(batch)
+                missing = [i for i in range(len(batch)) if i not in verdicts]
+                if missing:
+                    self.stats.fallbacks += len(missing)
+                    get_metrics().llm_judge_fallbacks_total.inc(len(missing))
+                    logger.warning(
+                        f"Batched judge covered {len(batch) - len(missing)}/{len(batch)} items, "
+                        f"re-judging {len(missing)} individually"
+                    )
+                    singles = await asyncio.gather(
+                        *(self._judge_single(batch[i]) for i in missing)
+                    )
+                    verdicts.update(zip(missing, singles, strict=True))
+        except Exception as e:
+            for item in batch:
+                if not item.future.done():
+                    item.future.set_exception(e)
+            return
+
+        for i, item in enumerate(batch):
+            if not item.future.done():
+                item.future.set_result(verdicts[i])
+
+    async def _judge_single(self, item: _PendingJudgement) -> dict[str, Any]:
+        context = ReasoningContext(
+            mode=ReasoningMode.FAILURE_ANALYSIS,
+            observations=item.observations,
+            task_description=item.task_description,
+        )
+        result = await self.llm.reason(context)
+        self.stats.single_calls += 1
+        self.stats.tokens_used += result.tokens_used
+        return result.structured_output
+
+    async def _judge_batch(self, batch: list[_PendingJudgement]) -> dict[int, dict[str, Any]]:
+        """Judge several items in one call; returns verdicts keyed by batch index."""
+        context = ReasoningContext(
+            mode=ReasoningMode.FAILURE_ANALYSIS,
+            constraints={"batch_items": [item.observations for item in batch]},
+        )
+        result = await self.llm.reason(context)
+
+        self.stats.batches += 1
+        self.stats.batched_items += len(batch)
+        self.stats.tokens_used += result.tokens_used
+        get_metrics().llm_judge_batch_size.observe(len(batch))
+
+        verdicts: dict[int, dict[str, Any]] = {}
+        for entry in result.structured_output.get("verdicts") or []:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                index = int(entry.get("item")) - 1
+            except (TypeError, ValueError):
+                continue
+            if 0 <= index < len(batch):
+                verdicts[index] = entry
+
+        # Every covered item beyond the first avoided a full prompt overhead
+        if verdicts:
+            saved = (len(verdicts) - 1) * self.llm.failure_analysis_overhead_tokens()
+            self.stats.estimated_tokens_saved += saved
+            get_metrics().llm_judge_tokens_saved_total.inc(saved)
+
+        return verdicts
@@ -4,7 +4,17 @@ from dataclasses import dataclass, field
 from typing import Any, Optional
 from enum import Enum
 
+from ..core.metrics import get_metrics
+from ..integrations.metered_client import attribute_costs
+from ..core.pricing import client_model
 from ..integrations.model_client import ModelClient, ModelResponse
+from .response_cache import (
+    CachePolicy,
+    ResponseCache,
+    make_cache_key,
+    response_from_dict,
+    response_to_dict,
+)
 from ..utils import generate_id, utc_now, get_logger
 
 logger = get_logger("llm_backbone")
@@ -54,6 +64,7 @@ class ReasoningResult:
     confidence: float = 0.0
     reasoning_trace: str = ""
     tokens_used: int = 0
+    from_cache: bool = False
 
     # For learning
     should_remember: bool = False
@@ -96,10 +107,14 @@ Be rigorous. Be curious. Be direct."""
     def __init__(self,
                  model_client: ModelClient,
                  temperature: float = 0.7,
-                 max_tokens: int = 4096):
+                 max_tokens: int = 4096,
+                 cache: Optional[ResponseCache] = None,
+                 cache_policy: Optional[CachePolicy] = None):
         self.client = model_client
         self.temperature = temperature
         self.max_tokens = max_tokens
+        self.cache = cache
+        self.cache_policy = cache_policy or CachePolicy()
         self._reasoning_history: list[ReasoningResult] = []
 
     async def reason(self, context: ReasoningContext) -> ReasoningResult:
@@ -116,15 +131,15 @@ Be rigorous. Be curious. Be direct."""
         messages.extend(context.history)
         messages.append({"role": "user", "content": prompt})
 
-        # Call the LLM
-        response = await self.client.complete(
-            messages=messages,
-            temperature=self.temperature,
-            max_tokens=self.max_tokens,
-        )
+        # Call the LLM (or replay an identical earlier call)
+        with attribute_costs(mode=context.mode.value):
+            response, from_cache = await self._complete(messages, context.mode)
 
         # Parse and structure the response
         result = self._parse_response(response, context.mode)
+        if from_cache:
+            result.from_cache = True
+            result.tokens_used = 0
 
         # Store for learning
         self._reasoning_history.append(result)
@@ -133,6 +148,51 @@ Be rigorous. Be curious. Be direct."""
 
         return result
 
+    async def _complete(self,
+                        messages: list[dict[str, str]],
+                        mode: ReasoningMode) -> tuple[ModelResponse, bool]:
+        """Complete a request, going through the response cache when allowed.
+
+        Returns:
+            The model response and whether it was served from the cache
+        """
+        if self.cache is None:
+            temperature = self.temperature
+        else:
+            temperature = self.cache_policy.temperature_for(mode.value, self.temperature)
+
+        if self.cache is None or not self.cache_policy.is_cacheable(mode.value, temperature):
+            response = await self.client.complete(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=self.max_tokens,
+            )
+            return response, False
+
+        key = make_cache_key(
+            self.client.provider,
+            client_model(self.client),
+            messages,
+            temperature=temperature,
+            max_tokens=self.max_tokens,
+        )
+        cache_requests = get_metrics().llm_cache_requests_total
+
+        cached = self.cache.get(key)
+        if cached is not None:
+            cache_requests.labels(mode=mode.value, result="hit").inc()
+            logger.debug(f"Response cache hit: {mode.value}")
+            return response_from_dict(cached), True
+
+        cache_requests.labels(mode=mode.value, result="miss").inc()
+        response = await self.client.complete(
+            messages=messages,
+            temperature=temperature,
+            max_tokens=self.max_tokens,
+        )
+        self.cache.set(key, response_to_dict(response), self.cache_policy.ttl_for(mode.value))
+        return response, False
+
     async def dialogue(self,
                        user_message: str,
                        context: Optional[ReasoningContext] = None) -> ReasoningResult:
@@ -235,6 +295,9 @@ Format your response as JSON:
 
     def _build_failure_analysis_prompt(self, context: ReasoningContext) -> str:
         """Build prompt for failure analysis."""
+        if context.constraints.get("batch_items"):
+            return self._build_batch_failure_analysis_prompt(context)
+
         observations_text = "\n".join(
             f"- {obs}" for obs in context.observations
         )
@@ -276,6 +339,52 @@ Format your response as JSON:
 }}
 ```"""
 
+    def _build_batch_failure_analysis_prompt(self, context: ReasoningContext) -> str:
+        """Build prompt judging several experiment runs in one call."""
+        items = context.constraints["batch_items"]
+        items_text = "\n\n".join(
+            f"### Item {i}\n" + "\n".join(f"- {obs}" for obs in observations)
+            for i, observations in enumerate(items, 1)
+        )
+
+        return f"""Judge each of these {len(items)} independent experiment runs for failures.
+
+## Items
+{items_text}
+
+## Task
+For EACH item separately, decide whether the model:
+1. Failed to follow instructions
+2. Produced incorrect or inconsistent output
+3. Showed signs of context confusion
+4. Exhibited unsafe behavior
+5. Experienced performance degradation
+
+Judge every item on its own evidence only. Format your response as JSON with one verdict per item:
+```json
+{{
+  "verdicts": [
+    {{
+      "item": 1,
+      "failure": "Brief description of the failure, or null if none",
+      "analysis": "One or two sentences of reasoning",
+      "confidence": 0.X
+    }}
+  ]
+}}
+```"""
+
+    def failure_analysis_overhead_tokens(self) -> int:
+        """Approximate tokens a single failure-analysis call spends on shared text.
+
+        Covers the system prompt and the analysis template, i.e. what a
+        batched call pays once instead of once per item.
+        """
+        template = self._build_failure_analysis_prompt(
+            ReasoningContext(mode=ReasoningMode.FAILURE_ANALYSIS)
+        )
+        return (len(self.SYSTEM_PROMPT) + len(template)) // 4
+
     def _build_root_cause_prompt(self, context: ReasoningContext) -> str:
         """Build prompt for root cause analysis."""
         observations_text = "\n".join(
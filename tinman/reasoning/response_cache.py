@@ -0,0 +1,373 @@
+"""Content-addressed response cache for LLM reasoning calls.
+
+Responses are keyed by a SHA-256 digest of the exact request (provider,
+model, messages and sampling parameters), so identical prompts issued across
+research cycles are answered without another round trip to the model.
+
+Two tiers are available:
+
+- ``MemoryResponseCache``: bounded in-process LRU
+- ``SQLiteResponseCache``: on-disk store that survives restarts
+
+``TieredResponseCache`` stacks them (memory first, disk second, promoting
+disk hits into memory).
+
+Usage:
+    cache = TieredResponseCache(
+        MemoryResponseCache(max_entries=1024),
+        SQLiteResponseCache("~/.tinman/response_cache.db"),
+    )
+    llm = LLMBackbone(model_client, temperature=0.0, cache=cache)
+"""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Optional
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+
+from ..core.metrics import get_metrics
+from ..integrations.model_client import ModelResponse
+from ..utils import get_logger
+
+logger = get_logger("response_cache")
+
+# Reasoning modes are referenced by value to avoid importing llm_backbone
+# (which imports this module).
+DEFAULT_MODE_TTLS: dict[str, Optional[float]] = {
+    "hypothesis_generation": 3600.0,
+    "failure_analysis": 86400.0,
+    "root_cause_analysis": 86400.0,
+    "intervention_design": 21600.0,
+    "insight_synthesis": 3600.0,
+    "experiment_design": 21600.0,
+    "dialogue": 0.0,  # Conversational turns are never cached
+}
+
+# Analysis modes run deterministically while caching, so a cached answer is
+# the answer; exploratory modes keep sampling and are not cached by default
+DEFAULT_MODE_TEMPERATURES: dict[str, float] = {
+    "failure_analysis": 0.0,
+    "root_cause_analysis": 0.0,
+}
+
+
+def make_cache_key(
+    provider: str,
+    model: Optional[str],
+    messages: list[dict[str, Any]],
+    temperature: float,
+    max_tokens: int,
+    **params: Any,
+) -> str:
+    """Build a content-addressed key for a completion request.
+
+    Args:
+        provider: Model provider name
+        model: Model the request is sent to
+        messages: Full message list sent to the model
+        temperature: Sampling temperature
+        max_tokens: Maximum response tokens
+        **params: Any other sampling parameters that affect the output
+
+    Returns:
+        Hex SHA-256 digest of the canonicalised request
+    """
+    payload = {
+        "provider": provider,
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "params": params,
+    }
+    canonical = json.dumps(payload, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def response_to_dict(response: ModelResponse) -> dict[str, Any]:
+    """Serialise the cacheable fields of a ModelResponse."""
+    return {
+        "content": response.content,
+        "model": response.model,
+        "prompt_tokens": response.prompt_tokens,
+        "completion_tokens": response.completion_tokens,
+        "total_tokens": response.total_tokens,
+        "tool_calls": response.tool_calls,
+        "finish_reason": response.finish_reason,
+    }
+
+
+def response_from_dict(data: dict[str, Any]) -> ModelResponse:
+    """Rebuild a ModelResponse from its cached form."""
+    return ModelResponse(
+        content=data.get("content", ""),
+        model=data.get("model", ""),
+        prompt_tokens=data.get("prompt_tokens", 0),
+        completion_tokens=data.get("completion_tokens", 0),
+        total_tokens=data.get("total_tokens", 0),
+        tool_calls=data.get("tool_calls", []),
+        finish_reason=data.get("finish_reason", ""),
+        latency_ms=0,
+    )
+
+
+@dataclass
+class CachePolicy:
+    """Decides which reasoning calls are cached and for how long.
+
+    Deterministic calls (temperature 0) are cacheable by default.
+    Sampled calls are only cached when ``cache_nondeterministic`` is set,
+    since replaying one sample would otherwise hide output variance.
+    Modes in ``mode_temperatures`` run at that temperature instead of the
+    backbone's while a cache is in use.
+    """
+    mode_ttls: dict[str, Optional[float]] = field(
+        default_factory=lambda: dict(DEFAULT_MODE_TTLS)
+    )
+    mode_temperatures: dict[str, float] = field(
+        default_factory=lambda: dict(DEFAULT_MODE_TEMPERATURES)
+    )
+    default_ttl: Optional[float] = 3600.0
+    cache_nondeterministic: bool = False
+
+    def ttl_for(self, mode: str) -> Optional[float]:
+        """TTL in seconds for a mode (None = never expires, 0 = don't cache)."""
+        return self.mode_ttls.get(mode, self.default_ttl)
+
+    def temperature_for(self, mode: str, default: float) -> float:
+        """Sampling temperature for a mode while caching."""
+        return self.mode_temperatures.get(mode, default)
+
+    def is_cacheable(self, mode: str, temperature: float) -> bool:
+        """Whether a call in this mode at this temperature may be cached."""
+        if self.ttl_for(mode) == 0:
+            return False
+        return temperature == 0 or self.cache_nondeterministic
+
+
+class ResponseCache(ABC):
+    """Abstract response cache tier."""
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    @abstractmethod
+    def tier(self) -> str:
+        """Tier name used in metrics labels."""
+        pass
+
+    @abstractmethod
+    def _get(self, key: str) -> Optional[tuple[dict[str, Any], Optional[float]]]:
+        """Return (value, seconds until expiry or None) for a live entry."""
+        pass
+
+    @abstractmethod
+    def _set(self, key: str, value: dict[str, Any], ttl: Optional[float]) -> None:
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all entries."""
+        pass
+
+    @abstractmethod
+    def __len__(self) -> int:
+        pass
+
+    def lookup(self, key: str) -> Optional[tuple[dict[str, Any], Optional[float]]]:
+        """Look up an entry with its remaining TTL, counting the hit or miss."""
+        entry = self._get(key)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def get(self, key: str) -> Optional[dict[str, Any]]:
+        """Look up a cached response, counting the hit or miss."""
+        entry = self.lookup(key)
+        return entry[0] if entry else None
+
+    def set(self, key: str, value: dict[str, Any], ttl: Optional[float] = None) -> None:
+        """Store a response for ttl seconds (None = no expiry)."""
+        self._set(key, value, ttl)
+        get_metrics().llm_cache_entries.labels(tier=self.tier).set(len(self))
+
+    def close(self) -> None:  # noqa: B027 - optional hook, most tiers hold nothing to release
+        """Release resources held by the tier."""
+
+    def get_stats(self) -> dict[str, Any]:
+        """Get hit/miss statistics for this tier."""
+        lookups = self.hits + self.misses
+        return {
+            "tier": self.tier,
+            "entries": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / lookups if lookups else 0.0,
+        }
+
+
+class MemoryResponseCache(ResponseCache):
+    """In-process LRU cache with per-entry expiry."""
+
+    def __init__(self, max_entries: int = 1024):
+        super().__init__()
+        self.max_entries = max(1, max_entries)
+        self._entries: OrderedDict[str, tuple[Optional[float], dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @property
+    def tier(self) -> str:
+        return "memory"
+
+    def _get(self, key: str) -> Optional[tuple[dict[str, Any], Optional[float]]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            remaining = None
+            if expires_at is not None:
+                remaining = expires_at - time.monotonic()
+                if remaining <= 0:
+                    del self._entries[key]
+                    return None
+            self._entries.move_to_end(key)
+            return value, remaining
+
+    def _set(self, key: str, value: dict[str, Any], ttl: Optional[float]) -> None:
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteResponseCache(ResponseCache):
+    """Persistent cache tier backed by a local SQLite file."""
+
+    def __init__(self, path: str | Path):
+        super().__init__()
+        self.path = Path(path).expanduser()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS response_cache ("
+            " key TEXT PRIMARY KEY,"
+            " value TEXT NOT NULL,"
+            " expires_at REAL"
+            ")"
+        )
+        self._conn.commit()
+
+    @property
+    def tier(self) -> str:
+        return "sqlite"
+
+    def _get(self, key: str) -> Optional[tuple[dict[str, Any], Optional[float]]]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT value, expires_at FROM response_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            value, expires_at = row
+            remaining = None
+            if expires_at is not None:
+                remaining = expires_at - time.time()
+                if remaining <= 0:
+                    self._conn.execute("DELETE FROM response_cache WHERE key = ?", (key,))
+                    self._conn.commit()
+                    return None
+        return json.loads(value), remaining
+
+    def _set(self, key: str, value: dict[str, Any], ttl: Optional[float]) -> None:
+        expires_at = time.time() + ttl if ttl is not None else None
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO response_cache (key, value, expires_at)"
+                " VALUES (?, ?, ?)",
+                (key, json.dumps(value), expires_at),
+            )
+            self._conn.commit()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._conn.execute("DELETE FROM response_cache")
+            self._conn.commit()
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM response_cache").fetchone()[0]
+
+    def close(self) -> None:
+        """Close the underlying connection."""
+        with self._lock:
+            self._conn.close()
+
+
+class TieredResponseCache(ResponseCache):
+    """Memory tier in front of an optional persistent tier."""
+
+    def __init__(self,
+                 memory: Optional[MemoryResponseCache] = None,
+                 disk: Optional[ResponseCache] = None):
+        super().__init__()
+        self.memory = memory or MemoryResponseCache()
+        self.disk = disk
+
+    @property
+    def tier(self) -> str:
+        return "tiered"
+
+    def _get(self, key: str) -> Optional[tuple[dict[str, Any], Optional[float]]]:
+        entry = self.memory.lookup(key)
+        if entry is not None or self.disk is None:
+            return entry
+        entry = self.disk.lookup(key)
+        if entry is not None:
+            # Promote with whatever lifetime the disk entry has left
+            self.memory.set(key, *entry)
+        return entry
+
+    def _set(self, key: str, value: dict[str, Any], ttl: Optional[float]) -> None:
+        self.memory.set(key, value, ttl)
+        if self.disk is not None:
+            self.disk.set(key, value, ttl)
+
+    def clear(self) -> None:
+        self.memory.clear()
+        if self.disk is not None:
+            self.disk.clear()
+
+    def __len__(self) -> int:
+        return len(self.memory)
+
+    def close(self) -> None:
+        if self.disk is not None:
+            self.disk.close()
+
+    def get_stats(self) -> dict[str, Any]:
+        stats = super().get_stats()
+        stats["memory"] = self.memory.get_stats()
+        if self.disk is not None:
+            stats["disk"] = self.disk.get_stats()
+        return stats
@@ -16,6 +16,7 @@ from .base import (
     ReportSection,
 )
 from ..memory.graph import MemoryGraph
+from ..memory.models import NodeType
 from ..core.cost_tracker import CostTracker
 from ..utils import get_logger, utc_now
 
@@ -128,43 +129,36 @@ class ExecutiveSummaryReport(ReportGenerator):
         if not self.graph:
             return
 
-        failures = self.graph.get_failures(valid_only=False)
+        # One grouped query over the period; no failure rows are loaded
+        groups = self.graph.count_between(
+            NodeType.FAILURE_MODE, start, end,
+            group_by=["severity", "primary_class", "is_resolved", "is_novel"],
+        )
 
-        # Filter by period
-        period_failures = [
-            f for f in failures
-            if start <= f.created_at <= end
-        ]
+        class_counts: dict[str, int] = {}
+        for group in groups:
+            count = group["count"]
+            data.total_failures += count
 
-        data.total_failures = len(period_failures)
+            # Count by severity
+            if group["severity"] in ("S3", "S4"):
+                data.critical_failures += count
 
-        # Count by severity
-        data.critical_failures = sum(
-            1 for f in period_failures
-            if f.data.get("severity") in ("S3", "S4")
-        )
+            # Count resolved
+            if group["is_resolved"]:
+                data.resolved_failures += count
 
-        # Count resolved
-        data.resolved_failures = sum(
-            1 for f in period_failures
-            if f.data.get("is_resolved", False)
-        )
+            # Novel findings
+            if group["is_novel"]:
+                data.novel_findings += count
+
+            # Top failure classes
+            cls = group["primary_class"] or "unknown"
+            class_counts[cls] = class_counts.get(cls, 0) + count
 
         if data.total_failures > 0:
             data.resolution_rate = data.resolved_failures / data.total_failures
 
-        # Novel findings
-        data.novel_findings = sum(
-            1 for f in period_failures
-            if f.data.get("is_novel", False)
-        )
-
-        # Top failure classes
-        class_counts: dict[str, int] = {}
-        for f in period_failures:
-            cls = f.data.get("primary_class", "unknown")
-            class_counts[cls] = class_counts.get(cls, 0) + 1
-
         data.top_failure_classes = sorted(
             class_counts.items(),
             key=lambda x: x[1],
@@ -181,24 +175,17 @@ class ExecutiveSummaryReport(ReportGenerator):
         if not self.graph:
             return
 
-        interventions = self.graph.get_interventions(valid_only=False)
-
-        # Filter by period
-        period_interventions = [
-            i for i in interventions
-            if start <= i.created_at <= end
-        ]
+        groups = self.graph.count_between(
+            NodeType.INTERVENTION, start, end,
+            group_by=["deployed", "simulation_outcome"],
+        )
 
         # Count deployed
-        data.interventions_deployed = sum(
-            1 for i in period_interventions
-            if i.data.get("deployed", False)
-        )
+        data.interventions_deployed = sum(g["count"] for g in groups if g["deployed"])
 
         # Count effective (based on simulation)
         data.interventions_effective = sum(
-            1 for i in period_interventions
-            if i.data.get("simulation_outcome") == "improved"
+            g["count"] for g in groups if g["simulation_outcome"] == "improved"
         )
 
     async def _gather_cost_data(
@@ -211,8 +198,7 @@ class ExecutiveSummaryReport(ReportGenerator):
         if not self.cost_tracker:
             return
 
-        records = self.cost_tracker.get_records(since=start)
-        data.cost_total_usd = sum(r.amount_usd for r in records)
+        data.cost_total_usd = self.cost_tracker.cost_between(start, end)
 
         if data.total_failures > 0:
             data.cost_per_finding = data.cost_total_usd / data.total_failures
@@ -235,19 +221,15 @@ class ExecutiveSummaryReport(ReportGenerator):
         prev_start = start - timedelta(days=period_days)
         prev_end = start
 
-        failures = self.graph.get_failures(valid_only=False)
-
-        # Current period count
-        current_count = sum(
-            1 for f in failures
-            if start <= f.created_at <= end
+        # Both periods in one grouped query: period 0 is previous, 1 is current
+        groups = self.graph.count_between(
+            NodeType.FAILURE_MODE, prev_start, end,
+            group_by=["is_resolved"],
+            periods=[prev_start, prev_end],
         )
 
-        # Previous period count
-        prev_count = sum(
-            1 for f in failures
-            if prev_start <= f.created_at <= prev_end
-        )
+        current_count = sum(g["count"] for g in groups if g["period"] == 1)
+        prev_count = sum(g["count"] for g in groups if g["period"] == 0)
 
         if prev_count > 0:
             data.trend_failures_week_over_week = (
@@ -256,12 +238,10 @@ class ExecutiveSummaryReport(ReportGenerator):
 
         # Similar for resolutions
         current_resolved = sum(
-            1 for f in failures
-            if start <= f.created_at <= end and f.data.get("is_resolved")
+            g["count"] for g in groups if g["period"] == 1 and g["is_resolved"]
         )
         prev_resolved = sum(
-            1 for f in failures
-            if prev_start <= f.created_at <= prev_end and f.data.get("is_resolved")
+            g["count"] for g in groups if g["period"] == 0 and g["is_resolved"]
         )
 
         if prev_resolved > 0:
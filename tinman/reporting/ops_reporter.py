@@ -115,30 +115,17 @@ class OpsReporter:
 
     def _gather_recent_activity(self, report: OpsReport, cutoff: datetime) -> None:
         """Gather recent activity from memory graph."""
-        # Recent failures
-        failures = self.graph.get_failures(valid_only=False, limit=100)
-        recent_failures = [f for f in failures if f.created_at >= cutoff]
-        report.recent_failures = len(recent_failures)
-
-        if recent_failures:
-            report.last_failure = max(f.created_at for f in recent_failures)
-
-        # Recent interventions
-        interventions = self.graph.get_interventions(valid_only=False, limit=100)
-        recent_interventions = [i for i in interventions if i.created_at >= cutoff]
-        report.recent_interventions = len(recent_interventions)
-
-        # Recent rollbacks
-        rollbacks = self.graph.repo.get_nodes_by_type(
-            NodeType.ROLLBACK, valid_only=False, limit=100
-        )
-        recent_rollbacks = [r for r in rollbacks if r.created_at >= cutoff]
-        report.recent_rollbacks = len(recent_rollbacks)
+        # One aggregate query covers every node type
+        activity = self.graph.repo.activity_since(cutoff)
+
+        failures = activity[NodeType.FAILURE_MODE.value]
+        report.recent_failures = failures["recent"]
+        if failures["recent"]:
+            report.last_failure = failures["last_created_at"]
 
-        # Last experiment
-        experiments = self.graph.get_experiments(valid_only=False, limit=1)
-        if experiments:
-            report.last_experiment = experiments[0].created_at
+        report.recent_interventions = activity[NodeType.INTERVENTION.value]["recent"]
+        report.recent_rollbacks = activity[NodeType.ROLLBACK.value]["recent"]
+        report.last_experiment = activity[NodeType.EXPERIMENT.value]["last_created_at"]
 
     def _gather_metrics(self, report: OpsReport) -> None:
         """Gather health metrics."""
@@ -254,21 +241,35 @@ class OpsReporter:
 
         # High severity failure alerts
         if self.graph:
-            severe_failures = self.graph.find_failures_by_severity("S3")
-            unresolved = [f for f in severe_failures if not f.data.get("is_resolved")]
-            if unresolved:
+            unresolved_counts = self.graph.repo.count_by_field(
+                NodeType.FAILURE_MODE, "severity", unresolved_only=True
+            )
+            unresolved_count = sum(unresolved_counts.get(s, 0) for s in ("S3", "S4"))
+            if unresolved_count:
                 alert = Alert(
                     severity=AlertSeverity.ERROR,
                     title="Unresolved High-Severity Failures",
-                    description=f"{len(unresolved)} unresolved S3+ failure(s)",
+                    description=f"{unresolved_count} unresolved S3+ failure(s)",
                     source="failure",
-                    metadata={"failure_ids": [f.id for f in unresolved[:5]]},
+                    metadata={"failure_ids": self._sample_unresolved_failures(5)},
                 )
                 alerts.append(alert)
                 self._dispatch_alert(alert)
 
         report.alerts = alerts
 
+    def _sample_unresolved_failures(self, limit: int) -> list[str]:
+        """IDs of a few unresolved S3+ failures, most severe first."""
+        ids = []
+        for severity in ("S4", "S3"):
+            failures = self.graph.search(
+                {"severity": severity}, NodeType.FAILURE_MODE, limit=limit * 4
+            )
+            for failure in failures:
+                if not failure.data.get("is_resolved"):
+                    ids.append(failure.id)
+        return ids[:limit]
+
     def _dispatch_alert(self, alert: Alert) -> None:
         """Dispatch alert to registered handlers."""
         for handler in self._alert_handlers:
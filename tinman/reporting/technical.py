@@ -16,6 +16,7 @@ from .base import (
     ReportSection,
 )
 from ..memory.graph import MemoryGraph
+from ..memory.models import EdgeRelation, NodeType
 from ..taxonomy.classifiers import FailureClassifier
 from ..utils import get_logger, utc_now
 
@@ -141,13 +142,18 @@ class TechnicalAnalysisReport(ReportGenerator):
         if not self.graph:
             return
 
-        failures = self.graph.get_failures(valid_only=False)
+        failures = self.graph.nodes_between(NodeType.FAILURE_MODE, start, end)
 
-        for failure in failures:
-            # Time filter
-            if not (start <= failure.created_at <= end):
-                continue
+        # Related runs and interventions for every failure in one query
+        edges = self.graph.repo.get_edges_from_nodes(
+            [f.id for f in failures],
+            [EdgeRelation.OBSERVED_IN, EdgeRelation.ADDRESSED_BY],
+        )
+        related: dict[str, dict[EdgeRelation, list[str]]] = {}
+        for edge in edges:
+            related.setdefault(edge.src_id, {}).setdefault(edge.relation, []).append(edge.dst_id)
 
+        for failure in failures:
             fdata = failure.data
             is_resolved = fdata.get("is_resolved", False)
 
@@ -165,16 +171,11 @@ class TechnicalAnalysisReport(ReportGenerator):
             if class_filter and primary_class not in class_filter:
                 continue
 
-            # Get related entities
-            experiment_ids = []
-            for edge in self.graph.repo.get_edges_from(failure.id):
-                if edge.relation == "discovered_by":
-                    experiment_ids.append(edge.target_id)
-
-            intervention_ids = []
-            for edge in self.graph.repo.get_edges_to(failure.id):
-                if edge.relation == "addresses":
-                    intervention_ids.append(edge.source_id)
+            # Related entities: runs the failure was observed in, and
+            # interventions addressing it
+            links = related.get(failure.id, {})
+            experiment_ids = links.get(EdgeRelation.OBSERVED_IN, [])
+            intervention_ids = links.get(EdgeRelation.ADDRESSED_BY, [])
 
             detail = FailureDetail(
                 id=failure.id,
@@ -213,12 +214,7 @@ class TechnicalAnalysisReport(ReportGenerator):
         if not self.graph:
             return
 
-        experiments = self.graph.get_experiments(valid_only=False)
-
-        period_experiments = [
-            e for e in experiments
-            if start <= e.created_at <= end
-        ]
+        period_experiments = self.graph.nodes_between(NodeType.EXPERIMENT, start, end)
 
         data.experiments_total = len(period_experiments)
         data.experiments_validated = sum(
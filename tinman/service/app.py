@@ -103,6 +103,7 @@ async def lifespan(app: FastAPI):
             mode=mode,
             db_url=db_url,
             skip_db=db_url is None,
+            settings=settings,
         )
         logger.info(f"Tinman service started in {mode.value} mode")
     except Exception as e:
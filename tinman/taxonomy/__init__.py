@@ -8,6 +8,7 @@ from .failure_types import (
     DeploymentFailure,
 )
 from .classifiers import FailureClassifier, ClassificationResult
+from .incremental import IncrementalFailureDetector, StreamVerdict
 from .causal_linker import CausalLinker, CausalLink, CauseType
 
 __all__ = [
@@ -20,6 +21,8 @@ __all__ = [
     "DeploymentFailure",
     "FailureClassifier",
     "ClassificationResult",
+    "IncrementalFailureDetector",
+    "StreamVerdict",
     "CausalLinker",
     "CausalLink",
     "CauseType",
@@ -27,16 +27,37 @@ from .agents.experiment_executor import ExperimentExecutor
 from .agents.failure_discovery import FailureDiscoveryAgent, DiscoveredFailure
 from .agents.intervention_engine import InterventionEngine
 from .agents.simulation_engine import SimulationEngine
+from .memory.async_graph import AsyncMemoryGraph
+from .memory.cache import GraphCache
 from .memory.graph import MemoryGraph
 from .reasoning.llm_backbone import LLMBackbone, ReasoningContext, ReasoningMode
+from .reasoning.response_cache import (
+    CachePolicy,
+    MemoryResponseCache,
+    SQLiteResponseCache,
+    TieredResponseCache,
+)
 from .reasoning.adaptive_memory import AdaptiveMemory
 from .reasoning.insight_synthesizer import InsightSynthesizer
 from .integrations.model_client import ModelClient
+from .integrations.metered_client import MeteredModelClient
+from .integrations.resilient_client import PROVIDER_RATE_LIMITS, RateLimits, ResilientModelClient
+from .integrations.transport import (
+    HTTPTransportManager,
+    TransportConfig,
+    set_transport_manager,
+)
 from .reporting.lab_reporter import LabReporter
 from .reporting.ops_reporter import OpsReporter
-from .db.connection import DatabaseConnection
+from .db.audit import AsyncAuditLogger
+from .db.connection import ASYNC_AVAILABLE, AsyncDatabase, DatabaseConnection
 from .core.approval_handler import ApprovalHandler, ApprovalMode, cli_approval_callback
+from .core.cost_ledger import CostLedger
+from .core.cost_tracker import BudgetConfig, BudgetPeriod, CostTracker, set_cost_tracker
+from .core.pricing import PriceTable
+from .core.sequential import BetaBinomialStopping
 from .core.event_bus import EventBus
+from .core.event_transport import EventTransport, UnixSocketTransport
 from .utils import get_logger, utc_now
 
 logger = get_logger("tinman")
@@ -59,6 +80,22 @@ class TinmanState:
     current_focus: Optional[str] = None
 
 
+# Sentinel closing a stage queue in a pipelined research cycle
+_PIPELINE_DONE = object()
+
+
+@dataclass
+class _CycleItem:
+    """A hypothesis moving through a pipelined research cycle."""
+    index: int
+    hypothesis: Hypothesis
+    experiments: list[dict[str, Any]] = field(default_factory=list)
+    experiment_results: list[Any] = field(default_factory=list)
+    failures: list[dict[str, Any]] = field(default_factory=list)
+    interventions: list[dict[str, Any]] = field(default_factory=list)
+    simulations: list[dict[str, Any]] = field(default_factory=list)
+
+
 class Tinman:
     """
     The AI Forward Deployed Researcher.
@@ -94,12 +131,31 @@ class Tinman:
         # State
         self.state = TinmanState(mode=mode)
 
+        # Shared HTTP connection pools for provider clients
+        self.transport: Optional[HTTPTransportManager] = None
+
+        # Budget accounting (built on initialize)
+        self.cost_tracker: Optional[CostTracker] = None
+
         # Database and memory
         self.db: Optional[DatabaseConnection] = None
+        self.async_db: Optional[AsyncDatabase] = None
         self.graph: Optional[MemoryGraph] = None
+        # Graph and audit log as agents and handlers await them
+        self.async_graph: Optional[AsyncMemoryGraph] = None
+        self.audit_logger: Optional[AsyncAuditLogger] = None
 
         # Event bus for cross-component communication
-        self.event_bus = EventBus()
+        events = self.settings.events
+        self.event_bus = EventBus(
+            max_history=events.max_history,
+            topic_history=events.topic_history,
+            spill_path=events.spill_path,
+            dispatch=events.dispatch,
+            queue_size=events.queue_size,
+            overflow=events.overflow,
+            transport=self._build_event_transport(),
+        )
 
         # LLM backbone (the brain)
         self.model_client = model_client
@@ -136,62 +192,126 @@ class Tinman:
         """Initialize Tinman with all components."""
         logger.info(f"Initializing Tinman in {self.state.mode.value} mode")
 
+        # Share events with other worker processes, if configured
+        await self.event_bus.connect()
+
         # Initialize database if URL provided and not skipping
         if not skip_db and (db_url or self.settings.database_url):
             url = db_url or self.settings.database_url
-            self.db = DatabaseConnection(url)
+            self.db = DatabaseConnection(url, pool_size=self.settings.database.pool_size)
             self.db.create_tables()
-            with self.db.session() as session:
-                self.graph = MemoryGraph(session)
+            # Each graph call is its own unit of work on a pooled connection,
+            # so concurrent agents don't share (or outlive) one session
+            cache = self._build_graph_cache()
+            self.graph = MemoryGraph(cache=cache, session_factory=self.db.SessionLocal)
+
+            # Agents await the graph: through the asyncio driver if enabled,
+            # otherwise on worker threads
+            self.async_db = self._build_async_db(url)
+            self.async_graph = AsyncMemoryGraph(database=self.async_db or self.db, cache=cache)
+            self.audit_logger = AsyncAuditLogger(self.async_db or self.db)
+        else:
+            self.graph = self._build_embedded_graph()
+            self.async_graph = AsyncMemoryGraph.wrap(self.graph)
+
+        # Budget accounting shared by every component that spends
+        self.cost_tracker = self._build_cost_tracker()
+        set_cost_tracker(self.cost_tracker)
+
+        # Provider clients built from here on share pooled connections
+        http = self.settings.http
+        self.transport = HTTPTransportManager(TransportConfig(
+            max_connections=http.max_connections,
+            max_keepalive_connections=http.max_keepalive_connections,
+            keepalive_expiry_seconds=http.keepalive_expiry_seconds,
+            connect_timeout_seconds=http.connect_timeout_seconds,
+            read_timeout_seconds=http.read_timeout_seconds,
+            http2=http.http2,
+        ))
+        set_transport_manager(self.transport)
+
+        # Pace and retry every model call made by the backbone and agents
+        if self.model_client and not isinstance(
+            self.model_client, (ResilientModelClient, MeteredModelClient)
+        ):
+            self.model_client = self._wrap_model_client(self.model_client)
+
+        # Record every model call's usage against the budget (outermost, so
+        # retried attempts are not charged)
+        if self.model_client and not isinstance(self.model_client, MeteredModelClient):
+            self.model_client = MeteredModelClient(self.model_client, self.cost_tracker)
 
         # Initialize LLM backbone if model client provided
         if self.model_client:
+            cache_settings = self.settings.cache
+            cache = None
+            if cache_settings.enabled:
+                cache = TieredResponseCache(
+                    memory=MemoryResponseCache(max_entries=cache_settings.max_entries),
+                    disk=SQLiteResponseCache(cache_settings.path) if cache_settings.path else None,
+                )
+            temperature = self.settings.model_temperature
+            if temperature is None:
+                temperature = 0.7
             self.llm = LLMBackbone(
                 model_client=self.model_client,
-                temperature=self.settings.model_temperature or 0.7,
+                temperature=temperature,
+                cache=cache,
+                cache_policy=CachePolicy(
+                    cache_nondeterministic=cache_settings.cache_nondeterministic,
+                ),
             )
 
         # Initialize agents - all with LLM backbone and approval handler
         self.hypothesis_engine = HypothesisEngine(
-            graph=self.graph,
+            graph=self.async_graph,
             llm_backbone=self.llm,
             adaptive_memory=self.adaptive_memory,
             event_bus=self.event_bus,
         )
 
         self.experiment_architect = ExperimentArchitect(
-            graph=self.graph,
+            graph=self.async_graph,
             llm_backbone=self.llm,
             event_bus=self.event_bus,
         )
 
         self.experiment_executor = ExperimentExecutor(
-            graph=self.graph,
+            graph=self.async_graph,
             model_client=self.model_client,
             llm_backbone=self.llm,
             approval_handler=self.approval_handler,  # HITL integration
+            max_parallel=self.settings.experiments.max_parallel,
+            max_parallel_per_experiment=self.settings.experiments.max_parallel_per_experiment,
+            judge_batch_size=self.settings.experiments.judge_batch_size,
+            judge_batch_window_ms=self.settings.experiments.judge_batch_window_ms,
+            streaming_probes=self.settings.experiments.streaming_probes,
+            cost_tracker=self.cost_tracker,
+            stopping=self._build_stopping(),
+            validation_threshold=self.settings.experiments.validation_threshold,
             event_bus=self.event_bus,
         )
 
         self.failure_discovery = FailureDiscoveryAgent(
-            graph=self.graph,
+            graph=self.async_graph,
             llm_backbone=self.llm,
             adaptive_memory=self.adaptive_memory,
             event_bus=self.event_bus,
         )
 
         self.intervention_engine = InterventionEngine(
-            graph=self.graph,
+            graph=self.async_graph,
             llm_backbone=self.llm,
             approval_handler=self.approval_handler,  # HITL integration
             event_bus=self.event_bus,
         )
 
         self.simulation_engine = SimulationEngine(
-            graph=self.graph,
+            graph=self.async_graph,
             model_client=self.model_client,
             llm_backbone=self.llm,
             approval_handler=self.approval_handler,  # HITL integration
+            cost_tracker=self.cost_tracker,
             event_bus=self.event_bus,
         )
 
@@ -242,7 +362,10 @@ class Tinman:
                               focus: Optional[str] = None,
                               max_hypotheses: int = 5,
                               max_experiments: int = 3,
-                              runs_per_experiment: int = 5) -> dict[str, Any]:
+                              runs_per_experiment: int = 5,
+                              pipelined: bool = False,
+                              pipeline_queue_size: int = 2,
+                              pipeline_workers: int = 2) -> dict[str, Any]:
         """
         Run a complete research cycle.
 
@@ -254,6 +377,12 @@ class Tinman:
         5. Propose interventions
         6. Simulate interventions
 
+        By default each step waits for the previous one to finish for every
+        hypothesis. With pipelined=True, each hypothesis flows through steps
+        2-6 on its own as soon as it is ready, with bounded queues
+        (pipeline_queue_size) between stages and pipeline_workers workers
+        per stage.
+
         Returns a summary of findings.
         """
         self.state.current_focus = focus
@@ -277,24 +406,22 @@ class Tinman:
             self.state.hypotheses_generated += len(hypotheses_data)
 
             # Convert to Hypothesis objects for next step
-            from .taxonomy.failure_types import FailureClass
-            hypotheses = [
-                Hypothesis(
-                    id=h["id"],
-                    target_surface=h["target_surface"],
-                    expected_failure=h["expected_failure"],
-                    failure_class=FailureClass(h["failure_class"]),
-                    confidence=h["confidence"],
-                    priority=h["priority"],
-                    rationale=h.get("rationale", ""),
-                    suggested_experiment=h.get("suggested_experiment", ""),
-                )
-                for h in hypotheses_data
-            ]
+            hypotheses = self._to_hypotheses(hypotheses_data)
         else:
             logger.warning(f"Hypothesis generation failed: {h_result.error}")
             return results
 
+        if pipelined:
+            return await self._pipelined_cycle(
+                context,
+                hypotheses,
+                results,
+                max_experiments=max_experiments,
+                runs_per_experiment=runs_per_experiment,
+                queue_size=pipeline_queue_size,
+                workers=pipeline_workers,
+            )
+
         # 2. Design experiments
         logger.info("Designing experiments...")
         arch_result = await self.experiment_architect.run(context, hypotheses=hypotheses)
@@ -304,18 +431,7 @@ class Tinman:
             results["experiments"] = experiments_data
 
             # Convert to ExperimentDesign objects
-            experiments = [
-                ExperimentDesign(
-                    id=e["id"],
-                    hypothesis_id=e["hypothesis_id"],
-                    name=e["name"],
-                    stress_type=e["stress_type"],
-                    mode=e["mode"],
-                    parameters=e["parameters"],
-                    estimated_runs=runs_per_experiment,
-                )
-                for e in experiments_data
-            ]
+            experiments = self._to_experiment_designs(experiments_data, runs_per_experiment)
         else:
             logger.warning(f"Experiment design failed: {arch_result.error}")
             return results
@@ -328,18 +444,7 @@ class Tinman:
             self.state.experiments_run += exec_result.data.get("total_runs", 0)
 
             # Get experiment results for failure discovery
-            from .agents.experiment_executor import ExperimentResult
-            experiment_results = []
-            for r in exec_result.data.get("results", []):
-                exp_result = ExperimentResult(
-                    experiment_id=r["experiment_id"],
-                    hypothesis_id=r["hypothesis_id"],
-                    total_runs=r["total_runs"],
-                    failures_triggered=r["failures_triggered"],
-                    reproduction_rate=r["reproduction_rate"],
-                    hypothesis_validated=r["hypothesis_validated"],
-                )
-                experiment_results.append(exp_result)
+            experiment_results = self._to_experiment_results(exec_result.data.get("results", []))
         else:
             logger.warning(f"Experiment execution failed: {exec_result.error}")
             return results
@@ -356,33 +461,12 @@ class Tinman:
 
                 # Record outcomes to adaptive memory
                 for h in hypotheses:
-                    validated = any(
-                        r.hypothesis_validated and r.hypothesis_id == h.id
-                        for r in experiment_results
-                    )
-                    self.adaptive_memory.record_hypothesis_outcome(
-                        h.failure_class.value,
-                        h.target_surface,
-                        validated,
-                        h.confidence,
-                    )
+                    self._record_hypothesis_outcome(h, experiment_results)
 
                 # 5. Propose interventions
                 if failures_data:
                     logger.info("Proposing interventions...")
-                    from .agents.failure_discovery import DiscoveredFailure
-                    from .taxonomy.failure_types import FailureClass, Severity
-
-                    failures = [
-                        DiscoveredFailure(
-                            id=f["id"],
-                            primary_class=FailureClass(f["primary_class"]),
-                            severity=Severity[f["severity"]],
-                            description=f["description"],
-                            reproducibility=f["reproducibility"],
-                        )
-                        for f in failures_data
-                    ]
+                    failures = self._to_failures(failures_data)
 
                     int_result = await self.intervention_engine.run(context, failures=failures)
 
@@ -394,19 +478,7 @@ class Tinman:
                         # 6. Simulate interventions
                         if interventions_data and self.state.mode == OperatingMode.LAB:
                             logger.info("Simulating interventions...")
-                            from .agents.intervention_engine import Intervention, InterventionType
-                            from .core.risk_evaluator import RiskTier
-
-                            interventions = [
-                                Intervention(
-                                    id=i["id"],
-                                    failure_id=i["failure_id"],
-                                    intervention_type=InterventionType(i["type"]),
-                                    name=i["name"],
-                                    risk_tier=RiskTier(i["risk_tier"]),
-                                )
-                                for i in interventions_data
-                            ]
+                            interventions = self._to_interventions(interventions_data)
 
                             sim_result = await self.simulation_engine.run(
                                 context, interventions=interventions
@@ -419,6 +491,267 @@ class Tinman:
 
         return results
 
+    async def _pipelined_cycle(self,
+                               context: AgentContext,
+                               hypotheses: list[Hypothesis],
+                               results: dict[str, Any],
+                               max_experiments: int,
+                               runs_per_experiment: int,
+                               queue_size: int,
+                               workers: int) -> dict[str, Any]:
+        """
+        Run steps 2-6 of a research cycle as a per-hypothesis pipeline.
+
+        Each stage takes a _CycleItem, fills in its output and passes it on,
+        or returns None to drop it (e.g. no failures were triggered). The
+        experiment cap is applied in the order designs complete, and
+        failures are merged per hypothesis rather than across the cycle.
+        Results are reassembled in hypothesis order.
+        """
+        experiment_budget = [max_experiments]
+        first_failure_at: list[Any] = []
+        started_at = utc_now()
+
+        async def design(item: _CycleItem) -> Optional[_CycleItem]:
+            arch_result = await self.experiment_architect.run(
+                context, hypotheses=[item.hypothesis]
+            )
+            if not arch_result.success:
+                logger.warning(f"Experiment design failed: {arch_result.error}")
+                return None
+
+            # Claim from the shared budget without awaiting in between
+            experiments_data = arch_result.data.get("experiments", [])[:experiment_budget[0]]
+            experiment_budget[0] -= len(experiments_data)
+            if not experiments_data:
+                return None
+
+            item.experiments = experiments_data
+            return item
+
+        async def execute(item: _CycleItem) -> Optional[_CycleItem]:
+            experiments = self._to_experiment_designs(item.experiments, runs_per_experiment)
+            exec_result = await self.experiment_executor.run(context, experiments=experiments)
+            if not exec_result.success:
+                logger.warning(f"Experiment execution failed: {exec_result.error}")
+                return None
+
+            self.state.experiments_run += exec_result.data.get("total_runs", 0)
+            item.experiment_results = self._to_experiment_results(
+                exec_result.data.get("results", [])
+            )
+            self._record_hypothesis_outcome(item.hypothesis, item.experiment_results)
+
+            if not any(r.failures_triggered > 0 for r in item.experiment_results):
+                return None
+            return item
+
+        async def discover(item: _CycleItem) -> Optional[_CycleItem]:
+            disc_result = await self.failure_discovery.run(
+                context, results=item.experiment_results
+            )
+            if not disc_result.success:
+                return None
+
+            item.failures = disc_result.data.get("failures", [])
+            self.state.failures_discovered += len(item.failures)
+            if not item.failures:
+                return None
+
+            if not first_failure_at:
+                first_failure_at.append(utc_now())
+                elapsed = (first_failure_at[0] - started_at).total_seconds()
+                logger.info(f"First failure discovered after {elapsed:.1f}s")
+            return item
+
+        async def intervene(item: _CycleItem) -> Optional[_CycleItem]:
+            int_result = await self.intervention_engine.run(
+                context, failures=self._to_failures(item.failures)
+            )
+            if not int_result.success:
+                return None
+
+            item.interventions = int_result.data.get("interventions", [])
+            self.state.interventions_proposed += len(item.interventions)
+            if not item.interventions or self.state.mode != OperatingMode.LAB:
+                return None
+            return item
+
+        async def simulate(item: _CycleItem) -> Optional[_CycleItem]:
+            sim_result = await self.simulation_engine.run(
+                context, interventions=self._to_interventions(item.interventions)
+            )
+            if sim_result.success:
+                item.simulations = sim_result.data.get("results", [])
+            return item
+
+        items = [_CycleItem(index=i, hypothesis=h) for i, h in enumerate(hypotheses)]
+
+        logger.info(f"Running pipelined cycle over {len(items)} hypotheses...")
+        await self._run_pipeline(
+            items,
+            stages=[design, execute, discover, intervene, simulate],
+            queue_size=queue_size,
+            workers=workers,
+        )
+
+        for item in items:
+            results["experiments"].extend(item.experiments)
+            results["failures"].extend(item.failures)
+            results["interventions"].extend(item.interventions)
+            results["simulations"].extend(item.simulations)
+
+        logger.info(f"Research cycle complete: {len(results['failures'])} failures discovered")
+
+        return results
+
+    async def _run_pipeline(self,
+                            items: list["_CycleItem"],
+                            stages: list[Any],
+                            queue_size: int,
+                            workers: int) -> None:
+        """
+        Push items through async stages connected by bounded queues.
+
+        A full downstream queue blocks the upstream stage (back-pressure).
+        Errors in a stage are logged and drop only the affected item.
+        """
+        queues: list[asyncio.Queue] = [
+            asyncio.Queue(maxsize=max(1, queue_size)) for _ in stages
+        ]
+        workers = max(1, workers)
+        remaining = [workers] * len(stages)
+
+        async def stage_worker(index: int) -> None:
+            inbox = queues[index]
+            outbox = queues[index + 1] if index + 1 < len(queues) else None
+            stage = stages[index]
+
+            while True:
+                item = await inbox.get()
+                if item is _PIPELINE_DONE:
+                    # Let sibling workers see the sentinel; the last one out
+                    # closes the next stage
+                    await inbox.put(_PIPELINE_DONE)
+                    remaining[index] -= 1
+                    if remaining[index] == 0 and outbox is not None:
+                        await outbox.put(_PIPELINE_DONE)
+                    return
+
+                try:
+                    output = await stage(item)
+                except Exception as e:
+                    logger.error(f"Pipeline stage {stage.__name__} failed: {e}")
+                    continue
+
+                if output is not None and outbox is not None:
+                    await outbox.put(output)
+
+        async def feed() -> None:
+            for item in items:
+                await queues[0].put(item)
+            await queues[0].put(_PIPELINE_DONE)
+
+        await asyncio.gather(
+            feed(),
+            *[
+                stage_worker(index)
+                for index in range(len(stages))
+                for _ in range(workers)
+            ],
+        )
+
+    def _to_hypotheses(self, hypotheses_data: list[dict]) -> list[Hypothesis]:
+        """Convert hypothesis dicts from the engine into Hypothesis objects."""
+        from .taxonomy.failure_types import FailureClass
+        return [
+            Hypothesis(
+                id=h["id"],
+                target_surface=h["target_surface"],
+                expected_failure=h["expected_failure"],
+                failure_class=FailureClass(h["failure_class"]),
+                confidence=h["confidence"],
+                priority=h["priority"],
+                rationale=h.get("rationale", ""),
+                suggested_experiment=h.get("suggested_experiment", ""),
+            )
+            for h in hypotheses_data
+        ]
+
+    def _to_experiment_designs(self,
+                               experiments_data: list[dict],
+                               runs_per_experiment: int) -> list[ExperimentDesign]:
+        """Convert experiment dicts from the architect into ExperimentDesign objects."""
+        return [
+            ExperimentDesign(
+                id=e["id"],
+                hypothesis_id=e["hypothesis_id"],
+                name=e["name"],
+                stress_type=e["stress_type"],
+                mode=e["mode"],
+                parameters=e["parameters"],
+                estimated_runs=runs_per_experiment,
+            )
+            for e in experiments_data
+        ]
+
+    def _to_experiment_results(self, results_data: list[dict]) -> list:
+        """Convert executor result dicts into ExperimentResult objects."""
+        from .agents.experiment_executor import ExperimentResult
+        return [
+            ExperimentResult(
+                experiment_id=r["experiment_id"],
+                hypothesis_id=r["hypothesis_id"],
+                total_runs=r["total_runs"],
+                failures_triggered=r["failures_triggered"],
+                reproduction_rate=r["reproduction_rate"],
+                hypothesis_validated=r["hypothesis_validated"],
+            )
+            for r in results_data
+        ]
+
+    def _to_failures(self, failures_data: list[dict]) -> list[DiscoveredFailure]:
+        """Convert discovery dicts into DiscoveredFailure objects."""
+        from .taxonomy.failure_types import FailureClass, Severity
+        return [
+            DiscoveredFailure(
+                id=f["id"],
+                primary_class=FailureClass(f["primary_class"]),
+                severity=Severity[f["severity"]],
+                description=f["description"],
+                reproducibility=f["reproducibility"],
+            )
+            for f in failures_data
+        ]
+
+    def _to_interventions(self, interventions_data: list[dict]) -> list:
+        """Convert intervention dicts into Intervention objects."""
+        from .agents.intervention_engine import Intervention, InterventionType
+        from .core.risk_evaluator import RiskTier
+        return [
+            Intervention(
+                id=i["id"],
+                failure_id=i["failure_id"],
+                intervention_type=InterventionType(i["type"]),
+                name=i["name"],
+                risk_tier=RiskTier(i["risk_tier"]),
+            )
+            for i in interventions_data
+        ]
+
+    def _record_hypothesis_outcome(self, hypothesis: Hypothesis, experiment_results: list) -> None:
+        """Record whether a hypothesis was validated to adaptive memory."""
+        validated = any(
+            r.hypothesis_validated and r.hypothesis_id == hypothesis.id
+            for r in experiment_results
+        )
+        self.adaptive_memory.record_hypothesis_outcome(
+            hypothesis.failure_class.value,
+            hypothesis.target_surface,
+            validated,
+            hypothesis.confidence,
+        )
+
     async def discuss(self, message: str) -> str:
         """
         Have a conversation with Tinman about research findings.
@@ -522,15 +855,126 @@ class Tinman:
             "has_graph": self.graph is not None,
         }
 
+    def _build_graph_cache(self) -> Optional[GraphCache]:
+        """Read-through cache for the memory graph, if enabled."""
+        db = self.settings.database
+        if db.graph_cache_nodes <= 0:
+            return None
+        return GraphCache(
+            max_nodes=db.graph_cache_nodes,
+            max_queries=db.graph_cache_queries,
+            ttl_seconds=db.graph_cache_ttl_seconds,
+        )
+
+    def _build_async_db(self, url: str) -> Optional[AsyncDatabase]:
+        """Asyncio engine for agent database I/O, if enabled and usable."""
+        db = self.settings.database
+        if not db.async_engine:
+            return None
+        if not ASYNC_AVAILABLE:
+            logger.warning("async_engine needs tinman[async]; agents will use worker threads")
+            return None
+        if url.split("://", 1)[1] in ("", "/:memory:"):
+            # A second engine would open a second, empty in-memory database
+            logger.warning("async_engine is not supported for in-memory SQLite")
+            return None
+        return AsyncDatabase(url, pool_size=db.pool_size)
+
+    def _build_cost_tracker(self) -> CostTracker:
+        """Cost tracker, replaying the persistent ledger if configured."""
+        cost = self.settings.cost
+        return CostTracker(
+            budget_config=BudgetConfig(
+                limit_usd=cost.budget_usd,
+                period=BudgetPeriod(cost.period),
+                warn_threshold=cost.warn_threshold,
+                hard_limit=cost.hard_limit,
+            ),
+            ledger=CostLedger(cost.ledger_path) if cost.ledger_path else None,
+            prices=PriceTable(cost.prices),
+        )
+
+    def _build_stopping(self) -> Optional[BetaBinomialStopping]:
+        """Sequential stopping rule for experiments, if enabled."""
+        exp = self.settings.experiments
+        if exp.stopping == "sequential":
+            return BetaBinomialStopping(
+                threshold=exp.validation_threshold,
+                confidence=exp.sequential_confidence,
+                min_runs=exp.sequential_min_runs,
+                max_runs=exp.sequential_max_runs,
+            )
+        if exp.stopping != "fixed":
+            logger.warning(f"Unknown experiment stopping '{exp.stopping}', using fixed run counts")
+        return None
+
+    def _build_event_transport(self) -> Optional[EventTransport]:
+        """Cross-process event transport, if enabled."""
+        events = self.settings.events
+        if events.transport == "unix":
+            return UnixSocketTransport(
+                events.transport_dir,
+                batch_size=events.transport_batch_size,
+                batch_window_ms=events.transport_batch_window_ms,
+            )
+        if events.transport != "none":
+            logger.warning(f"Unknown event transport '{events.transport}', events stay in-process")
+        return None
+
+    def _build_embedded_graph(self) -> Optional[MemoryGraph]:
+        """Memory graph used when no database is configured, if enabled."""
+        db = self.settings.database
+        if db.embedded_graph == "memory":
+            return MemoryGraph.in_memory()
+        if db.embedded_graph == "sqlite":
+            return MemoryGraph.sqlite(db.embedded_graph_path, cache=self._build_graph_cache())
+        if db.embedded_graph != "none":
+            logger.warning(f"Unknown embedded_graph '{db.embedded_graph}', running without a graph")
+        return None
+
+    def _wrap_model_client(self, client: ModelClient) -> ResilientModelClient:
+        """Wrap a provider client with retries and configured rate limits."""
+        provider_settings = self.settings.models.providers.get(client.provider)
+        rate_limits = None
+        if provider_settings:
+            # Configured limits override the provider's defaults field by field
+            defaults = PROVIDER_RATE_LIMITS.get(client.provider, RateLimits())
+            rpm = provider_settings.requests_per_minute
+            tpm = provider_settings.tokens_per_minute
+            rate_limits = RateLimits(
+                requests_per_minute=rpm if rpm is not None else defaults.requests_per_minute,
+                tokens_per_minute=tpm if tpm is not None else defaults.tokens_per_minute,
+            )
+        return ResilientModelClient(
+            client,
+            max_retries=self.settings.models.max_retries,
+            rate_limits=rate_limits,
+        )
+
     def reset_conversation(self) -> None:
         """Reset conversation history."""
         self._conversation_history = []
 
     async def close(self) -> None:
         """Clean up resources."""
+        # Let queued handlers drain while the resources they use are still open
+        flush_timeout = self.settings.events.flush_timeout_seconds
+        await self.event_bus.flush(timeout=flush_timeout)
+        await self.event_bus.disconnect(timeout=flush_timeout)
+        self.event_bus.close()
+
+        if self.async_db:
+            await self.async_db.disconnect()
         if self.db:
             self.db.disconnect()
 
+        if self.transport:
+            await self.transport.close()
+        if self.cost_tracker:
+            self.cost_tracker.close()
+        if self.llm and self.llm.cache is not None:
+            self.llm.cache.close()
+
         # Save adaptive memory state
         memory_state = self.adaptive_memory.export()
         logger.info(f"Closing Tinman. Learned {len(memory_state['patterns'])} patterns.")
@@ -542,6 +986,7 @@ async def create_tinman(
     model_client: Optional[ModelClient] = None,
     db_url: Optional[str] = None,
     skip_db: bool = False,
+    settings: Optional[Settings] = None,
 ) -> Tinman:
     """
     Create and initialize a Tinman instance.
@@ -551,11 +996,12 @@ async def create_tinman(
         model_client: LLM client for reasoning
         db_url: PostgreSQL connection URL (None to skip database)
         skip_db: If True, don't connect to database even if URL in settings
+        settings: Configuration (defaults if not provided)
 
     Returns:
         Initialized Tinman instance
     """
-    tinman = Tinman(model_client=model_client, mode=mode)
+    tinman = Tinman(model_client=model_client, mode=mode, settings=settings)
     actual_url = None if skip_db else db_url
     await tinman.initialize(db_url=actual_url, skip_db=skip_db)
     return tinman